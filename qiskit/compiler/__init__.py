@@ -21,7 +21,30 @@ Circuit Compilation Functions
 =======================================
 
 .. autofunction:: transpile
+.. autofunction:: transpile_incremental
+
+Transpilation Cache
+===================
+
+.. autoclass:: TranspileCache
+   :members:
+
+.. autoclass:: TranspileCacheStatistics
+   :members:
+
+The preset pass managers that :func:`transpile` builds are also reused between calls with the same
+options and target.  These functions control that reuse:
+
+.. autofunction:: clear_pass_manager_cache
+.. autofunction:: set_pass_manager_cache_size
 
 """
 
+from .transpile_cache import (
+    TranspileCache,
+    TranspileCacheStatistics,
+    clear_pass_manager_cache,
+    set_pass_manager_cache_size,
+)
 from .transpiler import transpile
+from .incremental import transpile_incremental
@@ -0,0 +1,168 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Transpile a circuit one segment at a time."""
+
+from __future__ import annotations
+
+from qiskit.circuit.quantumcircuit import QuantumCircuit
+from qiskit.compiler.transpiler import transpile
+from qiskit.providers.backend import Backend
+from qiskit.transpiler.exceptions import TranspilerError
+from qiskit.transpiler.layout import Layout, TranspileLayout
+from qiskit.transpiler.target import Target
+
+
+def transpile_incremental(
+    transpiled: QuantumCircuit,
+    segment: QuantumCircuit,
+    backend: Backend | None = None,
+    *,
+    target: Target | None = None,
+    layout: TranspileLayout | None = None,
+    routing_method: str | None = None,
+    translation_method: str | None = None,
+    approximation_degree: float | None = 1.0,
+    seed_transpiler: int | None = None,
+    optimization_level: int | None = None,
+    unitary_synthesis_method: str = "default",
+) -> QuantumCircuit:
+    """Append a logical circuit segment to a circuit that was already transpiled.
+
+    Only ``segment`` is transpiled: it is laid out on the physical qubits where the qubits of the
+    original circuit are at the end of ``transpiled``, then routed and optimized for the target,
+    and the result is appended to a copy of ``transpiled``.  The cost of each call is therefore
+    proportional to the size of the segment rather than to the size of the whole circuit, which
+    suits workflows that grow a circuit step by step, such as adaptive or variational algorithms.
+
+    The returned circuit keeps the initial layout of ``transpiled``, and its
+    :attr:`.TranspileLayout.final_layout` is the composition of the routing permutations of
+    ``transpiled`` and of the segment, so the output can itself be extended by another call.
+
+    Example:
+
+        .. code-block:: python
+
+            from qiskit import QuantumCircuit, transpile
+            from qiskit.compiler import transpile_incremental
+            from qiskit.providers.fake_provider import GenericBackendV2
+
+            backend = GenericBackendV2(5)
+            step = QuantumCircuit(5)
+            step.h(0)
+            step.cx(0, range(1, 5))
+
+            isa = transpile(step, backend, seed_transpiler=42)
+            for _ in range(10):
+                isa = transpile_incremental(isa, step, backend, seed_transpiler=42)
+
+    .. note::
+
+        The segments are optimized independently, so gates that could cancel across the
+        boundary between two segments are kept.  The segment's layout is fixed, so layout
+        selection and post-layout passes such as :class:`.VF2PostLayout` are not run on it.
+
+    Args:
+        transpiled: A circuit output by the transpiler for ``backend`` or ``target``.
+        segment: The logical circuit to append.  Its qubits are identified by index with the
+            qubits of the circuit that was transpiled into ``transpiled``, and its clbits with the
+            clbits of ``transpiled``.
+        backend: The backend to transpile ``segment`` for.
+        target: The target to transpile ``segment`` for.  Takes priority over ``backend``.
+        layout: The layout of ``transpiled``.  If ``None``, :attr:`.QuantumCircuit.layout` of
+            ``transpiled`` is used, and if that is ``None`` too, the qubits of ``transpiled`` are
+            assumed to be the qubits of the original circuit in order.
+        routing_method: The routing method, see :func:`.transpile`.
+        translation_method: The translation method, see :func:`.transpile`.
+        approximation_degree: The approximation degree, see :func:`.transpile`.
+        seed_transpiler: The seed of the stochastic parts of the transpiler.
+        optimization_level: The optimization level of the segment, see :func:`.transpile`.
+        unitary_synthesis_method: The unitary synthesis method, see :func:`.transpile`.
+
+    Returns:
+        A new circuit that is ``transpiled`` followed by the transpiled ``segment``.
+
+    Raises:
+        TranspilerError: If ``segment`` does not have the same number of qubits as the original
+            circuit, or has more clbits than ``transpiled``.
+    """
+    if layout is None:
+        layout = transpiled.layout
+    if layout is None:
+        positions = list(range(transpiled.num_qubits))
+    else:
+        positions = layout.final_index_layout()
+    if segment.num_qubits != len(positions):
+        raise TranspilerError(
+            f"The segment has {segment.num_qubits} qubits, but the transpiled circuit was "
+            f"transpiled from a circuit with {len(positions)} qubits."
+        )
+    if segment.num_clbits > transpiled.num_clbits:
+        raise TranspilerError(
+            f"The segment has {segment.num_clbits} clbits, but the transpiled circuit has only "
+            f"{transpiled.num_clbits}."
+        )
+    out_segment = transpile(
+        segment,
+        backend,
+        initial_layout=positions,
+        routing_method=routing_method,
+        translation_method=translation_method,
+        approximation_degree=approximation_degree,
+        seed_transpiler=seed_transpiler,
+        optimization_level=optimization_level,
+        unitary_synthesis_method=unitary_synthesis_method,
+        target=target,
+    )
+    if out_segment.num_qubits != transpiled.num_qubits:
+        raise TranspilerError(
+            f"The transpiled segment has {out_segment.num_qubits} qubits, but the transpiled "
+            f"circuit has {transpiled.num_qubits}. Was it transpiled for a different target?"
+        )
+
+    out = transpiled.copy()
+    out.compose(
+        out_segment,
+        qubits=range(out_segment.num_qubits),
+        clbits=range(out_segment.num_clbits),
+        inplace=True,
+    )
+    if layout is None and out_segment.layout is None:
+        return out
+    if out_segment.layout is None:
+        segment_permutation = list(range(out.num_qubits))
+    else:
+        segment_permutation = out_segment.layout.routing_permutation()
+    if layout is None:
+        # The original circuit was not laid out, so its qubits are the output qubits in order.
+        initial_layout = Layout.from_qubit_list(out.qubits)
+        input_qubit_mapping = {bit: index for index, bit in enumerate(out.qubits)}
+        input_qubit_count = out.num_qubits
+        prior_permutation = list(range(out.num_qubits))
+    else:
+        initial_layout = layout.initial_layout
+        input_qubit_mapping = layout.input_qubit_mapping
+        input_qubit_count = layout._input_qubit_count
+        prior_permutation = layout.routing_permutation()
+    # A qubit that ends the original circuit at `prior_permutation[i]` is moved on from there by
+    # the routing of the segment.
+    final_layout = Layout(
+        {bit: segment_permutation[prior_permutation[index]] for index, bit in enumerate(out.qubits)}
+    )
+    out._layout = TranspileLayout(
+        initial_layout=initial_layout,
+        input_qubit_mapping=input_qubit_mapping,
+        final_layout=final_layout,
+        _input_qubit_count=input_qubit_count,
+        _output_qubit_list=out.qubits,
+    )
+    return out
@@ -0,0 +1,585 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""A content-addressed cache of transpiled circuits."""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import hashlib
+import inspect
+import io
+import logging
+import os
+import threading
+import uuid
+
+import qiskit
+from qiskit import qpy
+from qiskit.circuit import Parameter, ParameterExpression, QuantumCircuit
+from qiskit.transpiler.target import Target
+
+logger = logging.getLogger(__name__)
+
+_POLICIES = ("lru", "lfu", "fifo")
+
+
+@dataclasses.dataclass(frozen=True)
+class TranspileCacheStatistics:
+    """A snapshot of the statistics of a :class:`.TranspileCache`."""
+
+    hits: int
+    """The number of circuits that were served from the cache."""
+    misses: int
+    """The number of circuits that were transpiled and then stored in the cache."""
+    disk_hits: int
+    """The number of :attr:`hits` that were served from the on-disk store."""
+    evictions: int
+    """The number of entries evicted from the in-memory and on-disk stores."""
+    bypassed: int
+    """The number of circuits transpiled without the cache, because the options were not
+    cacheable."""
+    size: int
+    """The number of entries currently in the in-memory store."""
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that were hits."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclasses.dataclass
+class _CacheLookup:
+    """The lookup of a circuit in a :class:`.TranspileCache` by :func:`.transpile`."""
+
+    key: str
+    canonical: QuantumCircuit
+    parameters: list
+    values: list
+    output: QuantumCircuit | None
+
+
+class TranspileCache:
+    """A content-addressed cache of transpiled circuits for :func:`.transpile`.
+
+    Pass an instance as the ``cache`` argument of :func:`.transpile` to reuse the output of
+    earlier calls.  Each circuit is looked up by a key made of:
+
+    * a structural hash of the circuit, in which the :class:`.Parameter` objects and the bound
+      numerical parameters of standard gates are replaced by canonical placeholders in order of
+      first use, and the name and metadata are ignored;
+    * a fingerprint of the :class:`.Target` (or of the ``backend``'s target), which covers the
+      supported instructions, their qubits, durations and errors, and the qubit properties;
+    * the remaining :func:`.transpile` options, and the Qiskit version.
+
+    On a miss, the canonical, parametrized form of the circuit is transpiled and stored.  On a
+    hit, or after a miss, the stored circuit is returned with its placeholders replaced by the
+    caller's own parameters and bound values, and with the caller's name, metadata and qubits.
+    Circuits that differ only in their parameters or in the values bound to the parameters of
+    their standard gates therefore share an entry.  Since the transpiler does not see the bound
+    values, the output can be less optimized than that of transpiling the bound circuit without
+    a cache; for example, a rotation bound to an angle of zero is not removed.  If the target
+    has an instruction with fixed parameters, such as an ``rz`` gate that only supports one angle,
+    or has angle bounds, the bound values are kept in the key instead, since the parametrized form
+    may not be translatable to the target, and angle bounds are only enforced on bound values.
+
+    Entries are held in memory, up to ``max_size`` of them, and are evicted according to
+    ``policy``:
+
+    * ``"lru"``: evict the least recently used entry;
+    * ``"lfu"``: evict the least frequently used entry, oldest first among ties;
+    * ``"fifo"``: evict the oldest entry.
+
+    If ``directory`` is given, entries are also written there as QPY files, so they persist
+    between processes.  The on-disk store is bounded by ``max_disk_size`` entries, and evicts the
+    least recently used ones.
+
+    Calls with a ``callback``, an ``hls_config``, a ``time_budget``, or an ``initial_layout`` that
+    is not a list of integers are not cached, and are counted in
+    :attr:`.TranspileCacheStatistics.bypassed`.
+    When ``seed_transpiler`` is not set, a hit returns the output of an earlier run, which is a
+    valid output of the transpiler but not necessarily the one a fresh run would produce.
+
+    Example:
+
+        .. code-block:: python
+
+            from qiskit import transpile
+            from qiskit.circuit.library import efficient_su2
+            from qiskit.compiler import TranspileCache
+            from qiskit.providers.fake_provider import GenericBackendV2
+
+            backend = GenericBackendV2(5)
+            cache = TranspileCache(max_size=32)
+            circuit = efficient_su2(5)
+            for _ in range(3):
+                isa = transpile(circuit, backend, seed_transpiler=1, cache=cache)
+            print(cache.statistics())
+    """
+
+    def __init__(
+        self,
+        max_size: int | None = 128,
+        policy: str = "lru",
+        *,
+        directory: str | os.PathLike | None = None,
+        max_disk_size: int | None = None,
+    ):
+        """
+        Args:
+            max_size: The maximum number of entries in the in-memory store.  If ``None``, the store
+                is unbounded.
+            policy: The eviction policy of the in-memory store, one of ``"lru"``, ``"lfu"`` and
+                ``"fifo"``.
+            directory: A directory to persist entries in.  It is created if it does not exist.
+            max_disk_size: The maximum number of entries in ``directory``.  If ``None``, the
+                on-disk store is unbounded.
+
+        Raises:
+            ValueError: If ``policy`` is unknown, or a size is not positive.
+        """
+        if policy not in _POLICIES:
+            raise ValueError(f"Unknown eviction policy '{policy}', expected one of {_POLICIES}")
+        if max_size is not None and max_size < 1:
+            raise ValueError(f"max_size must be positive, not {max_size}")
+        if max_disk_size is not None and max_disk_size < 1:
+            raise ValueError(f"max_disk_size must be positive, not {max_disk_size}")
+        self._max_size = max_size
+        self._policy = policy
+        self._directory = None if directory is None else os.fspath(directory)
+        self._max_disk_size = max_disk_size
+        if self._directory is not None:
+            os.makedirs(self._directory, exist_ok=True)
+        # Entries are kept in insertion order for "fifo", and in recency order for "lru".
+        self._entries = collections.OrderedDict()
+        self._uses = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._disk_hits = 0
+        self._evictions = 0
+        self._bypassed = 0
+
+    @property
+    def max_size(self) -> int | None:
+        """The maximum number of entries in the in-memory store."""
+        return self._max_size
+
+    @property
+    def policy(self) -> str:
+        """The eviction policy of the in-memory store."""
+        return self._policy
+
+    @property
+    def directory(self) -> str | None:
+        """The directory of the on-disk store, if any."""
+        return self._directory
+
+    def __len__(self):
+        return len(self._entries)
+
+    def statistics(self) -> TranspileCacheStatistics:
+        """Return a snapshot of the hit and miss statistics of this cache."""
+        with self._lock:
+            return TranspileCacheStatistics(
+                hits=self._hits,
+                misses=self._misses,
+                disk_hits=self._disk_hits,
+                evictions=self._evictions,
+                bypassed=self._bypassed,
+                size=len(self._entries),
+            )
+
+    def clear(self, *, disk: bool = False):
+        """Remove all entries from the in-memory store, and reset the statistics.
+
+        Args:
+            disk: Whether to also remove the entries of the on-disk store.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._uses.clear()
+            self._hits = self._misses = self._disk_hits = self._evictions = self._bypassed = 0
+            if disk and self._directory is not None:
+                for path in self._disk_entries():
+                    _remove(path)
+
+    def _get(self, key: str) -> QuantumCircuit | None:
+        with self._lock:
+            circuit = self._entries.get(key)
+            if circuit is not None:
+                self._hits += 1
+                self._uses[key] += 1
+                if self._policy == "lru":
+                    self._entries.move_to_end(key)
+                return circuit
+        if self._directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as fptr:
+                circuit = qpy.load(fptr)[0]
+        except FileNotFoundError:
+            return None
+        except Exception:  # pylint: disable=broad-except
+            # A corrupt or incompatible file is treated as a miss, and is rewritten on store.
+            logger.warning("Ignoring unreadable transpile cache entry %s", path, exc_info=True)
+            return None
+        _touch(path)
+        with self._lock:
+            self._hits += 1
+            self._disk_hits += 1
+            self._insert(key, circuit)
+        return circuit
+
+    def _put(self, key: str, circuit: QuantumCircuit):
+        with self._lock:
+            self._misses += 1
+            self._insert(key, circuit)
+        if self._directory is None:
+            return
+        path = self._path(key)
+        temporary = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(temporary, "wb") as fptr:
+                qpy.dump(circuit, fptr)
+            os.replace(temporary, path)
+        except Exception:  # pylint: disable=broad-except
+            _remove(temporary)
+            logger.warning("Could not write transpile cache entry %s", path, exc_info=True)
+            return
+        if self._max_disk_size is not None:
+            with self._lock:
+                self._evict_disk()
+
+    def _bypass(self, num_circuits: int):
+        with self._lock:
+            self._bypassed += num_circuits
+
+    def _insert(self, key, circuit):
+        # Must be called with the lock held.
+        if key in self._entries:
+            self._entries[key] = circuit
+            return
+        if self._max_size is not None and len(self._entries) >= self._max_size:
+            if self._policy == "lfu":
+                victim = min(self._entries, key=self._uses.__getitem__)
+            else:
+                victim = next(iter(self._entries))
+            del self._entries[victim]
+            del self._uses[victim]
+            self._evictions += 1
+        self._entries[key] = circuit
+        self._uses[key] = 1
+
+    def _evict_disk(self):
+        # Must be called with the lock held.
+        paths = self._disk_entries()
+        excess = len(paths) - self._max_disk_size
+        if excess <= 0:
+            return
+        mtimes = {}
+        for path in paths:
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                mtimes[path] = -1
+        for path in sorted(paths, key=mtimes.__getitem__)[:excess]:
+            if _remove(path):
+                self._evictions += 1
+
+    def _disk_entries(self):
+        return [
+            os.path.join(self._directory, name)
+            for name in os.listdir(self._directory)
+            if name.endswith(".qpy")
+        ]
+
+    def _path(self, key):
+        return os.path.join(self._directory, f"{key}.qpy")
+
+
+class _PassManagerCache:
+    """A cache of the preset pass managers built by :func:`.transpile`.
+
+    Building a preset pass manager constructs all the stage plugins and queries the target, which
+    takes a noticeable time compared with transpiling a small circuit.  The pass managers are
+    keyed by the arguments of :func:`.generate_preset_pass_manager`, and by the identity and the
+    fingerprint of the target.  A pass manager is only reused for the very target object it was
+    built for, since the passes keep a reference to it and may depend on target state that the
+    fingerprint does not cover.  The entry holds the target, so its identity is not reused while
+    the entry exists, and the fingerprint in the key makes a target modified in place miss.
+
+    A pass manager is checked out of the cache while it runs and checked back in after, so it is
+    never run by two threads at once; a concurrent call with the same key builds its own pass
+    manager.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Remove all the pass managers."""
+        with self._lock:
+            self._entries.clear()
+
+    def resize(self, max_size: int):
+        """Set the maximum number of pass managers, and drop the least recently used ones over
+        it."""
+        with self._lock:
+            self.max_size = max_size
+            self._evict()
+
+    def _evict(self):
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def checkout(self, key: tuple, target: Target | None):
+        """Remove the pass manager for ``key`` from the cache and return it, or return ``None``."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        pass_manager, built_for = entry
+        if built_for is not target:
+            return None
+        return pass_manager
+
+    def checkin(self, key: tuple, pass_manager, target: Target | None):
+        """Store ``pass_manager``, built for ``target``, under ``key``."""
+        with self._lock:
+            self._entries[key] = (pass_manager, target)
+            self._entries.move_to_end(key)
+            self._evict()
+
+
+# The pass managers built by `transpile`.
+_PASS_MANAGER_CACHE = _PassManagerCache(max_size=16)
+
+
+def clear_pass_manager_cache() -> None:
+    """Remove all the preset pass managers that :func:`.transpile` keeps for reuse.
+
+    The pass managers hold references to the :class:`.Target` objects they were built for, so
+    this also releases those targets.
+    """
+    _PASS_MANAGER_CACHE.clear()
+
+
+def set_pass_manager_cache_size(max_size: int) -> None:
+    """Set the maximum number of preset pass managers that :func:`.transpile` keeps for reuse.
+
+    :func:`.transpile` reuses the preset pass managers it builds between calls with the same
+    options and target, and keeps the 16 most recently used ones by default.  Each of them holds a
+    reference to the :class:`.Target` it was built for.  The least recently used pass managers
+    over the new size are dropped.
+
+    Args:
+        max_size: The maximum number of pass managers.  If 0, :func:`.transpile` builds a new
+            preset pass manager for every call, as it did before the pass managers were reused.
+
+    Raises:
+        ValueError: If ``max_size`` is negative.
+    """
+    if max_size < 0:
+        raise ValueError(f"max_size must not be negative, not {max_size}")
+    _PASS_MANAGER_CACHE.resize(max_size)
+
+
+def _pass_manager_key(backend, target: Target | None, options: dict) -> tuple | None:
+    """Return the key of the preset pass manager for the :func:`.generate_preset_pass_manager`
+    ``options``, or ``None`` if the pass manager should not be cached.
+
+    The options are only captured by their ``repr`` in the key, so later in-place changes of them
+    do not change the key."""
+    if _PASS_MANAGER_CACHE.max_size == 0 or options["hls_config"] is not None:
+        return None
+    initial_layout = options["initial_layout"]
+    if initial_layout is not None and not (
+        isinstance(initial_layout, list)
+        and all(isinstance(physical, int) for physical in initial_layout)
+    ):
+        return None
+    options = dict(options)
+    del options["hls_config"]
+    coupling_map = options["coupling_map"]
+    if coupling_map is not None:
+        options["coupling_map"] = (coupling_map.size(), sorted(coupling_map.get_edges()))
+    return (
+        None if target is None else id(target),
+        _target_fingerprint(target),
+        None if backend is None else (type(backend).__qualname__, backend.name),
+        repr(sorted(options.items())),
+    )
+
+
+def _remove(path) -> bool:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _touch(path):
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _canonical_parameters(circuit: QuantumCircuit) -> list:
+    """Return the parameters of ``circuit`` in order of first use."""
+    seen = {}
+    for instruction in circuit.data:
+        for param in instruction.operation.params:
+            if isinstance(param, ParameterExpression):
+                for parameter in sorted(param.parameters, key=lambda p: p.name):
+                    seen.setdefault(parameter, None)
+    for parameter in circuit.parameters:
+        seen.setdefault(parameter, None)
+    return list(seen)
+
+
+def _placeholders(count: int) -> list[Parameter]:
+    return [Parameter(f"_cache_{i}", uuid=uuid.UUID(int=i)) for i in range(count)]
+
+
+def _value_placeholders(count: int) -> list[Parameter]:
+    # The UUIDs are distinct from those of `_placeholders`.
+    return [Parameter(f"_cache_value_{i}", uuid=uuid.UUID(int=(1 << 64) + i)) for i in range(count)]
+
+
+def _keeps_bound_values(target: Target | None) -> bool:
+    """Return whether the bound values of circuits must be kept in their keys for ``target``.
+
+    This is the case if the target has an instruction that only supports fixed parameter values,
+    or angle bounds, which are only enforced on bound parameters by :class:`.WrapAngles`."""
+    if target is None:
+        return False
+    if target.has_angle_bounds():
+        return True
+    return any(
+        not isinstance(param, ParameterExpression)
+        for operation in target.operations
+        if not inspect.isclass(operation)
+        for param in getattr(operation, "params", ())
+    )
+
+
+def _strip_values(canonical: QuantumCircuit) -> list:
+    """Replace the bound parameters of the standard gates of ``canonical`` by placeholders, in
+    place, and return the values in the order of their placeholders."""
+    values = []
+    stripped = []
+    for index, instruction in enumerate(canonical.data):
+        if not instruction.is_standard_gate():
+            continue
+        positions = []
+        for position, param in enumerate(instruction.params):
+            if isinstance(param, ParameterExpression):
+                if param.parameters:
+                    continue
+                param = param.numeric()
+            positions.append(position)
+            values.append(param)
+        if positions:
+            stripped.append((index, positions))
+    placeholders = iter(_value_placeholders(len(values)))
+    for index, positions in stripped:
+        instruction = canonical.data[index]
+        params = list(instruction.params)
+        for position in positions:
+            params[position] = next(placeholders)
+        canonical.data[index] = instruction.replace(params=params)
+    return values
+
+
+def _canonicalize(circuit: QuantumCircuit, strip_values: bool) -> tuple[QuantumCircuit, list, list]:
+    """Return a copy of ``circuit`` with canonical parameters, name and metadata, the list of the
+    original parameters in the order of their placeholders, and, if ``strip_values`` is true, the
+    list of the bound values of standard gates in the order of their placeholders."""
+    parameters = _canonical_parameters(circuit)
+    if parameters:
+        canonical = circuit.assign_parameters(
+            dict(zip(parameters, _placeholders(len(parameters)))), inplace=False, strict=False
+        )
+    else:
+        canonical = circuit.copy()
+    values = _strip_values(canonical) if strip_values else []
+    canonical.name = "circuit"
+    canonical.metadata = {}
+    return canonical, parameters, values
+
+
+def _circuit_hash(canonical: QuantumCircuit) -> bytes:
+    buffer = io.BytesIO()
+    qpy.dump(canonical, buffer)
+    return hashlib.sha256(buffer.getvalue()).digest()
+
+
+def _target_fingerprint(target: Target | None) -> str:
+    """Return a hash of the properties of ``target`` that the transpiler uses."""
+    return "none" if target is None else target.fingerprint()
+
+
+def _options_key(options: dict) -> str | None:
+    """Return a stable representation of the :func:`.transpile` options, or ``None`` if they are
+    not cacheable."""
+    if (
+        options.pop("callback", None) is not None
+        or options.pop("hls_config", None) is not None
+        or options.pop("time_budget", None) is not None
+    ):
+        return None
+    initial_layout = options["initial_layout"]
+    if initial_layout is not None:
+        if not isinstance(initial_layout, list) or not all(
+            isinstance(physical, int) for physical in initial_layout
+        ):
+            return None
+    coupling_map = options["coupling_map"]
+    if coupling_map is not None:
+        options["coupling_map"] = sorted(coupling_map.get_edges())
+    return repr(sorted(options.items()))
+
+
+def _lookup_key(canonical: QuantumCircuit, fingerprint: str, options_key: str) -> str:
+    hasher = hashlib.sha256(_circuit_hash(canonical))
+    hasher.update(fingerprint.encode())
+    hasher.update(options_key.encode())
+    hasher.update(qiskit.__version__.encode())
+    return hasher.hexdigest()
+
+
+def _restore(
+    cached: QuantumCircuit, circuit: QuantumCircuit, parameters: list, values: list
+) -> QuantumCircuit:
+    """Build the output for ``circuit`` from the ``cached`` output of its canonical form."""
+    if parameters or values:
+        bindings = dict(zip(_placeholders(len(parameters)), parameters))
+        bindings.update(zip(_value_placeholders(len(values)), values))
+        out = cached.assign_parameters(bindings, inplace=False, strict=False)
+    else:
+        out = cached.copy()
+    out.name = circuit.name
+    out.metadata = dict(circuit.metadata)
+    if out.layout is not None:
+        out._layout = out.layout._with_input_circuit(circuit)
+    return out
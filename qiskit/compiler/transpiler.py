@@ -13,12 +13,15 @@
 # pylint: disable=invalid-sequence-index
 
 """Circuit transpile function"""
+import copy
 import logging
 from time import time
 from typing import List, Union, Dict, Callable, Any, Optional, TypeVar
 
 from qiskit import user_config
 from qiskit.circuit.quantumcircuit import QuantumCircuit
+from qiskit.compiler import transpile_cache
+from qiskit.compiler.transpile_cache import TranspileCache
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.providers.backend import Backend
 from qiskit.transpiler import Layout, CouplingMap, PropertySet
@@ -58,6 +61,8 @@ def transpile(  # pylint: disable=too-many-return-statements
     ignore_backend_supplied_default_methods: bool = False,
     num_processes: Optional[int] = None,
     qubits_initially_zero: bool = True,
+    cache: Optional[TranspileCache] = None,
+    time_budget: Optional[float] = None,
 ) -> _CircuitT:
     """Transpile one or more circuits, according to some desired transpilation targets.
 
@@ -232,6 +237,16 @@ def transpile(  # pylint: disable=too-many-return-statements
             environment variable. If set to ``None`` the system default or local user configuration
             will be used.
         qubits_initially_zero: Indicates whether the input circuit is zero-initialized.
+        cache: A :class:`.TranspileCache` to look the circuits up in before transpiling them, and
+            to store the newly transpiled circuits in.  If ``None``, no cache is used.  With a
+            cache, the circuits are transpiled with their bound parameter values replaced by
+            parameters, and the values are bound to the output.
+        time_budget: A wall-clock time budget in seconds for the transpilation of each circuit.
+            If set, the stochastic stages of the transpiler reduce their effort to fit the budget,
+            and always keep the best valid circuit found so far.  The budget is a target rather
+            than a hard limit.  Circuits transpiled with a time budget depend on the timing of the
+            run, so they are not looked up in or stored in ``cache``.  See the ``time_budget``
+            argument of :func:`.generate_preset_pass_manager`.
 
     Returns:
         The transpiled circuit(s).
@@ -263,32 +278,92 @@ def transpile(  # pylint: disable=too-many-return-statements
     coupling_map = _parse_coupling_map(coupling_map)
     _check_circuits_coupling_map(circuits, coupling_map, backend)
 
-    # Edge cases require using the old model (loose constraints) instead of building a target,
-    # but we don't populate the passmanager config with loose constraints unless it's one of
-    # the known edge cases to control the execution path.
-    pm = generate_preset_pass_manager(
-        optimization_level,
-        target=target,
-        backend=backend,
-        basis_gates=basis_gates,
-        coupling_map=coupling_map,
-        initial_layout=initial_layout,
-        layout_method=layout_method,
-        routing_method=routing_method,
-        translation_method=translation_method,
-        scheduling_method=scheduling_method,
-        approximation_degree=approximation_degree,
-        seed_transpiler=seed_transpiler,
-        unitary_synthesis_method=unitary_synthesis_method,
-        unitary_synthesis_plugin_config=unitary_synthesis_plugin_config,
-        hls_config=hls_config,
-        init_method=init_method,
-        optimization_method=optimization_method,
-        dt=dt,
-        qubits_initially_zero=qubits_initially_zero,
-    )
-
-    out_circuits = pm.run(circuits, callback=callback, num_processes=num_processes)
+    source_target = target if target is not None else getattr(backend, "target", None)
+    pm_options = {
+        "basis_gates": basis_gates,
+        "coupling_map": coupling_map,
+        "initial_layout": initial_layout,
+        "layout_method": layout_method,
+        "routing_method": routing_method,
+        "translation_method": translation_method,
+        "scheduling_method": scheduling_method,
+        "approximation_degree": approximation_degree,
+        "seed_transpiler": seed_transpiler,
+        "unitary_synthesis_method": unitary_synthesis_method,
+        "unitary_synthesis_plugin_config": unitary_synthesis_plugin_config,
+        "hls_config": hls_config,
+        "init_method": init_method,
+        "optimization_method": optimization_method,
+        "dt": dt,
+        "qubits_initially_zero": qubits_initially_zero,
+        "time_budget": time_budget,
+    }
+
+    cache_lookups = None
+    if cache is not None:
+        cache_lookups = _cache_lookup(
+            cache,
+            circuits,
+            source_target,
+            {**pm_options, "optimization_level": optimization_level, "callback": callback},
+        )
+    if cache_lookups is None:
+        out_circuits = [None] * len(circuits)
+        missing = list(range(len(circuits)))
+    else:
+        out_circuits = [lookup.output for lookup in cache_lookups]
+        missing = [i for i, out in enumerate(out_circuits) if out is None]
+
+    if missing:
+        # Building the preset pass manager takes a noticeable time for small circuits, so the
+        # pass managers are reused between calls with the same options and target.
+        pm_key = transpile_cache._pass_manager_key(
+            backend, source_target, {**pm_options, "optimization_level": optimization_level}
+        )
+        pm = (
+            None
+            if pm_key is None
+            else transpile_cache._PASS_MANAGER_CACHE.checkout(pm_key, source_target)
+        )
+        if pm is None:
+            if pm_key is not None:
+                # The cached pass manager must not see later in-place changes of the arguments.
+                pm_options["basis_gates"] = copy.copy(basis_gates)
+                pm_options["coupling_map"] = copy.deepcopy(coupling_map)
+                pm_options["initial_layout"] = copy.copy(initial_layout)
+                pm_options["unitary_synthesis_plugin_config"] = copy.deepcopy(
+                    unitary_synthesis_plugin_config
+                )
+            # Edge cases require using the old model (loose constraints) instead of building a
+            # target, but we don't populate the passmanager config with loose constraints unless
+            # it's one of the known edge cases to control the execution path.
+            pm = generate_preset_pass_manager(
+                optimization_level, target=target, backend=backend, **pm_options
+            )
+
+        if cache_lookups is None:
+            new_circuits = pm.run(
+                [circuits[i] for i in missing], callback=callback, num_processes=num_processes
+            )
+        else:
+            # The canonical forms are transpiled, so that their outputs can be reused for all the
+            # circuits with the same structure.
+            new_circuits = pm.run(
+                [cache_lookups[i].canonical for i in missing],
+                callback=callback,
+                num_processes=num_processes,
+            )
+        if pm_key is not None:
+            transpile_cache._PASS_MANAGER_CACHE.checkin(pm_key, pm, source_target)
+        for i, circ in zip(missing, new_circuits):
+            if cache_lookups is None:
+                out_circuits[i] = circ
+            else:
+                lookup = cache_lookups[i]
+                cache._put(lookup.key, circ)
+                out_circuits[i] = transpile_cache._restore(
+                    circ, circuits[i], lookup.parameters, lookup.values
+                )
 
     for name, circ in zip(output_name, out_circuits):
         circ.name = name
@@ -300,6 +375,32 @@ def transpile(  # pylint: disable=too-many-return-statements
         return out_circuits[0]
 
 
+def _cache_lookup(cache, circuits, target, options):
+    """Look ``circuits`` up in ``cache``.
+
+    Returns a :class:`._CacheLookup` for each circuit, whose ``output`` is ``None`` on a miss, or
+    ``None`` if the options are not cacheable.
+    """
+    options_key = transpile_cache._options_key(options)
+    if options_key is None:
+        cache._bypass(len(circuits))
+        return None
+    fingerprint = transpile_cache._target_fingerprint(target)
+    strip_values = not transpile_cache._keeps_bound_values(target)
+    lookups = []
+    for circuit in circuits:
+        canonical, parameters, values = transpile_cache._canonicalize(circuit, strip_values)
+        key = transpile_cache._lookup_key(canonical, fingerprint, options_key)
+        cached = cache._get(key)
+        out = (
+            None
+            if cached is None
+            else transpile_cache._restore(cached, circuit, parameters, values)
+        )
+        lookups.append(transpile_cache._CacheLookup(key, canonical, parameters, values, out))
+    return lookups
+
+
 def _check_circuits_coupling_map(circuits, cmap, backend):
     # Check circuit width against number of qubits in coupling_map(s)
     max_qubits = None
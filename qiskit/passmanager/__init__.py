@@ -241,6 +241,23 @@ Compilation state
    WorkflowStatus
    PassManagerState
 
+Profiling
+---------
+
+.. autosummary::
+   :toctree: ../stubs/
+
+   PassManagerProfiler
+   TaskProfile
+
+Parallel execution
+------------------
+
+.. autosummary::
+   :toctree: ../stubs/
+
+   WorkerPool
+
 Exceptions
 ----------
 
@@ -255,4 +272,6 @@ from .flow_controllers import (
 )
 from .base_tasks import GenericPass, BaseController
 from .compilation_status import PropertySet, WorkflowStatus, PassManagerState
+from .profiling import PassManagerProfiler, TaskProfile
+from .worker_pool import WorkerPool
 from .exceptions import PassManagerError
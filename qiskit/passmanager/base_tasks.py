@@ -92,9 +92,12 @@ class GenericPass(Task, ABC):
 
         run_state = None
         ret = None
+        profiler = state.profiler
         start_time = time.time()
         try:
             if self not in state.workflow_status.completed_passes:
+                if profiler is not None:
+                    profiler._begin(self.name(), "pass", passmanager_ir)
                 ret = self.run(passmanager_ir)
                 run_state = RunState.SUCCESS
             else:
@@ -104,6 +107,11 @@ class GenericPass(Task, ABC):
             raise
         finally:
             ret = passmanager_ir if ret is None else ret
+            if profiler is not None:
+                if run_state == RunState.SKIP:
+                    profiler._skip(self.name())
+                else:
+                    profiler._end(ret)
             if run_state != RunState.SKIP:
                 running_time = time.time() - start_time
                 logger.info("Pass: %s - %.5f (ms)", self.name(), running_time * 1000)
@@ -209,6 +217,17 @@ class BaseController(Task, ABC):
         # Pass subclass must keep current implementation.
         # Especially, task execution may break when method signature is modified.
 
+        profiler = state.profiler
+        if profiler is None:
+            return self._execute_tasks(passmanager_ir, state, callback)
+        profiler._begin(self.__class__.__name__, "controller", passmanager_ir)
+        try:
+            passmanager_ir, state = self._execute_tasks(passmanager_ir, state, callback)
+        finally:
+            profiler._end(passmanager_ir)
+        return passmanager_ir, state
+
+    def _execute_tasks(self, passmanager_ir, state, callback):
         task_generator = self.iter_tasks(state)
         try:
             next_task = task_generator.send(None)
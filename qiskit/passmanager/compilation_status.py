@@ -13,8 +13,14 @@
 """A property set dictionary that shared among optimization passes."""
 
 
+from __future__ import annotations
+
 from dataclasses import dataclass, field
 from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .profiling import PassManagerProfiler
 
 
 class PropertySet(dict):
@@ -51,6 +57,13 @@ class WorkflowStatus:
     previous_run: RunState = RunState.FAIL
     """Status of the latest pass run."""
 
+    memoized_ir: Any = None
+    """A copy of the IR that the passes in ``memoized_results`` were run on."""
+
+    memoized_results: dict = field(default_factory=dict)
+    """The property set entries written by each pass whose results only depend on the IR, for the
+    passes that were run on ``memoized_ir``."""
+
 
 @dataclass
 class PassManagerState:
@@ -72,3 +85,6 @@ class PassManagerState:
 
     property_set: PropertySet
     """Information about IR being optimized."""
+
+    profiler: PassManagerProfiler | None = None
+    """The profiler recording the task executions, if any."""
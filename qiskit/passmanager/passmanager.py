@@ -13,19 +13,36 @@
 """Manager for a set of Passes and their scheduling during transpilation."""
 from __future__ import annotations
 
+import collections
 import logging
+import pickle
+import threading
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from collections.abc import Callable, Iterable, Iterator
 from itertools import chain
 from typing import Any
 
 import dill
 
-from qiskit.utils.parallel import parallel_map, should_run_in_parallel
+from qiskit.utils.parallel import (
+    default_num_processes,
+    parallel_map,
+    should_run_in_parallel,
+    _forbid_nested_parallelism,
+)
 from .base_tasks import Task, PassManagerIR
 from .exceptions import PassManagerError
 from .flow_controllers import FlowControllerLinear
 from .compilation_status import PropertySet, WorkflowStatus, PassManagerState
+from .profiling import PassManagerProfiler, TaskProfile
+from .worker_pool import WorkerPool, _initialize_worker
 
 logger = logging.getLogger(__name__)
 
@@ -169,6 +186,43 @@ class BasePassManager(ABC):
         """
         pass
 
+    def _serialize_program(self, program: Any) -> bytes:
+        """Serialize a program to send it to another process.
+
+        Args:
+            program: An input or output program.
+
+        Returns:
+            The serialized program.  By default, it is pickled.
+        """
+        return pickle.dumps(program)
+
+    def _deserialize_program(self, data: bytes, in_program: Any = None) -> Any:
+        """Deserialize a program serialized by :meth:`_serialize_program`.
+
+        Args:
+            data: The serialized program.
+            in_program: When deserializing an output program, the input program that it was
+                produced from.
+
+        Returns:
+            The program.
+        """
+        # pylint: disable=unused-argument
+        return pickle.loads(data)
+
+    def _passmanager_ir_metrics(self, passmanager_ir: PassManagerIR) -> dict[str, Any]:
+        """Return metrics of the pass manager IR to record when profiling.
+
+        Args:
+            passmanager_ir: Pass manager IR.
+
+        Returns:
+            A mapping of metric names to values.  By default, no metrics are recorded.
+        """
+        # pylint: disable=unused-argument
+        return {}
+
     def run(
         self,
         in_programs: Any | list[Any],
@@ -176,6 +230,9 @@ class BasePassManager(ABC):
         num_processes: int = None,
         *,
         property_set: dict[str, object] | None = None,
+        profiler: PassManagerProfiler | None = None,
+        pool: WorkerPool | None = None,
+        num_threads: int | None = None,
         **kwargs,
     ) -> Any:
         """Run all the passes on the specified ``in_programs``.
@@ -218,6 +275,17 @@ class BasePassManager(ABC):
                 another, in cases where you know the analysis is safe to share.  Beware that some
                 analysis will be specific to the input circuit and the particular :class:`.Target`,
                 so you should take a lot of care when using this argument.
+            profiler: If given, a :class:`.PassManagerProfiler` that records the profile of every
+                task run for each program.
+            pool: If given, a :class:`.WorkerPool` to run the programs in, when there is more than
+                one.  The ``num_processes`` argument and the parallelism settings are then ignored.
+            num_threads: If greater than one, run the programs in up to this many threads of this
+                process, rather than in other processes.  Each thread runs its own copy of the pass
+                manager.  This mode does not need to start or serialize anything to other
+                processes, so it works where those are not allowed, but it only runs in parallel
+                for the parts of the passes that release the GIL.  The ``callback`` is called from
+                the worker threads.  The ``num_processes`` argument and the parallelism settings
+                are then ignored.
             kwargs: Arbitrary arguments passed to the compiler frontend and backend.
 
         Returns:
@@ -231,15 +299,27 @@ class BasePassManager(ABC):
             in_programs = [in_programs]
             is_list = False
 
+        if num_threads is not None and num_threads > 1 and len(in_programs) > 1:
+            return _run_workflows_in_threads(
+                in_programs,
+                self,
+                num_threads,
+                callback=callback,
+                initial_property_set=property_set,
+                profiler=profiler,
+                **kwargs,
+            )
+
         # If we're not going to run in parallel, we want to avoid spending time `dill` serializing
         # ourselves, since that can be quite expensive.
-        if len(in_programs) == 1 or not should_run_in_parallel(num_processes):
+        if len(in_programs) == 1 or (pool is None and not should_run_in_parallel(num_processes)):
             out = [
                 _run_workflow(
                     program=program,
                     pass_manager=self,
                     callback=callback,
                     initial_property_set=property_set,
+                    profiler=profiler,
                     **kwargs,
                 )
                 for program in in_programs
@@ -248,20 +328,191 @@ class BasePassManager(ABC):
                 return out[0]
             return out
         del kwargs
-        # Pass manager may contain callable and we need to serialize through dill rather than pickle.
-        # See https://github.com/Qiskit/qiskit-terra/pull/3290
-        # Note that serialized object is deserialized as a different object.
-        # Thus, we can reuse the same manager without state collision, without building it per thread.
-        return parallel_map(
-            _run_workflow_in_new_process,
-            values=in_programs,
-            task_kwargs={
+        if pool is not None:
+            return _run_workflows_in_pool(
+                in_programs,
+                self,
+                pool,
+                callback=callback,
+                initial_property_set=property_set,
+                profiler=profiler,
+            )
+        return _run_workflows_in_processes(
+            in_programs,
+            self,
+            num_processes,
+            callback=callback,
+            initial_property_set=property_set,
+            profiler=profiler,
+        )
+
+    def imap(
+        self,
+        in_programs: Iterable[Any],
+        callback: Callable = None,
+        num_processes: int = None,
+        *,
+        ordered: bool = True,
+        max_in_flight: int | None = None,
+        property_set: dict[str, object] | None = None,
+        profiler: PassManagerProfiler | None = None,
+        pool: WorkerPool | None = None,
+        num_threads: int | None = None,
+        **kwargs,
+    ) -> Iterator[Any]:
+        """Run all the passes on each of the ``in_programs``, and yield the transformed programs
+        as they are completed.
+
+        Unlike :meth:`run`, this does not build the list of all the transformed programs, and
+        reads the input programs lazily, so it can be used to stream a large number of programs
+        into further processing, such as writing them to a file or submitting them for execution,
+        with bounded memory.  At most ``max_in_flight`` programs are read from ``in_programs``
+        but not yielded yet at any time.
+
+        The programs are run serially, in threads, in new processes or in a :class:`.WorkerPool`,
+        depending on the arguments, as in :meth:`run`.  Closing the generator before it is
+        exhausted cancels the programs that have not started running.
+
+        Args:
+            in_programs: An iterable of the input programs.  It is consumed lazily.
+            callback: A callback function that will be called after each pass execution, as in
+                :meth:`run`.
+            num_processes: The maximum number of parallel processes to launch if parallel
+                execution is enabled, as in :meth:`run`.
+            ordered: If ``True``, yield the transformed programs in the order of the input
+                programs.  If ``False``, yield them in the order they are completed, as tuples of
+                the index of the input program and the transformed program.
+            max_in_flight: The maximum number of programs that are running or are completed but
+                not yielded yet.  If ``None``, it is twice the number of parallel workers.  This
+                has no effect when the programs are run serially.
+            property_set: If given, the initial value to use as the :class:`.PropertySet` for the
+                pass manager pipeline of each program, as in :meth:`run`.
+            profiler: If given, a :class:`.PassManagerProfiler` that records the profile of every
+                task run for each program.  The programs are numbered in the order they are
+                yielded.
+            pool: If given, a :class:`.WorkerPool` to run the programs in.
+            num_threads: If greater than one, run the programs in up to this many threads of this
+                process, each with its own copy of the pass manager, as in :meth:`run`.
+            kwargs: Arbitrary arguments passed to the compiler frontend and backend.
+
+        Returns:
+            An iterator over the transformed programs, or over tuples of the index of the input
+            program and the transformed program if ``ordered`` is ``False``.
+
+        Raises:
+            ValueError: If ``max_in_flight`` is not positive.
+        """
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be positive, not {max_in_flight}")
+        return self._imap(
+            iter(in_programs),
+            callback=callback,
+            num_processes=num_processes,
+            ordered=ordered,
+            max_in_flight=max_in_flight,
+            property_set=property_set,
+            profiler=profiler,
+            pool=pool,
+            num_threads=num_threads,
+            **kwargs,
+        )
+
+    def _imap(
+        self,
+        in_programs,
+        *,
+        callback,
+        num_processes,
+        ordered,
+        max_in_flight,
+        property_set,
+        profiler,
+        pool,
+        num_threads,
+        **kwargs,
+    ):
+        # This is separate from `imap` so that the arguments are validated when it is called,
+        # rather than when the generator is first advanced.
+        if num_threads is not None and num_threads > 1:
+            num_workers = num_threads
+            executor = ThreadPoolExecutor(
+                max_workers=num_threads, thread_name_prefix="qiskit-passmanager"
+            )
+            # Unlike `run`, this does not set `QISKIT_IN_PARALLEL`, since the caller runs between
+            # the yields.  The multithreaded native passes share a single thread pool anyway.
+            run = _thread_runner(
+                self,
+                initial_property_set=property_set,
+                profile_ir_metrics=None if profiler is None else profiler._record_ir_metrics,
+                callback=callback,
+                **kwargs,
+            )
+
+            def submit(program):
+                return executor.submit(run, program)
+
+            def finish(_, result):
+                return result
+
+        elif pool is not None:
+            num_workers = pool.num_processes
+            executor = None
+            submit = pool._submitter(
+                self,
+                callback,
+                {
+                    "initial_property_set": property_set,
+                    "profile_ir_metrics": (
+                        None if profiler is None else profiler._record_ir_metrics
+                    ),
+                },
+            )
+
+            def finish(in_program, result):
+                program_bin, profiles = result
+                return self._deserialize_program(program_bin, in_program), profiles
+
+        elif should_run_in_parallel(num_processes):
+            num_workers = default_num_processes() if num_processes is None else num_processes
+            executor = ProcessPoolExecutor(max_workers=num_workers, initializer=_initialize_worker)
+            task_kwargs = {
                 "pass_manager_bin": dill.dumps(self),
                 "callback": dill.dumps(callback),
                 "initial_property_set": property_set,
-            },
-            num_processes=num_processes,
-        )
+                "profile_ir_metrics": None if profiler is None else profiler._record_ir_metrics,
+            }
+
+            def submit(program):
+                return executor.submit(_run_workflow_in_new_process, program, **task_kwargs)
+
+            def finish(_, result):
+                return result if profiler is not None else (result, None)
+
+        else:
+            for index, program in enumerate(in_programs):
+                out = _run_workflow(
+                    program=program,
+                    pass_manager=self,
+                    callback=callback,
+                    initial_property_set=property_set,
+                    profiler=profiler,
+                    **kwargs,
+                )
+                yield out if ordered else (index, out)
+            return
+
+        if max_in_flight is None:
+            max_in_flight = 2 * num_workers
+        try:
+            for index, (out, profiles) in _imap_futures(
+                submit, finish, in_programs, ordered, max_in_flight
+            ):
+                if profiler is not None:
+                    profiler._extend(profiles)
+                yield out if ordered else (index, out)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
 
     def to_flow_controller(self) -> FlowControllerLinear:
         """Linearize this manager into a single :class:`.FlowControllerLinear`,
@@ -285,6 +536,7 @@ def _run_workflow(
     pass_manager: BasePassManager,
     *,
     initial_property_set: dict[str, object] | None = None,
+    profiler: PassManagerProfiler | None = None,
     **kwargs,
 ) -> Any:
     """Run single program optimization with a pass manager.
@@ -292,6 +544,7 @@ def _run_workflow(
     Args:
         program: Arbitrary program to optimize.
         pass_manager: Pass manager with scheduled passes.
+        profiler: Profiler to record the task executions in.
         **kwargs: Keyword arguments for IR conversion.
 
     Returns:
@@ -308,10 +561,14 @@ def _run_workflow(
         input_program=program,
         **kwargs,
     )
+    if profiler is not None:
+        profiler._start_program(pass_manager._passmanager_ir_metrics)
     passmanager_ir, final_state = flow_controller.execute(
         passmanager_ir=passmanager_ir,
         state=PassManagerState(
-            workflow_status=initial_status, property_set=pass_manager.property_set
+            workflow_status=initial_status,
+            property_set=pass_manager.property_set,
+            profiler=profiler,
         ),
         callback=kwargs.get("callback", None),
     )
@@ -332,25 +589,232 @@ def _run_workflow(
     return out_program
 
 
+def _thread_runner(
+    pass_manager: BasePassManager,
+    *,
+    initial_property_set: dict[str, object] | None,
+    profile_ir_metrics: bool | None,
+    **kwargs,
+) -> Callable[[Any], tuple[Any, list[TaskProfile] | None]]:
+    """Return a function that runs a program with a copy of the pass manager for each thread.
+
+    The function returns the optimized program, and the list of :class:`.TaskProfile` of the run
+    if ``profile_ir_metrics`` is not ``None``.
+    """
+    # Passes keep state on themselves while they run, so each thread needs its own copy.
+    pass_manager_bin = dill.dumps(pass_manager)
+    local = threading.local()
+
+    def run(program):
+        thread_pass_manager = getattr(local, "pass_manager", None)
+        if thread_pass_manager is None:
+            thread_pass_manager = local.pass_manager = dill.loads(pass_manager_bin)
+        profiler = (
+            None
+            if profile_ir_metrics is None
+            else PassManagerProfiler(ir_metrics=profile_ir_metrics)
+        )
+        out = _run_workflow(
+            program=program,
+            pass_manager=thread_pass_manager,
+            initial_property_set=initial_property_set,
+            profiler=profiler,
+            **kwargs,
+        )
+        return out, None if profiler is None else profiler.profiles
+
+    return run
+
+
+def _imap_futures(
+    submit: Callable[[Any], Future],
+    finish: Callable[[Any, Any], Any],
+    programs: Iterator[Any],
+    ordered: bool,
+    max_in_flight: int,
+) -> Iterator[tuple[int, Any]]:
+    """Submit the programs with at most ``max_in_flight`` of them pending at any time, and yield
+    the indices of the programs and the results of ``finish`` as they are completed."""
+    programs = enumerate(programs)
+    pending = {}
+    order = collections.deque()
+    try:
+        while True:
+            while len(pending) < max_in_flight:
+                try:
+                    index, program = next(programs)
+                except StopIteration:
+                    break
+                future = submit(program)
+                pending[future] = (index, program)
+                order.append(future)
+            if not pending:
+                return
+            if ordered:
+                future = order.popleft()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = done.pop()
+            index, program = pending.pop(future)
+            yield index, finish(program, future.result())
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _run_workflows_in_threads(
+    programs: list[Any],
+    pass_manager: BasePassManager,
+    num_threads: int,
+    *,
+    initial_property_set: dict[str, object] | None = None,
+    profiler: PassManagerProfiler | None = None,
+    **kwargs,
+) -> list[Any]:
+    """Run programs in a pool of threads, each with its own copy of the pass manager.
+
+    Args:
+        programs: Programs to optimize.
+        pass_manager: Pass manager with scheduled passes.
+        num_threads: Maximum number of threads.
+        profiler: Profiler to collect the task executions of every program in.
+        **kwargs: Keyword arguments for IR conversion.
+
+    Returns:
+        Optimized programs.
+    """
+    run = _thread_runner(
+        pass_manager,
+        initial_property_set=initial_property_set,
+        profile_ir_metrics=None if profiler is None else profiler._record_ir_metrics,
+        **kwargs,
+    )
+
+    # As in `parallel_map`, tell nested parallel regions (including the multithreaded native
+    # passes) that they are already running in parallel, to avoid oversubscribing the cores.
+    with _forbid_nested_parallelism():
+        with ThreadPoolExecutor(
+            max_workers=min(num_threads, len(programs)), thread_name_prefix="qiskit-passmanager"
+        ) as executor:
+            results = list(executor.map(run, programs))
+    if profiler is not None:
+        for _, profiles in results:
+            profiler._extend(profiles)
+    return [out for out, _ in results]
+
+
+def _run_workflows_in_pool(
+    programs: list[Any],
+    pass_manager: BasePassManager,
+    pool: WorkerPool,
+    *,
+    callback: Callable | None,
+    initial_property_set: dict[str, object] | None = None,
+    profiler: PassManagerProfiler | None = None,
+) -> list[Any]:
+    """Run programs in the processes of a :class:`.WorkerPool`.
+
+    Args:
+        programs: Programs to optimize.
+        pass_manager: Pass manager with scheduled passes.
+        pool: Pool to run the programs in.
+        callback: Callback to call after each pass execution.
+        profiler: Profiler to collect the task executions of every program in.
+
+    Returns:
+        Optimized programs.
+    """
+    results = pool._map(
+        pass_manager,
+        callback,
+        programs,
+        {
+            "initial_property_set": initial_property_set,
+            "profile_ir_metrics": None if profiler is None else profiler._record_ir_metrics,
+        },
+    )
+    out = []
+    for in_program, (program_bin, profiles) in zip(programs, results):
+        out.append(pass_manager._deserialize_program(program_bin, in_program))
+        if profiler is not None:
+            profiler._extend(profiles)
+    return out
+
+
+def _run_workflows_in_processes(
+    programs: list[Any],
+    pass_manager: BasePassManager,
+    num_processes: int | None,
+    *,
+    callback: Callable | None,
+    initial_property_set: dict[str, object] | None = None,
+    profiler: PassManagerProfiler | None = None,
+) -> list[Any]:
+    """Run programs in new processes with :func:`.parallel_map`.
+
+    Args:
+        programs: Programs to optimize.
+        pass_manager: Pass manager with scheduled passes.
+        num_processes: Maximum number of processes, or ``None`` for the default.
+        callback: Callback to call after each pass execution.
+        profiler: Profiler to collect the task executions of every program in.
+
+    Returns:
+        Optimized programs.
+    """
+    # Pass manager may contain callable and we need to serialize through dill rather than pickle.
+    # See https://github.com/Qiskit/qiskit-terra/pull/3290
+    # Note that serialized object is deserialized as a different object.
+    # Thus, we can reuse the same manager without state collision, without building it per thread.
+    out = parallel_map(
+        _run_workflow_in_new_process,
+        values=programs,
+        task_kwargs={
+            "pass_manager_bin": dill.dumps(pass_manager),
+            "callback": dill.dumps(callback),
+            "initial_property_set": initial_property_set,
+            "profile_ir_metrics": None if profiler is None else profiler._record_ir_metrics,
+        },
+        num_processes=num_processes,
+    )
+    if profiler is None:
+        return out
+    # The processes return their profiles together with the programs.
+    for _, profiles in out:
+        profiler._extend(profiles)
+    return [program for program, _ in out]
+
+
 def _run_workflow_in_new_process(
     program: Any,
     pass_manager_bin: bytes,
     *,
     initial_property_set: dict[str, object] | None,
     callback: bytes,
+    profile_ir_metrics: bool | None = None,
 ) -> Any:
     """Run single program optimization in new process.
 
     Args:
         program: Arbitrary program to optimize.
         pass_manager_bin: Binary of the pass manager with scheduled passes.
+        profile_ir_metrics: If not ``None``, profile the run, and record the IR metrics if
+            ``True``.
 
     Returns:
-          Optimized program.
+          Optimized program, or a tuple of the optimized program and the list of
+          :class:`.TaskProfile` when profiling.
     """
-    return _run_workflow(
+    profiler = (
+        None if profile_ir_metrics is None else PassManagerProfiler(ir_metrics=profile_ir_metrics)
+    )
+    out = _run_workflow(
         program=program,
         pass_manager=dill.loads(pass_manager_bin),
         initial_property_set=initial_property_set,
+        profiler=profiler,
         callback=dill.loads(callback),
     )
+    if profiler is None:
+        return out
+    return out, profiler.profiles
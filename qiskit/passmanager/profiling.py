@@ -0,0 +1,348 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Profiling of pass manager runs."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+import sys
+import time
+from collections.abc import Callable
+from typing import IO, Any
+
+try:
+    import resource
+except ImportError:  # Windows.
+    resource = None
+
+
+@dataclasses.dataclass(frozen=True)
+class TaskProfile:
+    """The profile of a single execution of a pass or a flow controller."""
+
+    name: str
+    """The name of the task."""
+    kind: str
+    """Either ``"pass"`` or ``"controller"``, or ``"skipped"`` for a pass that was not run because
+    its results were still valid."""
+    program: int
+    """The index of the program in the pass manager run."""
+    nesting: int
+    """The nesting level of the task, where the outermost flow controller has level 0."""
+    start: float
+    """The start time, in seconds since the epoch."""
+    wall_time: float
+    """The elapsed wall-clock time, in seconds."""
+    cpu_time: float
+    """The CPU time used by the process, in seconds."""
+    peak_rss_delta: int | None
+    """The increase of the peak resident set size of the process, in bytes, or ``None`` if it is
+    not available on this platform."""
+    ir_before: dict[str, Any]
+    """Metrics of the IR before the task ran, such as the ``"size"`` and ``"depth"`` of a
+    :class:`.DAGCircuit`."""
+    ir_after: dict[str, Any]
+    """Metrics of the IR after the task ran."""
+    process: int
+    """The identifier of the process that ran the task."""
+
+
+@dataclasses.dataclass
+class _OpenTask:
+    name: str
+    kind: str
+    nesting: int
+    start: float
+    wall_start: float
+    cpu_start: float
+    rss_start: int | None
+    ir_before: dict[str, Any]
+
+
+class PassManagerProfiler:
+    """Record a profile of every pass and flow controller of pass manager runs.
+
+    Pass an instance as the ``profiler`` argument of :meth:`.BasePassManager.run`.  For each
+    task that runs, the profiler records a :class:`.TaskProfile` with the wall-clock and CPU time,
+    the increase of the peak memory of the process, and metrics of the IR before and after the
+    task, such as the size and depth of the :class:`.DAGCircuit` for a :class:`.PassManager`.  Flow
+    controllers are recorded too, so the profiles are nested like the pass manager schedule, and
+    so are the passes that are skipped because their results are still valid.
+
+    The same profiler can be used for several runs, whose profiles accumulate.  When programs are
+    run in parallel, each process profiles its own programs and the profiles are collected in the
+    profiler of the parent process.
+
+    The profiles can be exported as a Chrome trace, which can be viewed with ``chrome://tracing``
+    or `Perfetto <https://ui.perfetto.dev>`__, and summarized per pass as a table.
+
+    Example:
+
+        .. code-block:: python
+
+            from qiskit.circuit.library import quantum_volume
+            from qiskit.passmanager import PassManagerProfiler
+            from qiskit.providers.fake_provider import GenericBackendV2
+            from qiskit.transpiler import generate_preset_pass_manager
+
+            pm = generate_preset_pass_manager(2, GenericBackendV2(10))
+            profiler = PassManagerProfiler()
+            pm.run(quantum_volume(10, seed=1), profiler=profiler)
+            print(profiler.summary())
+            profiler.write_chrome_trace("transpile-trace.json")
+
+    .. note::
+
+        Computing the IR metrics adds overhead to every task, for example computing the depth of
+        a :class:`.DAGCircuit` takes time linear in its size.  Set ``ir_metrics=False`` to skip
+        them.
+    """
+
+    def __init__(self, *, ir_metrics: bool = True):
+        """
+        Args:
+            ir_metrics: Whether to record metrics of the IR before and after each task.
+        """
+        self._record_ir_metrics = ir_metrics
+        self._profiles: list[TaskProfile] = []
+        self._stack: list[_OpenTask] = []
+        self._num_programs = 0
+        self._program = 0
+        self._ir_metrics: Callable[[Any], dict[str, Any]] | None = None
+
+    @property
+    def profiles(self) -> list[TaskProfile]:
+        """The recorded profiles, in order of completion."""
+        return list(self._profiles)
+
+    def clear(self):
+        """Remove all the recorded profiles."""
+        self._profiles.clear()
+        self._num_programs = 0
+
+    def _start_program(self, ir_metrics: Callable[[Any], dict[str, Any]]) -> None:
+        self._program = self._num_programs
+        self._num_programs += 1
+        self._ir_metrics = ir_metrics if self._record_ir_metrics else None
+        self._stack.clear()
+
+    def _extend(self, profiles: list[TaskProfile]) -> None:
+        # Add the profiles of a single program run in another profiler.
+        program = self._num_programs
+        self._num_programs += 1
+        self._profiles.extend(dataclasses.replace(profile, program=program) for profile in profiles)
+
+    def _begin(self, name: str, kind: str, passmanager_ir: Any) -> None:
+        self._stack.append(
+            _OpenTask(
+                name=name,
+                kind=kind,
+                nesting=len(self._stack),
+                start=time.time(),
+                ir_before=self._metrics(passmanager_ir),
+                rss_start=_peak_rss(),
+                cpu_start=time.process_time(),
+                wall_start=time.perf_counter(),
+            )
+        )
+
+    def _end(self, passmanager_ir: Any) -> None:
+        wall_end = time.perf_counter()
+        cpu_end = time.process_time()
+        rss_end = _peak_rss()
+        task = self._stack.pop()
+        self._profiles.append(
+            TaskProfile(
+                name=task.name,
+                kind=task.kind,
+                program=self._program,
+                nesting=task.nesting,
+                start=task.start,
+                wall_time=wall_end - task.wall_start,
+                cpu_time=cpu_end - task.cpu_start,
+                peak_rss_delta=None if rss_end is None else rss_end - task.rss_start,
+                ir_before=task.ir_before,
+                ir_after=self._metrics(passmanager_ir),
+                process=os.getpid(),
+            )
+        )
+
+    def _skip(self, name: str) -> None:
+        self._profiles.append(
+            TaskProfile(
+                name=name,
+                kind="skipped",
+                program=self._program,
+                nesting=len(self._stack),
+                start=time.time(),
+                wall_time=0.0,
+                cpu_time=0.0,
+                peak_rss_delta=None,
+                ir_before={},
+                ir_after={},
+                process=os.getpid(),
+            )
+        )
+
+    def _metrics(self, passmanager_ir):
+        if self._ir_metrics is None:
+            return {}
+        return self._ir_metrics(passmanager_ir)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Return the profiles in the Chrome trace event format.
+
+        Each task is a complete (``"X"``) event, with the process that ran it as the ``pid`` and
+        the index of the program as the ``tid``, so that each program is drawn as its own track.
+        The CPU time, memory and IR metrics are in the ``args`` of the event.  Skipped passes are
+        instant (``"i"``) events.
+
+        Returns:
+            A JSON-serializable dictionary.
+        """
+        origin = min((profile.start for profile in self._profiles), default=0.0)
+        events = []
+        tracks = set()
+        for profile in self._profiles:
+            tracks.add((profile.process, profile.program))
+            if profile.kind == "skipped":
+                events.append(
+                    {
+                        "name": profile.name,
+                        "cat": profile.kind,
+                        "ph": "i",
+                        "s": "t",
+                        "ts": (profile.start - origin) * 1e6,
+                        "pid": profile.process,
+                        "tid": profile.program,
+                        "args": {"nesting": profile.nesting},
+                    }
+                )
+                continue
+            args = {"cpu_time_ms": profile.cpu_time * 1e3, "nesting": profile.nesting}
+            if profile.peak_rss_delta is not None:
+                args["peak_rss_delta_bytes"] = profile.peak_rss_delta
+            args.update({f"{key}_before": value for key, value in profile.ir_before.items()})
+            args.update({f"{key}_after": value for key, value in profile.ir_after.items()})
+            events.append(
+                {
+                    "name": profile.name,
+                    "cat": profile.kind,
+                    "ph": "X",
+                    "ts": (profile.start - origin) * 1e6,
+                    "dur": profile.wall_time * 1e6,
+                    "pid": profile.process,
+                    "tid": profile.program,
+                    "args": args,
+                }
+            )
+        for process, program in sorted(tracks):
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": process,
+                    "tid": program,
+                    "args": {"name": f"program {program}"},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, file: str | os.PathLike | IO[str]) -> None:
+        """Write the profiles as a Chrome trace JSON file.
+
+        Args:
+            file: The path of the file to write, or a text file object.
+        """
+        trace = self.to_chrome_trace()
+        if hasattr(file, "write"):
+            json.dump(trace, file)
+        else:
+            with open(file, "w", encoding="utf-8") as fptr:
+                json.dump(trace, fptr)
+
+    def summary(self) -> str:
+        """Return a table of the profiles of the passes, aggregated by pass name.
+
+        The passes are sorted by decreasing total wall-clock time.  The table has the number of
+        calls of each pass, the total and mean wall-clock time, the total CPU time, the largest
+        increase of the peak memory, the total change of the IR ``"size"`` metric, if any, and the
+        number of times the pass was skipped because its results were still valid.
+        """
+        rows = {}
+        for profile in self._profiles:
+            if profile.kind == "controller":
+                continue
+            row = rows.setdefault(profile.name, [0, 0.0, 0.0, None, None, 0])
+            if profile.kind == "skipped":
+                row[5] += 1
+                continue
+            row[0] += 1
+            row[1] += profile.wall_time
+            row[2] += profile.cpu_time
+            if profile.peak_rss_delta is not None:
+                row[3] = max(row[3] or 0, profile.peak_rss_delta)
+            size_before = profile.ir_before.get("size")
+            size_after = profile.ir_after.get("size")
+            if size_before is not None and size_after is not None:
+                row[4] = (row[4] or 0) + size_after - size_before
+        header = (
+            "Pass",
+            "Calls",
+            "Wall (ms)",
+            "Mean (ms)",
+            "CPU (ms)",
+            "Peak RSS (KiB)",
+            "Size",
+            "Skipped",
+        )
+        lines = [
+            (
+                name,
+                str(calls),
+                f"{wall * 1e3:.3f}",
+                f"{wall * 1e3 / calls:.3f}" if calls else "-",
+                f"{cpu * 1e3:.3f}",
+                "-" if rss is None else f"{rss / 1024:.0f}",
+                "-" if size is None else f"{size:+d}",
+                str(skipped),
+            )
+            for name, (calls, wall, cpu, rss, size, skipped) in sorted(
+                rows.items(), key=lambda item: -item[1][1]
+            )
+        ]
+        widths = [max(len(line[i]) for line in [header] + lines) for i in range(len(header))]
+        rule = "  ".join("-" * width for width in widths)
+        out = [rule]
+        for i, line in enumerate([header] + lines):
+            out.append(
+                "  ".join(
+                    cell.ljust(width) if column == 0 else cell.rjust(width)
+                    for column, (cell, width) in enumerate(zip(line, widths))
+                )
+            )
+            if i == 0:
+                out.append(rule)
+        out.append(rule)
+        return "\n".join(out)
+
+
+def _peak_rss() -> int | None:
+    """Return the peak resident set size of this process, in bytes."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, and macOS reports bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
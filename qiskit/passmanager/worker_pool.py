@@ -0,0 +1,191 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""A persistent pool of worker processes for running pass managers."""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import dill
+
+from qiskit.utils.parallel import default_num_processes, _IN_PARALLEL_FORBID_PARALLELISM
+from .exceptions import PassManagerError
+
+# The number of deserialized pass managers that each worker process keeps.
+_WORKER_CACHE_SIZE = 8
+# Pass managers deserialized in this worker process, keyed by the hash of their serialization.
+_WORKER_PASS_MANAGERS = collections.OrderedDict()
+
+
+class WorkerPool:
+    """A pool of worker processes that stays alive across pass manager runs.
+
+    Pass an instance as the ``pool`` argument of :meth:`.BasePassManager.run` to run the programs
+    in its processes.  Compared with the default process-based parallelism of
+    :meth:`~.BasePassManager.run`, which starts new processes and sends the serialized pass manager
+    with every program for each call, the pool:
+
+    * starts its processes once, and reuses them for every run;
+    * serializes a pass manager and its callback once per run in the parent process, and stores
+      them in a temporary directory under the hash of their content;
+    * deserializes each distinct pass manager at most once in each worker process, and keeps the
+      most recently used ones;
+    * sends only the hash of the pass manager and the programs to the workers.  Circuits are
+      serialized with :mod:`.qpy` rather than pickled.
+
+    The pool should be shut down with :meth:`shutdown` when it is no longer needed, or used as a
+    context manager.
+
+    Example:
+
+        .. code-block:: python
+
+            from qiskit.circuit.library import quantum_volume
+            from qiskit.passmanager import WorkerPool
+            from qiskit.providers.fake_provider import GenericBackendV2
+            from qiskit.transpiler import generate_preset_pass_manager
+
+            pm = generate_preset_pass_manager(2, GenericBackendV2(10))
+            with WorkerPool(num_processes=4) as pool:
+                for seed in range(10):
+                    batch = [quantum_volume(8, seed=seed * 20 + i) for i in range(20)]
+                    isa = pm.run(batch, pool=pool)
+    """
+
+    def __init__(self, num_processes: int | None = None):
+        """
+        Args:
+            num_processes: The number of worker processes.  If ``None``, the return value of
+                :func:`.default_num_processes` is used.
+        """
+        self._num_processes = default_num_processes() if num_processes is None else num_processes
+        if self._num_processes < 1:
+            raise ValueError(f"num_processes must be positive, not {self._num_processes}")
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._num_processes, initializer=_initialize_worker
+        )
+        self._directory = tempfile.mkdtemp(prefix="qiskit-pass-managers-")
+        self._written = set()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def num_processes(self) -> int:
+        """The number of worker processes."""
+        return self._num_processes
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.shutdown()
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker processes and remove the stored pass managers.
+
+        Args:
+            wait: Whether to wait for the running tasks to finish.
+        """
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    def _store(self, pass_manager, callback) -> str:
+        """Store the serialized pass manager and callback, and return their key."""
+        payload = dill.dumps((pass_manager, callback))
+        key = hashlib.sha256(payload).hexdigest()
+        with self._lock:
+            if self._closed:
+                raise PassManagerError("The worker pool has been shut down.")
+            if key not in self._written:
+                path = os.path.join(self._directory, key)
+                with open(f"{path}.tmp", "wb") as fptr:
+                    fptr.write(payload)
+                os.replace(f"{path}.tmp", path)
+                self._written.add(key)
+        return key
+
+    def _submitter(self, pass_manager, callback, task_kwargs):
+        """Return a function that submits a program to the pool, and returns its future."""
+        key = self._store(pass_manager, callback)
+        path = os.path.join(self._directory, key)
+
+        def submit(program):
+            return self._executor.submit(
+                _run_in_worker, (key, path, pass_manager._serialize_program(program), task_kwargs)
+            )
+
+        return submit
+
+    def _map(self, pass_manager, callback, programs, task_kwargs):
+        key = self._store(pass_manager, callback)
+        path = os.path.join(self._directory, key)
+        chunksize = max(1, len(programs) // (4 * self._num_processes))
+        return self._executor.map(
+            _run_in_worker,
+            (
+                (key, path, pass_manager._serialize_program(program), task_kwargs)
+                for program in programs
+            ),
+            chunksize=chunksize,
+        )
+
+
+def _initialize_worker():
+    # Forbid nested process-based parallelism in the workers, like `parallel_map` does.
+    os.environ["QISKIT_IN_PARALLEL"] = _IN_PARALLEL_FORBID_PARALLELISM
+
+
+def _load_pass_manager(key: str, path: str):
+    try:
+        _WORKER_PASS_MANAGERS.move_to_end(key)
+        return _WORKER_PASS_MANAGERS[key]
+    except KeyError:
+        pass
+    with open(path, "rb") as fptr:
+        loaded = dill.loads(fptr.read())
+    _WORKER_PASS_MANAGERS[key] = loaded
+    if len(_WORKER_PASS_MANAGERS) > _WORKER_CACHE_SIZE:
+        _WORKER_PASS_MANAGERS.popitem(last=False)
+    return loaded
+
+
+def _run_in_worker(work_item):
+    # pylint: disable=cyclic-import
+    from .passmanager import _run_workflow
+    from .profiling import PassManagerProfiler
+
+    key, path, program_bin, task_kwargs = work_item
+    pass_manager, callback = _load_pass_manager(key, path)
+    profile_ir_metrics = task_kwargs["profile_ir_metrics"]
+    profiler = (
+        None if profile_ir_metrics is None else PassManagerProfiler(ir_metrics=profile_ir_metrics)
+    )
+    out = _run_workflow(
+        program=pass_manager._deserialize_program(program_bin),
+        pass_manager=pass_manager,
+        initial_property_set=task_kwargs["initial_property_set"],
+        profiler=profiler,
+        callback=callback,
+    )
+    return (
+        pass_manager._serialize_program(out),
+        None if profiler is None else profiler.profiles,
+    )
@@ -92,6 +92,26 @@ class BaseEstimatorV2(ABC):
             A job object that contains results.
         """
 
+    async def run_async(
+        self, pubs: Iterable[EstimatorPubLike], *, precision: float | None = None
+    ) -> PrimitiveResult[PubResult]:
+        """Estimate expectation values for each pub, without blocking the running event loop.
+
+        This submits the pubs with :meth:`run` and awaits the result of the returned job, see
+        :meth:`.BasePrimitiveJob.result_async`.
+
+        Args:
+            pubs: An iterable of pub-like objects, such as tuples ``(circuit, observables)``
+                  or ``(circuit, observables, parameter_values)``.
+            precision: The target precision for expectation value estimates of each
+                       run Estimator Pub that does not specify its own precision. If None
+                       the estimator's default precision value will be used.
+
+        Returns:
+            The Estimator's result.
+        """
+        return await self.run(pubs, precision=precision).result_async()
+
 
 class BaseEstimatorV1(BasePrimitiveV1, Generic[T]):
     r"""Base class for ``EstimatorV1`` implementations.
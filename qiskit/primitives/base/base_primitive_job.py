@@ -13,6 +13,7 @@
 Primitive job abstract base class
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar, Union
 
@@ -45,6 +46,21 @@ class BasePrimitiveJob(ABC, Generic[ResultT, StatusT]):
         """Return the results of the job."""
         raise NotImplementedError("Subclass of BasePrimitiveJob must implement `result` method.")
 
+    async def result_async(self) -> ResultT:
+        """Return the results of the job, without blocking the running event loop.
+
+        Jobs can also be awaited directly, i.e. ``await job`` is equivalent to
+        ``await job.result_async()``.
+
+        The default implementation waits for :meth:`result` in the default executor of the running
+        event loop.  Subclasses that are backed by a :class:`~concurrent.futures.Future` should
+        override this to await the future without using another thread.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self.result)
+
+    def __await__(self):
+        return self.result_async().__await__()
+
     @abstractmethod
     def status(self) -> StatusT:
         """Return the status of the job."""
@@ -73,6 +73,26 @@ class BaseSamplerV2(ABC):
             The job object of Sampler's result.
         """
 
+    async def run_async(
+        self, pubs: Iterable[SamplerPubLike], *, shots: int | None = None
+    ) -> PrimitiveResult[SamplerPubResult]:
+        """Run and collect samples from each pub, without blocking the running event loop.
+
+        This submits the pubs with :meth:`run` and awaits the result of the returned job, see
+        :meth:`.BasePrimitiveJob.result_async`.
+
+        Args:
+            pubs: An iterable of pub-like objects. For example, a list of circuits
+                  or tuples ``(circuit, parameter_values)``.
+            shots: The total number of shots to sample for each sampler pub that does
+                   not specify its own shots. If ``None``, the primitive's default
+                   shots value will be used, which can vary by implementation.
+
+        Returns:
+            The Sampler's result.
+        """
+        return await self.run(pubs, shots=shots).result_async()
+
 
 class BaseSamplerV1(BasePrimitiveV1, Generic[T]):
     r"""Sampler V1 base class
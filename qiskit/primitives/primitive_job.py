@@ -13,11 +13,13 @@
 Job for the reference implementations of Primitives V1 and V2.
 """
 
+import asyncio
 import uuid
 from concurrent.futures import ThreadPoolExecutor
 
 from qiskit.providers import JobError, JobStatus
 from qiskit.providers.jobstatus import JOB_FINAL_STATES
+from qiskit.utils.job_executor import get_job_executor
 
 from .base.base_primitive_job import BasePrimitiveJob, ResultT
 
@@ -25,6 +27,9 @@ from .base.base_primitive_job import BasePrimitiveJob, ResultT
 class PrimitiveJob(BasePrimitiveJob[ResultT, JobStatus]):
     """
     Primitive job class for the reference implementations of Primitives.
+
+    Each job is run in its own new thread, unless a shared executor was set with
+    :func:`~qiskit.utils.set_job_executor`, in which case jobs are queued on that executor.
     """
 
     def __init__(self, function, *args, **kwargs):
@@ -44,6 +49,9 @@ class PrimitiveJob(BasePrimitiveJob[ResultT, JobStatus]):
         if self._future is not None:
             raise JobError("Primitive job has been submitted already.")
 
+        if (shared_executor := get_job_executor()) is not None:
+            self._future = shared_executor.submit(self._function, *self._args, **self._kwargs)
+            return
         executor = ThreadPoolExecutor(max_workers=1)  # pylint: disable=consider-using-with
         self._future = executor.submit(self._function, *self._args, **self._kwargs)
         executor.shutdown(wait=False)
@@ -65,6 +73,12 @@ class PrimitiveJob(BasePrimitiveJob[ResultT, JobStatus]):
             self._result = self._future.result()
         return self._result
 
+    async def result_async(self) -> ResultT:
+        if self._result is None:
+            self._check_submitted()
+            self._result = await asyncio.wrap_future(self._future)
+        return self._result
+
     def status(self) -> JobStatus:
         if self._status is None:
             self._check_submitted()
@@ -15,17 +15,28 @@ Statevector Estimator V2 class
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Iterable
+from concurrent.futures import Executor
 
 import numpy as np
 
-from qiskit.quantum_info import SparsePauliOp
+from qiskit.circuit import Gate, QuantumCircuit
+from qiskit.quantum_info import Pauli, SparsePauliOp, StabilizerState, Statevector
+from qiskit.utils import default_num_processes
 
 from .base import BaseEstimatorV2
 from .containers import DataBin, EstimatorPubLike, PrimitiveResult, PubResult
 from .containers.estimator_pub import EstimatorPub
 from .primitive_job import PrimitiveJob
-from .utils import _statevector_from_circuit
+from .utils import (
+    ExecutorLike,
+    _resolve_executor,
+    _slice_bounds,
+    _stabilizer_state_from_circuit,
+    _statevector_from_circuit,
+    _task_seeds,
+)
 
 
 class StatevectorEstimator(BaseEstimatorV2):
@@ -37,6 +48,10 @@ class StatevectorEstimator(BaseEstimatorV2):
     which implies that, at present, this implementation is only compatible with Pauli-based
     observables.
 
+    Bound circuits that only contain Clifford operations are simulated with
+    :class:`~.StabilizerState` instead, in polynomial time, unless ``use_stabilizer_state`` is
+    ``False``.
+
     Each tuple of ``(circuit, observables, <optional> parameter values, <optional> precision)``,
     called an estimator primitive unified bloc (PUB), produces its own array-based result. The
     :meth:`~.EstimatorV2.run` method can be given a sequence of pubs to run in one call.
@@ -48,6 +63,23 @@ class StatevectorEstimator(BaseEstimatorV2):
         The stochastic result can be made reproducible by setting ``seed``, e.g.,
         ``StatevectorEstimator(seed=123)``.
 
+    .. note::
+        Setting ``batched=True`` enables a vectorized execution mode aimed at large parameter
+        sweeps. In this mode each bound circuit of a pub is simulated exactly once, identical
+        observables are grouped together, and the expectation values of every Pauli term are
+        evaluated for chunks of parameter bindings at once with NumPy. The chunks are sized so
+        that evaluating one takes about ``max_state_cache_bytes`` of memory. The results match the
+        default mode for circuits that only contain unitary operations. For circuits with resets, one
+        state is sampled per parameter binding rather than per broadcast index, so seeded results
+        differ from the default mode.
+
+    .. note::
+        When a pub broadcasts a parameter binding against several observables, the final state of
+        the bound circuit is simulated once and reused for all of these observables. Simulated
+        states are kept in a least-recently-used cache whose size is bounded by
+        ``max_state_cache_bytes``. Circuits containing resets are not cached, because their final
+        state is stochastic.
+
     .. plot::
         :alt: Output from the previous code.
         :include-source:
@@ -111,16 +143,45 @@ class StatevectorEstimator(BaseEstimatorV2):
     """
 
     def __init__(
-        self, *, default_precision: float = 0.0, seed: np.random.Generator | int | None = None
+        self,
+        *,
+        default_precision: float = 0.0,
+        seed: np.random.Generator | int | None = None,
+        batched: bool = False,
+        max_state_cache_bytes: int = 2**28,
+        executor: ExecutorLike = None,
+        use_stabilizer_state: bool = True,
     ):
         """
         Args:
             default_precision: The default precision for the estimator if not specified during run.
             seed: The seed or Generator object for random number generation.
                 If None, a random seeded default RNG will be used.
+            batched: Whether to use the vectorized execution mode, which simulates each bound
+                circuit of a pub once and evaluates all of its observables together.
+            max_state_cache_bytes: The memory budget, in bytes, of the cache of simulated states
+                that is used to reuse a state across the observables of a pub. Set this to 0 to
+                disable the cache. In the vectorized execution mode, this is instead the budget
+                for the states that are evaluated together.
+            executor: How to distribute the work of a :meth:`run` call. If None, pubs are run
+                serially in the job thread. If ``"process"``, pubs are spread across a process
+                pool, with :func:`~qiskit.utils.default_num_processes` workers, that is shared and
+                reused by all the reference primitives. Any :class:`~concurrent.futures.Executor`
+                can also be given. Pubs with exact results, i.e. without precision and resets, are
+                further split into slices of their parameter bindings. Results are deterministic
+                for a given integer seed, and are the same as in serial execution. If ``seed`` is
+                a Generator, one seed per task is drawn from it, so that results are deterministic
+                but differ from serial execution.
+            use_stabilizer_state: Whether to simulate bound circuits that only contain Clifford
+                operations with :class:`.StabilizerState` rather than :class:`.Statevector`, which
+                takes polynomial rather than exponential time in the number of qubits.
         """
         self._default_precision = default_precision
         self._seed = seed
+        self._batched = batched
+        self._max_state_cache_bytes = max_state_cache_bytes
+        self._executor = executor
+        self._use_stabilizer_state = use_stabilizer_state
 
     @property
     def default_precision(self) -> float:
@@ -132,6 +193,21 @@ class StatevectorEstimator(BaseEstimatorV2):
         """Return the seed or Generator object for random number generation."""
         return self._seed
 
+    @property
+    def batched(self) -> bool:
+        """Return whether the vectorized execution mode is used."""
+        return self._batched
+
+    @property
+    def max_state_cache_bytes(self) -> int:
+        """Return the memory budget, in bytes, of the cache of simulated states."""
+        return self._max_state_cache_bytes
+
+    @property
+    def use_stabilizer_state(self) -> bool:
+        """Return whether Clifford circuits are simulated with :class:`.StabilizerState`."""
+        return self._use_stabilizer_state
+
     def run(
         self, pubs: Iterable[EstimatorPubLike], *, precision: float | None = None
     ) -> PrimitiveJob[PrimitiveResult[PubResult]]:
@@ -144,22 +220,60 @@ class StatevectorEstimator(BaseEstimatorV2):
         return job
 
     def _run(self, pubs: list[EstimatorPub]) -> PrimitiveResult[PubResult]:
-        return PrimitiveResult([self._run_pub(pub) for pub in pubs], metadata={"version": 2})
+        executor = _resolve_executor(self._executor)
+        if executor is None:
+            results = [self._run_pub(pub) for pub in pubs]
+        else:
+            results = self._run_pubs_in_executor(pubs, executor)
+        return PrimitiveResult(results, metadata={"version": 2})
+
+    def _run_pubs_in_executor(
+        self, pubs: list[EstimatorPub], executor: Executor
+    ) -> list[PubResult]:
+        tasks = []
+        for i, pub in enumerate(pubs):
+            # Only exact pubs can be split, because the random number stream of a pub
+            # would otherwise depend on how it is split.
+            if pub.precision == 0 and not _has_reset(pub.circuit):
+                tasks.extend((i, sliced) for sliced in _split_pub(pub, default_num_processes()))
+            else:
+                tasks.append((i, pub))
+        seeds = _task_seeds(self._seed, len(tasks))
+        options = {
+            "batched": self._batched,
+            "max_state_cache_bytes": self._max_state_cache_bytes,
+            "use_stabilizer_state": self._use_stabilizer_state,
+        }
+        futures = [
+            executor.submit(_run_pub_task, seed, options, sliced)
+            for seed, (_, sliced) in zip(seeds, tasks)
+        ]
+        slice_results = [[] for _ in pubs]
+        for (i, _), future in zip(tasks, futures):
+            slice_results[i].append(future.result())
+        return [_join_pub_results(results) for results in slice_results]
 
     def _run_pub(self, pub: EstimatorPub) -> PubResult:
+        if self._batched:
+            return self._run_pub_batched(pub)
         rng = np.random.default_rng(self._seed)
         circuit = pub.circuit
         observables = pub.observables
         parameter_values = pub.parameter_values
         precision = pub.precision
-        bound_circuits = parameter_values.bind_all(circuit)
-        bc_circuits, bc_obs = np.broadcast_arrays(bound_circuits, observables)
-        evs = np.zeros_like(bc_circuits, dtype=np.float64)
-        stds = np.zeros_like(bc_circuits, dtype=np.float64)
-        for index in np.ndindex(*bc_circuits.shape):
-            bound_circuit = bc_circuits[index]
+        bound_circuits = parameter_values.bind_all(circuit).reshape(-1)
+        binding_index = np.arange(parameter_values.size).reshape(parameter_values.shape)
+        bc_binding_index, bc_obs = np.broadcast_arrays(binding_index, observables)
+        evs = np.zeros_like(bc_binding_index, dtype=np.float64)
+        stds = np.zeros_like(bc_binding_index, dtype=np.float64)
+        cache = _StateCache(self._max_state_cache_bytes if not _has_reset(circuit) else 0)
+        for index in np.ndindex(*bc_binding_index.shape):
+            binding = bc_binding_index[index]
             observable = bc_obs[index]
-            final_state = _statevector_from_circuit(bound_circuit, rng)
+            final_state = cache.get(binding)
+            if final_state is None:
+                final_state = self._final_state(bound_circuits[binding], rng)
+                cache.put(binding, final_state)
             paulis, coeffs = zip(*observable.items())
             obs = SparsePauliOp(paulis, coeffs)  # TODO: support non Pauli operators
             expectation_value = np.real_if_close(final_state.expectation_value(obs))
@@ -173,3 +287,206 @@ class StatevectorEstimator(BaseEstimatorV2):
         return PubResult(
             data, metadata={"target_precision": precision, "circuit_metadata": pub.circuit.metadata}
         )
+
+    def _run_pub_batched(self, pub: EstimatorPub) -> PubResult:
+        rng = np.random.default_rng(self._seed)
+        circuit = pub.circuit
+        observables = pub.observables
+        parameter_values = pub.parameter_values
+        precision = pub.precision
+
+        # Map every broadcast index to the flat index of its binding and of its observable.
+        binding_index = np.arange(parameter_values.size).reshape(parameter_values.shape)
+        observable_index = np.arange(observables.size).reshape(observables.shape)
+        binding_index, observable_index = np.broadcast_arrays(binding_index, observable_index)
+
+        # Group identical observables, and collect the distinct Pauli terms over all of them.
+        distinct_observables = {}
+        observable_group = np.empty(observables.size, dtype=np.intp)
+        for i, observable in enumerate(np.asarray(observables.ravel())):
+            key = tuple(sorted(observable.items()))
+            observable_group[i] = distinct_observables.setdefault(key, len(distinct_observables))
+        paulis = {}
+        for key in distinct_observables:
+            for pauli, _ in key:
+                paulis.setdefault(pauli, len(paulis))
+        coeffs = np.zeros((len(distinct_observables), len(paulis)), dtype=np.float64)
+        for key, row in distinct_observables.items():
+            for pauli, coeff in key:
+                coeffs[row, paulis[pauli]] = coeff
+
+        # Simulate each bound circuit only once.  The states are simulated and evaluated in chunks,
+        # so that only the expectation values are kept for all the bindings.  Evaluating a chunk
+        # takes about three times the size of its states, which is kept within the state cache
+        # budget.
+        bound_circuits = parameter_values.bind_all(circuit).reshape(-1)
+        dim = 2**circuit.num_qubits
+        chunk_size = max(1, self._max_state_cache_bytes // (3 * 16 * dim))
+        states = np.empty((min(chunk_size, bound_circuits.size), dim), dtype=complex)
+        pauli_evs = np.empty((bound_circuits.size, len(paulis)), dtype=complex)
+        for start in range(0, bound_circuits.size, chunk_size):
+            dense = []
+            for i in range(start, min(start + chunk_size, bound_circuits.size)):
+                state = self._final_state(bound_circuits[i], rng)
+                if isinstance(state, StabilizerState):
+                    pauli_evs[i] = [state.expectation_value(Pauli(pauli)) for pauli in paulis]
+                else:
+                    states[len(dense)] = state.data
+                    dense.append(i)
+            if dense:
+                pauli_evs[dense] = _pauli_expectation_values(states[: len(dense)], list(paulis))
+
+        # Shape (num bindings, num distinct observables).
+        grouped_evs = pauli_evs @ coeffs.T
+        evs = np.real_if_close(grouped_evs[binding_index, observable_group[observable_index]])
+        if precision != 0:
+            if not np.isrealobj(evs):
+                raise ValueError("Given operator is not Hermitian and noise cannot be added.")
+            evs = rng.normal(evs, precision)
+        evs = np.asarray(evs.real, dtype=np.float64)
+        stds = np.zeros_like(evs)
+
+        data = DataBin(evs=evs, stds=stds, shape=evs.shape)
+        return PubResult(
+            data, metadata={"target_precision": precision, "circuit_metadata": pub.circuit.metadata}
+        )
+
+    def _final_state(
+        self, circuit: QuantumCircuit, rng: np.random.Generator
+    ) -> Statevector | StabilizerState:
+        """Simulate a bound circuit, as a stabilizer state if possible."""
+        if self._use_stabilizer_state:
+            state = _stabilizer_state_from_circuit(circuit)
+            if state is not None:
+                return state
+        return _statevector_from_circuit(circuit, rng)
+
+
+def _run_pub_task(
+    seed: np.random.Generator | int | None, options: dict, pub: EstimatorPub
+) -> PubResult:
+    return StatevectorEstimator(seed=seed, **options)._run_pub(pub)
+
+
+def _split_pub(pub: EstimatorPub, num_slices: int) -> list[EstimatorPub]:
+    """Split a pub along its leading axis, if its parameter bindings span that axis.
+
+    Pubs whose bindings are broadcast along the leading axis are not split, so that each binding
+    is still simulated only once.
+    """
+    shape = pub.shape
+    if not shape or shape[0] < 2 or num_slices < 2:
+        return [pub]
+    parameter_values = pub.parameter_values
+    parameter_values = parameter_values.reshape(
+        (1,) * (len(shape) - parameter_values.ndim) + parameter_values.shape
+    )
+    if parameter_values.shape[0] != shape[0]:
+        return [pub]
+    observables = pub.observables
+    observables = observables.reshape((1,) * (len(shape) - observables.ndim) + observables.shape)
+    return [
+        EstimatorPub(
+            pub.circuit,
+            observables if observables.shape[0] == 1 else observables[start:stop],
+            parameter_values[start:stop],
+            pub.precision,
+            validate=False,
+        )
+        for start, stop in _slice_bounds(shape[0], num_slices)
+    ]
+
+
+def _join_pub_results(results: list[PubResult]) -> PubResult:
+    """Join the results of slices of a pub along its leading axis."""
+    if len(results) == 1:
+        return results[0]
+    evs = np.concatenate([result.data.evs for result in results])
+    stds = np.concatenate([result.data.stds for result in results])
+    return PubResult(DataBin(evs=evs, stds=stds, shape=evs.shape), metadata=results[0].metadata)
+
+
+class _StateCache:
+    """A least-recently-used cache of simulated states, keyed by binding index.
+
+    Args:
+        max_bytes: The maximum total size of the cached statevector data.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._num_bytes = 0
+        self._states: OrderedDict[int, Statevector | StabilizerState] = OrderedDict()
+
+    def get(self, key: int) -> Statevector | StabilizerState | None:
+        """Return the cached state for ``key``, or ``None`` if there is none."""
+        state = self._states.get(key)
+        if state is not None:
+            self._states.move_to_end(key)
+        return state
+
+    def put(self, key: int, state: Statevector | StabilizerState):
+        """Cache ``state`` for ``key``, evicting the least recently used states if needed."""
+        num_bytes = _state_nbytes(state)
+        if num_bytes > self._max_bytes:
+            return
+        while self._num_bytes + num_bytes > self._max_bytes:
+            _, evicted = self._states.popitem(last=False)
+            self._num_bytes -= _state_nbytes(evicted)
+        self._states[key] = state
+        self._num_bytes += num_bytes
+
+
+def _state_nbytes(state: Statevector | StabilizerState) -> int:
+    """Return the size of the data of a simulated state."""
+    if isinstance(state, StabilizerState):
+        return state.clifford.tableau.nbytes
+    return state.data.nbytes
+
+
+def _has_reset(circuit: QuantumCircuit) -> bool:
+    """Return whether a circuit contains a reset, including within instruction definitions."""
+    for instruction in circuit.data:
+        operation = instruction.operation
+        if operation.name == "reset":
+            return True
+        if isinstance(operation, Gate) or operation.name in ("barrier", "delay", "measure"):
+            continue
+        definition = getattr(operation, "definition", None)
+        if definition is not None and _has_reset(definition):
+            return True
+    return False
+
+
+def _pauli_expectation_values(states: np.ndarray, paulis: list[str]) -> np.ndarray:
+    """Return the expectation values of Pauli strings for a batch of states.
+
+    Args:
+        states: A complex array of shape ``(num_states, 2**num_qubits)``.
+        paulis: A list of Pauli labels without phase, such as ``"IXYZ"``.
+
+    Returns:
+        A complex array of shape ``(num_states, len(paulis))``.
+    """
+    num_states, dim = states.shape
+    indices = np.arange(dim)
+    num_qubits = dim.bit_length() - 1
+    bits = [(indices >> qubit) & 1 for qubit in range(num_qubits)]
+    conj_states = states.conj()
+    evs = np.empty((num_states, len(paulis)), dtype=complex)
+    for k, pauli in enumerate(paulis):
+        x_mask = 0
+        num_y = 0
+        # For a Pauli with X support ``x`` and Z support ``z``, ``P|j> = i^num_y (-1)^|j & z| |j ^ x>``.
+        parity = np.zeros(dim, dtype=indices.dtype)
+        for qubit, char in enumerate(reversed(pauli)):
+            if char in "XY":
+                x_mask |= 1 << qubit
+            if char in "YZ":
+                parity ^= bits[qubit] ^ ((x_mask >> qubit) & 1)
+            if char == "Y":
+                num_y += 1
+        shifted = states[:, indices ^ x_mask]
+        shifted *= 1 - 2 * parity
+        evs[:, k] = (1, 1j, -1, -1j)[num_y % 4] * np.einsum("ij,ij->i", conj_states, shifted)
+    return evs
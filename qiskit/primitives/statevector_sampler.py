@@ -16,6 +16,7 @@ Statevector Sampler V2 class
 from __future__ import annotations
 
 import warnings
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from typing import Iterable
 
@@ -23,7 +24,8 @@ import numpy as np
 from numpy.typing import NDArray
 
 from qiskit import ClassicalRegister, QiskitError, QuantumCircuit
-from qiskit.quantum_info import Statevector
+from qiskit.quantum_info import StabilizerState, Statevector
+from qiskit.utils import default_num_processes
 
 from .base import BaseSamplerV2
 from .base.validation_v1 import _has_measure
@@ -37,7 +39,14 @@ from .containers import (
 from .containers.sampler_pub import SamplerPub
 from .containers.bit_array import _min_num_bytes
 from .primitive_job import PrimitiveJob
-from .utils import bound_circuit_to_instruction
+from .utils import (
+    ExecutorLike,
+    _resolve_executor,
+    _slice_bounds,
+    _stabilizer_state_from_circuit,
+    _task_seeds,
+    bound_circuit_to_instruction,
+)
 
 
 @dataclass
@@ -54,7 +63,9 @@ class StatevectorSampler(BaseSamplerV2):
 
     This class is implemented via :class:`~.Statevector` which turns provided circuits into
     pure state vectors, and is therefore incompatible with mid-circuit measurements (although
-    other implementations may be).
+    other implementations may be). If ``use_stabilizer_state`` is ``True``, bound circuits that
+    only contain Clifford operations are simulated with :class:`~.StabilizerState` instead, in
+    polynomial time.
 
     As seen in the example below, this sampler supports providing arrays of parameter value sets to
     bind against a single circuit.
@@ -133,15 +144,38 @@ class StatevectorSampler(BaseSamplerV2):
 
     """
 
-    def __init__(self, *, default_shots: int = 1024, seed: np.random.Generator | int | None = None):
+    def __init__(
+        self,
+        *,
+        default_shots: int = 1024,
+        seed: np.random.Generator | int | None = None,
+        executor: ExecutorLike = None,
+        use_stabilizer_state: bool = False,
+    ):
         """
         Args:
             default_shots: The default shots for the sampler if not specified during run.
             seed: The seed or Generator object for random number generation.
                 If None, a random seeded default RNG will be used.
+            executor: How to distribute the work of a :meth:`run` call. If None, pubs are run
+                serially in the job thread. If ``"process"``, pubs and slices of their parameter
+                bindings are spread across a process pool, with
+                :func:`~qiskit.utils.default_num_processes` workers, that is shared and reused by
+                all the reference primitives. Any :class:`~concurrent.futures.Executor` can also
+                be given. Results are deterministic for a given integer seed, and are the same as
+                in serial execution. If ``seed`` is a Generator, one seed per task is drawn from
+                it, so that results are deterministic but differ from serial execution.
+            use_stabilizer_state: Whether to simulate bound circuits that only contain Clifford
+                operations with :class:`.StabilizerState` rather than :class:`.Statevector`, which
+                takes polynomial rather than exponential time in the number of qubits.  The
+                outcomes follow the same distribution, but they are drawn differently from the
+                random number generator, so the samples for a fixed ``seed`` differ from those
+                of dense simulation.
         """
         self._default_shots = default_shots
         self._seed = seed
+        self._executor = executor
+        self._use_stabilizer_state = use_stabilizer_state
 
     @property
     def default_shots(self) -> int:
@@ -153,6 +187,11 @@ class StatevectorSampler(BaseSamplerV2):
         """Return the seed or Generator object for random number generation."""
         return self._seed
 
+    @property
+    def use_stabilizer_state(self) -> bool:
+        """Return whether Clifford circuits are simulated with :class:`.StabilizerState`."""
+        return self._use_stabilizer_state
+
     def run(
         self, pubs: Iterable[SamplerPubLike], *, shots: int | None = None
     ) -> PrimitiveJob[PrimitiveResult[SamplerPubResult]]:
@@ -171,9 +210,39 @@ class StatevectorSampler(BaseSamplerV2):
         return job
 
     def _run(self, pubs: Iterable[SamplerPub]) -> PrimitiveResult[SamplerPubResult]:
-        results = [self._run_pub(pub) for pub in pubs]
+        executor = _resolve_executor(self._executor)
+        if executor is None:
+            results = [self._run_pub(pub) for pub in pubs]
+        else:
+            results = self._run_pubs_in_executor(list(pubs), executor)
         return PrimitiveResult(results, metadata={"version": 2})
 
+    def _run_pubs_in_executor(
+        self, pubs: list[SamplerPub], executor: Executor
+    ) -> list[SamplerPubResult]:
+        # Each binding is sampled with a fresh RNG from the seed, so that slicing the bindings of a
+        # pub across tasks gives the same result as serial execution.
+        tasks = []
+        for i, pub in enumerate(pubs):
+            if pub.size < 2 or not pub.parameter_values.data:
+                tasks.append((i, pub))
+                continue
+            parameter_values = pub.parameter_values.ravel()
+            for start, stop in _slice_bounds(pub.size, default_num_processes()):
+                sliced = SamplerPub(
+                    pub.circuit, parameter_values[start:stop], pub.shots, validate=False
+                )
+                tasks.append((i, sliced))
+        seeds = _task_seeds(self._seed, len(tasks))
+        futures = [
+            executor.submit(_run_pub_task, seed, self._use_stabilizer_state, sliced)
+            for seed, (_, sliced) in zip(seeds, tasks)
+        ]
+        slice_results = [[] for _ in pubs]
+        for (i, _), future in zip(tasks, futures):
+            slice_results[i].append(future.result())
+        return [_join_pub_results(pub, res) for pub, res in zip(pubs, slice_results)]
+
     def _run_pub(self, pub: SamplerPub) -> SamplerPubResult:
         circuit, qargs, meas_info = _preprocess_circuit(pub.circuit)
         bound_circuits = pub.parameter_values.bind_all(circuit)
@@ -184,16 +253,32 @@ class StatevectorSampler(BaseSamplerV2):
             for item in meas_info
         }
         for index, bound_circuit in np.ndenumerate(bound_circuits):
+            if isinstance(self._seed, np.random.Generator):
+                rng = self._seed
+            else:
+                rng = np.random.default_rng(self._seed)
+            stabilizer_state = None
+            if self._use_stabilizer_state:
+                stabilizer_state = _stabilizer_state_from_circuit(bound_circuit)
+            if stabilizer_state is not None:
+                bits = _sample_stabilizer_state(stabilizer_state, qargs, pub.shots, rng)
+                for item in meas_info:
+                    arrays[item.creg_name][index] = _bits_to_packed_array(
+                        bits, item.num_bytes, item.qreg_indices
+                    )
+                continue
             final_state = Statevector(bound_circuit_to_instruction(bound_circuit))
-            final_state.seed(self._seed)
+            # This matches the random number stream of `Statevector.sample_memory` after
+            # `Statevector.seed(self._seed)`, but draws outcome indices instead of bitstrings.
             if qargs:
-                samples = final_state.sample_memory(shots=pub.shots, qargs=qargs)
+                probs = final_state.probabilities(qargs)
+                outcomes = rng.choice(len(probs), p=probs, size=pub.shots)
             else:
-                samples = [""] * pub.shots
-            samples_array = np.array([np.fromiter(sample, dtype=np.uint8) for sample in samples])
+                outcomes = np.zeros(pub.shots, dtype=np.int64)
             for item in meas_info:
-                ary = _samples_to_packed_array(samples_array, item.num_bits, item.qreg_indices)
-                arrays[item.creg_name][index] = ary
+                arrays[item.creg_name][index] = _outcomes_to_packed_array(
+                    outcomes, item.num_bytes, item.qreg_indices
+                )
 
         meas = {
             item.creg_name: BitArray(arrays[item.creg_name], item.num_bits) for item in meas_info
@@ -204,6 +289,24 @@ class StatevectorSampler(BaseSamplerV2):
         )
 
 
+def _run_pub_task(
+    seed: np.random.Generator | int | None, use_stabilizer_state: bool, pub: SamplerPub
+) -> SamplerPubResult:
+    return StatevectorSampler(seed=seed, use_stabilizer_state=use_stabilizer_state)._run_pub(pub)
+
+
+def _join_pub_results(pub: SamplerPub, results: list[SamplerPubResult]) -> SamplerPubResult:
+    """Join the results of slices of the flattened parameter bindings of ``pub``."""
+    if len(results) == 1:
+        meas = {name: results[0].data[name].reshape(pub.shape) for name in results[0].data}
+    else:
+        meas = {
+            name: BitArray.concatenate([result.data[name] for result in results]).reshape(pub.shape)
+            for name in results[0].data
+        }
+    return SamplerPubResult(DataBin(**meas, shape=pub.shape), metadata=results[0].metadata)
+
+
 def _preprocess_circuit(circuit: QuantumCircuit):
     num_bits_dict = {creg.name: creg.size for creg in circuit.cregs}
     mapping = _final_measurement_mapping(circuit)
@@ -232,22 +335,116 @@ def _preprocess_circuit(circuit: QuantumCircuit):
     return circuit, qargs, meas_info
 
 
-def _samples_to_packed_array(
-    samples: NDArray[np.uint8], num_bits: int, indices: list[int]
+def _outcomes_to_packed_array(
+    outcomes: NDArray[np.integer], num_bytes: int, indices: list[int]
+) -> NDArray[np.uint8]:
+    # bit ``q`` of an outcome index is the measurement result of ``qargs[q]``.
+    # The sentinel index ``len(qargs)`` introduced by _preprocess_circuit is always 0
+    # since outcomes are smaller than ``2 ** len(qargs)``.
+    ary = np.zeros((len(outcomes), num_bytes), dtype=np.uint8)
+    for clbit, qarg in enumerate(indices):
+        # pack bits in big endian order, i.e., clbit 0 is the lowest bit of the last byte
+        bit = ((outcomes >> qarg) & 1).astype(np.uint8)
+        ary[:, num_bytes - 1 - clbit // 8] |= bit << (clbit % 8)
+    return ary
+
+
+def _sample_stabilizer_state(
+    state: StabilizerState, qargs: list[int], shots: int, rng: np.random.Generator
+) -> NDArray[np.bool_]:
+    """Sample computational-basis measurement outcomes of ``qargs`` from a stabilizer state.
+
+    The outcomes ``b`` are uniformly distributed over the affine subspace of solutions of
+    ``z . b = p (mod 2)``, for all the stabilizers ``(-1)^p Z^z`` of the state that only contain
+    ``I`` and ``Z``.  These stabilizers are found by Gaussian elimination of the X part of the
+    stabilizer tableau.
+
+    Returns:
+        A boolean array of shape ``(shots, len(qargs))``, whose column ``q`` holds the outcomes of
+        ``qargs[q]``.
+    """
+    clifford = state.clifford
+    num_qubits = clifford.num_qubits
+    x = clifford.stab_x.copy()
+    z = clifford.stab_z.copy()
+    phase = clifford.stab_phase.copy()
+
+    # Bring the X part to row echelon form; the remaining rows are Z-type stabilizers.
+    row = 0
+    for col in range(num_qubits):
+        candidates = np.flatnonzero(x[row:, col])
+        if candidates.size == 0:
+            continue
+        pivot = row + candidates[0]
+        for array in (x, z, phase):
+            array[[row, pivot]] = array[[pivot, row]]
+        others = np.flatnonzero(x[:, col])
+        others = others[others != row]
+        phase[others] = _product_phases(
+            x[row], z[row], phase[row], x[others], z[others], phase[others]
+        )
+        x[others] ^= x[row]
+        z[others] ^= z[row]
+        row += 1
+        if row == num_qubits:
+            break
+    z, phase = z[row:], phase[row:]
+
+    # Solve z . b = phase by bringing the Z part to reduced row echelon form.
+    pivot_cols = []
+    row = 0
+    for col in range(num_qubits):
+        candidates = np.flatnonzero(z[row:, col])
+        if candidates.size == 0:
+            continue
+        pivot = row + candidates[0]
+        for array in (z, phase):
+            array[[row, pivot]] = array[[pivot, row]]
+        others = np.flatnonzero(z[:, col])
+        others = others[others != row]
+        z[others] ^= z[row]
+        phase[others] ^= phase[row]
+        pivot_cols.append(col)
+        row += 1
+        if row == len(z):
+            break
+    offset = np.zeros(num_qubits, dtype=bool)
+    offset[pivot_cols] = phase[: len(pivot_cols)]
+    free_cols = [col for col in range(num_qubits) if col not in set(pivot_cols)]
+    generators = np.zeros((len(free_cols), num_qubits), dtype=np.int64)
+    for i, col in enumerate(free_cols):
+        generators[i, col] = 1
+        generators[i, pivot_cols] = z[: len(pivot_cols), col]
+
+    offset = offset[qargs]
+    generators = generators[:, qargs]
+    coefficients = rng.integers(2, size=(shots, len(free_cols)))
+    return offset ^ ((coefficients @ generators) % 2).astype(bool)
+
+
+def _product_phases(x1, z1, phase1, x2, z2, phase2) -> NDArray[np.bool_]:
+    """Return the sign bits of the products of the Pauli ``(x1, z1, phase1)`` with each row of
+    ``(x2, z2, phase2)``, which must commute with it."""
+    x1, z1 = x1.astype(np.int64), z1.astype(np.int64)
+    x2, z2 = x2.astype(np.int64), z2.astype(np.int64)
+    # The exponent of i picked up by each qubit, as in Aaronson and Gottesman's rowsum.
+    exponents = x1 * z1 * (z2 - x2) + x1 * (1 - z1) * z2 * (2 * x2 - 1)
+    exponents += (1 - x1) * z1 * x2 * (1 - 2 * z2)
+    total = 2 * phase1 + 2 * phase2.astype(np.int64) + exponents.sum(axis=1)
+    return (total % 4) == 2
+
+
+def _bits_to_packed_array(
+    bits: NDArray[np.bool_], num_bytes: int, indices: list[int]
 ) -> NDArray[np.uint8]:
-    # samples of `Statevector.sample_memory` will be in the order of
-    # qubit_last, ..., qubit_1, qubit_0.
-    # reverse the sample order into qubit_0, qubit_1, ..., qubit_last and
-    # pad 0 in the rightmost to be used for the sentinel introduced by _preprocess_circuit.
-    ary = np.pad(samples[:, ::-1], ((0, 0), (0, 1)), constant_values=0)
-    # place samples in the order of clbit_last, ..., clbit_1, clbit_0
-    ary = ary[:, indices[::-1]]
-    # pad 0 in the left to align the number to be mod 8
-    # since np.packbits(bitorder='big') pads 0 to the right.
-    pad_size = -num_bits % 8
-    ary = np.pad(ary, ((0, 0), (pad_size, 0)), constant_values=0)
-    # pack bits in big endian order
-    ary = np.packbits(ary, axis=-1)
+    # column ``q`` of ``bits`` is the measurement result of ``qargs[q]``. The sentinel index
+    # ``len(qargs)`` introduced by _preprocess_circuit is always 0.
+    ary = np.zeros((len(bits), num_bytes), dtype=np.uint8)
+    for clbit, qarg in enumerate(indices):
+        if qarg == bits.shape[1]:
+            continue
+        # pack bits in big endian order, i.e., clbit 0 is the lowest bit of the last byte
+        ary[:, num_bytes - 1 - clbit // 8] |= bits[:, qarg].astype(np.uint8) << (clbit % 8)
     return ary
 
 
@@ -14,10 +14,23 @@ Utility functions for primitives
 """
 from __future__ import annotations
 
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Literal, Union
+
 import numpy as np
 
 from qiskit.circuit import Instruction, QuantumCircuit
-from qiskit.quantum_info import Statevector
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info import StabilizerState, Statevector
+from qiskit.utils import default_num_processes
+
+ExecutorLike = Union[Executor, Literal["process"], None]
+"""Types accepted by the ``executor`` option of the reference primitives."""
+
+_PROCESS_POOL: ProcessPoolExecutor | None = None
+_PROCESS_POOL_LOCK = threading.Lock()
 
 
 def _statevector_from_circuit(
@@ -40,6 +53,24 @@ def _statevector_from_circuit(
     return sv.evolve(bound_circuit_to_instruction(circuit))
 
 
+def _stabilizer_state_from_circuit(circuit: QuantumCircuit) -> StabilizerState | None:
+    """Generate a stabilizer state from a circuit, if it only contains Clifford operations.
+
+    Used in the reference primitives to simulate Clifford circuits in polynomial time.
+
+    Args:
+        circuit: The quantum circuit, with all its parameters bound.
+
+    Returns:
+        The stabilizer state, or None if the circuit contains an operation that is not
+        Clifford, such as a non-Clifford gate, a reset or a measurement.
+    """
+    try:
+        return StabilizerState(circuit)
+    except QiskitError:
+        return None
+
+
 def bound_circuit_to_instruction(circuit: QuantumCircuit) -> Instruction:
     """Build an :class:`~qiskit.circuit.Instruction` object from
     a :class:`~qiskit.circuit.QuantumCircuit`
@@ -70,3 +101,65 @@ def bound_circuit_to_instruction(circuit: QuantumCircuit) -> Instruction:
     )
     inst.definition = circuit
     return inst
+
+
+def _process_pool_initializer():
+    # Forbid nested process-based parallelism inside the workers (see `qiskit.utils.parallel`).
+    os.environ["QISKIT_IN_PARALLEL"] = "TRUE"
+
+
+def _shared_process_pool() -> ProcessPoolExecutor:
+    """Return the process pool shared by the reference primitives.
+
+    The pool is created on first use with :func:`~qiskit.utils.default_num_processes` workers,
+    and is reused by all subsequent calls.  A pool that was broken, e.g. by a worker crashing,
+    is replaced by a new one.
+    """
+    global _PROCESS_POOL  # pylint: disable=global-statement
+
+    with _PROCESS_POOL_LOCK:
+        # pylint: disable=protected-access
+        if _PROCESS_POOL is None or _PROCESS_POOL._broken:
+            _PROCESS_POOL = ProcessPoolExecutor(
+                max_workers=default_num_processes(), initializer=_process_pool_initializer
+            )
+        return _PROCESS_POOL
+
+
+def _resolve_executor(executor: ExecutorLike) -> Executor | None:
+    """Resolve the ``executor`` option of a reference primitive into an executor.
+
+    Args:
+        executor: ``None`` for serial execution, ``"process"`` for the shared process pool, or an
+            :class:`~concurrent.futures.Executor` instance.
+
+    Returns:
+        The executor to submit tasks to, or ``None`` if the tasks should be run serially.
+
+    Raises:
+        TypeError: If ``executor`` is not a valid option.
+    """
+    if executor is None or isinstance(executor, Executor):
+        return executor
+    if executor == "process":
+        return _shared_process_pool()
+    raise TypeError(f"Invalid executor: {executor!r}. Expected None, 'process' or an Executor.")
+
+
+def _task_seeds(seed: np.random.Generator | int | None, num_tasks: int) -> list:
+    """Return one seed per task to run in other workers.
+
+    Integer and ``None`` seeds are passed through unchanged, which gives the same result as the
+    serial execution.  A :class:`~numpy.random.Generator` cannot be shared across processes, so
+    an independent integer seed is drawn from it for each task, in task order, which keeps the
+    results deterministic for a given generator state.
+    """
+    if isinstance(seed, np.random.Generator):
+        return [int(x) for x in seed.integers(2**63, size=num_tasks)]
+    return [seed] * num_tasks
+
+
+def _slice_bounds(size: int, num_slices: int) -> list[tuple[int, int]]:
+    """Split ``range(size)`` into at most ``num_slices`` contiguous and non-empty slices."""
+    bounds = np.linspace(0, size, min(num_slices, size) + 1).astype(int)
+    return list(zip(bounds[:-1], bounds[1:]))
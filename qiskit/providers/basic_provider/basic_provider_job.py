@@ -13,20 +13,32 @@
 
 """This module implements the job class used by Basic Aer Provider."""
 
+import asyncio
 import warnings
+from concurrent.futures import Future
 
 from qiskit.providers import JobStatus
 from qiskit.providers.job import JobV1
 
 
 class BasicProviderJob(JobV1):
-    """BasicProviderJob class."""
+    """BasicProviderJob class.
+
+    The job either holds a result that was computed synchronously, or, when a shared executor
+    was set with :func:`~qiskit.utils.set_job_executor`, a future of the result.
+    """
 
     _async = False
 
     def __init__(self, backend, job_id, result):
         super().__init__(backend, job_id)
-        self._result = result
+        if isinstance(result, Future):
+            self._future = result
+            self._result = None
+            self._async = True
+        else:
+            self._future = None
+            self._result = result
 
     def submit(self):
         """Submit the job to the backend for execution.
@@ -39,9 +51,15 @@ class BasicProviderJob(JobV1):
     def result(self, timeout=None):
         """Get job result .
 
+        Args:
+            timeout (float): The maximum time to wait for the result, in seconds. This is only
+                meaningful if the job is run on a shared executor.
+
         Returns:
             qiskit.result.Result: Result object
         """
+        if self._future is not None:
+            return self._future.result(timeout=timeout)
         if timeout is not None:
             warnings.warn(
                 "The timeout kwarg doesn't have any meaning with "
@@ -52,13 +70,48 @@ class BasicProviderJob(JobV1):
 
         return self._result
 
+    async def result_async(self):
+        """Get the job result, without blocking the running event loop.
+
+        Jobs can also be awaited directly, i.e. ``await job`` is equivalent to
+        ``await job.result_async()``.
+
+        Returns:
+            qiskit.result.Result: Result object
+        """
+        if self._future is not None:
+            return await asyncio.wrap_future(self._future)
+        return self._result
+
+    def __await__(self):
+        return self.result_async().__await__()
+
     def status(self):
         """Gets the status of the job by querying the Python's future
 
         Returns:
             qiskit.providers.JobStatus: The current JobStatus
         """
-        return JobStatus.DONE
+        if self._future is None:
+            return JobStatus.DONE
+        if self._future.running():
+            return JobStatus.RUNNING
+        if self._future.cancelled():
+            return JobStatus.CANCELLED
+        if self._future.done():
+            return JobStatus.DONE if self._future.exception() is None else JobStatus.ERROR
+        return JobStatus.QUEUED
+
+    def cancel(self):
+        """Attempt to cancel the job.
+
+        Returns:
+            bool: Whether the job was cancelled. Only jobs that are queued on a shared executor
+            and have not started running can be cancelled.
+        """
+        if self._future is None:
+            return False
+        return self._future.cancel()
 
     def backend(self):
         """Return the instance of the backend used for this job."""
@@ -33,6 +33,7 @@ from __future__ import annotations
 
 import math
 import uuid
+import threading
 import time
 import logging
 import warnings
@@ -40,13 +41,14 @@ import warnings
 from collections import Counter
 import numpy as np
 
-from qiskit.circuit import QuantumCircuit
+from qiskit.circuit import CircuitInstruction, QuantumCircuit
 from qiskit.circuit.library import UnitaryGate
 from qiskit.circuit.library.standard_gates import get_standard_gate_name_mapping, GlobalPhaseGate
 from qiskit.providers.backend import BackendV2
 from qiskit.providers.options import Options
 from qiskit.result import Result
 from qiskit.transpiler import Target
+from qiskit.utils.job_executor import get_job_executor
 
 from .basic_provider_job import BasicProviderJob
 from .basic_provider_tools import single_gate_matrix
@@ -56,7 +58,7 @@ from .basic_provider_tools import (
     TWO_QUBIT_GATES_WITH_PARAMETERS,
     THREE_QUBIT_GATES,
 )
-from .basic_provider_tools import einsum_vecmul_index
+from .basic_provider_tools import einsum_matmul_index, einsum_vecmul_index
 from .exceptions import BasicProviderError
 
 logger = logging.getLogger(__name__)
@@ -110,6 +112,21 @@ class BasicSimulator(BackendV2):
         self._memory = self.options.get("memory")
         self._initial_statevector = self.options.get("initial_statevector")
         self._seed_simulator = self.options.get("seed_simulator")
+        self._fusion_max_qubits = self.options.get("fusion_max_qubits")
+        self._max_shared_prefix_bytes = self.options.get("max_shared_prefix_bytes")
+        # The simulation state lives on the instance, so the jobs of this instance that run on a
+        # shared executor must not overlap.
+        self._run_lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Locks cannot be copied, and a copy has its own simulation state anyway.
+        del state["_run_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._run_lock = threading.Lock()
 
     @property
     def max_circuits(self) -> None:
@@ -214,6 +231,8 @@ class BasicSimulator(BackendV2):
             memory=True,
             initial_statevector=None,
             seed_simulator=None,
+            fusion_max_qubits=None,
+            max_shared_prefix_bytes=None,
         )
 
     def _add_unitary(self, gate: np.ndarray, qubits: list[int]) -> None:
@@ -341,6 +360,211 @@ class BasicSimulator(BackendV2):
             update = [[0, 1 / math.sqrt(probability)], [0, 0]]
             self._add_unitary(update, [qubit])
 
+    def _add_operation(
+        self,
+        circuit: QuantumCircuit,
+        operation: CircuitInstruction,
+        measure_sample_ops: list[tuple[int, int]] | None,
+    ) -> None:
+        """Apply a single instruction of a circuit to the current statevector.
+
+        Args:
+            circuit: the circuit the instruction belongs to.
+            operation: the instruction to apply.
+            measure_sample_ops: the list to record (qubit, cmembit) pairs of measurements into,
+                if measurements are sampled from the final statevector.
+
+        Raises:
+            BasicProviderError: if the instruction is not recognized.
+        """
+        if operation.name == "unitary":
+            qubits = [circuit.find_bit(bit).index for bit in operation.qubits]
+            gate = operation.operation.params[0]
+            self._add_unitary(gate, qubits)
+        elif operation.name in ("id", "u0", "delay"):
+            pass
+        elif operation.name == "global_phase":
+            params = getattr(operation, "params", None)
+            gate = GlobalPhaseGate(*params).to_matrix()
+            self._add_unitary(gate, [])
+        # Check if single qubit gate
+        elif operation.name in SINGLE_QUBIT_GATES:
+            params = getattr(operation, "params", None)
+            qubit = [circuit.find_bit(bit).index for bit in operation.qubits][0]
+            gate = single_gate_matrix(operation.name, params)
+            self._add_unitary(gate, [qubit])
+        elif operation.name in TWO_QUBIT_GATES_WITH_PARAMETERS:
+            params = getattr(operation, "params", None)
+            qubits = [circuit.find_bit(bit).index for bit in operation.qubits]
+            qubit0 = qubits[0]
+            qubit1 = qubits[1]
+            gate = TWO_QUBIT_GATES_WITH_PARAMETERS[operation.name](*params).to_matrix()
+            self._add_unitary(gate, [qubit0, qubit1])
+        elif operation.name in ("id", "u0"):
+            pass
+        elif operation.name in TWO_QUBIT_GATES:
+            qubits = [circuit.find_bit(bit).index for bit in operation.qubits]
+            qubit0 = qubits[0]
+            qubit1 = qubits[1]
+            gate = TWO_QUBIT_GATES[operation.name]
+            self._add_unitary(gate, [qubit0, qubit1])
+        elif operation.name in THREE_QUBIT_GATES:
+            qubits = [circuit.find_bit(bit).index for bit in operation.qubits]
+            qubit0 = qubits[0]
+            qubit1 = qubits[1]
+            qubit2 = qubits[2]
+            gate = THREE_QUBIT_GATES[operation.name]
+            self._add_unitary(gate, [qubit0, qubit1, qubit2])
+        # Check if reset
+        elif operation.name == "reset":
+            qubits = [circuit.find_bit(bit).index for bit in operation.qubits]
+            qubit = qubits[0]
+            self._add_reset(qubit)
+        # Check if barrier
+        elif operation.name == "barrier":
+            pass
+        # Check if measure
+        elif operation.name == "measure":
+            qubit = [circuit.find_bit(bit).index for bit in operation.qubits][0]
+            cmembit = [circuit.find_bit(bit).index for bit in operation.clbits][0]
+            if measure_sample_ops is not None:
+                # If sampling measurements record the qubit and cmembit
+                # for this measurement for later sampling
+                measure_sample_ops.append((qubit, cmembit))
+            else:
+                # If not sampling perform measurement as normal
+                self._add_measure(qubit, cmembit)
+        else:
+            backend = self.name
+            err_msg = '{0} encountered unrecognized operation "{1}"'
+            raise BasicProviderError(err_msg.format(backend, operation.name))
+
+    def _fused_operations(
+        self, circuit: QuantumCircuit, start: int = 0, stop: int | None = None
+    ) -> list[tuple]:
+        """Convert a circuit into a list of operations, with consecutive gates fused together.
+
+        Gates are greedily merged into a single unitary while the merged unitary acts on at most
+        ``fusion_max_qubits`` qubits.  Measurements and resets end the current fused unitary.
+
+        Args:
+            circuit: the circuit to convert.
+            start: the index of the first instruction of the circuit to convert.
+            stop: the index after the last instruction of the circuit to convert.
+
+        Returns:
+            A list of ``("unitary", tensor, axes)``, ``("phase", factor)``,
+            ``("measure", qubit, cmembit)`` and ``("reset", qubit)`` tuples.
+
+        Raises:
+            BasicProviderError: if the circuit contains an unrecognized operation.
+        """
+        operations = []
+        block_qubits = []
+        block = None
+
+        def flush():
+            nonlocal block_qubits, block
+            if block is not None:
+                # Axes of the statevector tensor that the fused unitary acts on, in the order of
+                # the input axes of the unitary tensor.
+                axes = [self._number_of_qubits - 1 - qubit for qubit in reversed(block_qubits)]
+                operations.append(("unitary", block, axes))
+            block_qubits = []
+            block = None
+
+        for instruction in circuit.data[start:stop]:
+            name = instruction.name
+            qubits = [circuit.find_bit(bit).index for bit in instruction.qubits]
+            params = getattr(instruction, "params", None)
+            if name in ("id", "u0", "delay", "barrier"):
+                continue
+            if name == "global_phase":
+                operations.append(("phase", np.exp(1j * float(params[0]))))
+                continue
+            if name == "reset":
+                flush()
+                operations.append(("reset", qubits[0]))
+                continue
+            if name == "measure":
+                flush()
+                operations.append(
+                    ("measure", qubits[0], circuit.find_bit(instruction.clbits[0]).index)
+                )
+                continue
+            if name == "unitary":
+                gate = instruction.operation.params[0]
+            elif name in SINGLE_QUBIT_GATES:
+                gate = single_gate_matrix(name, params)
+            elif name in TWO_QUBIT_GATES_WITH_PARAMETERS:
+                gate = TWO_QUBIT_GATES_WITH_PARAMETERS[name](*params).to_matrix()
+            elif name in TWO_QUBIT_GATES:
+                gate = TWO_QUBIT_GATES[name]
+            elif name in THREE_QUBIT_GATES:
+                gate = THREE_QUBIT_GATES[name]
+            else:
+                backend = self.name
+                err_msg = '{0} encountered unrecognized operation "{1}"'
+                raise BasicProviderError(err_msg.format(backend, name))
+            gate = np.reshape(np.array(gate, dtype=complex), len(qubits) * [2, 2])
+
+            new_qubits = [qubit for qubit in qubits if qubit not in block_qubits]
+            if block is not None and len(block_qubits) + len(new_qubits) > self._fusion_max_qubits:
+                flush()
+                new_qubits = qubits
+            if new_qubits:
+                # Embed the current block into an identity on the enlarged set of qubits.
+                old_qubits = block_qubits
+                block_qubits = block_qubits + new_qubits
+                num_block_qubits = len(block_qubits)
+                identity = np.reshape(
+                    np.eye(2**num_block_qubits, dtype=complex), num_block_qubits * [2, 2]
+                )
+                if block is None:
+                    block = identity
+                else:
+                    indexes = einsum_matmul_index(range(len(old_qubits)), num_block_qubits)
+                    block = np.einsum(indexes, block, identity, dtype=complex, casting="no")
+            positions = [block_qubits.index(qubit) for qubit in qubits]
+            indexes = einsum_matmul_index(positions, len(block_qubits))
+            block = np.einsum(indexes, gate, block, dtype=complex, casting="no")
+        flush()
+        return operations
+
+    def _apply_fused_operations(
+        self, operations: list[tuple], measure_sample_ops: list[tuple[int, int]] | None
+    ) -> None:
+        """Apply operations returned by :meth:`_fused_operations` to the current statevector.
+
+        Fused unitaries are contracted with the statevector tensor using :func:`numpy.tensordot`,
+        and the result of each contraction, with its axes moved back into place without a copy,
+        becomes the new statevector.
+
+        Args:
+            operations: the operations to apply.
+            measure_sample_ops: the list to record (qubit, cmembit) pairs of measurements into,
+                if measurements are sampled from the final statevector.
+        """
+        for operation in operations:
+            kind = operation[0]
+            if kind == "unitary":
+                _, tensor, axes = operation
+                num_block_qubits = len(axes)
+                result = np.tensordot(
+                    tensor,
+                    self._statevector,
+                    axes=(range(num_block_qubits, 2 * num_block_qubits), axes),
+                )
+                self._statevector = np.moveaxis(result, range(num_block_qubits), axes)
+            elif kind == "phase":
+                self._statevector *= operation[1]
+            elif kind == "reset":
+                self._add_reset(operation[1])
+            elif measure_sample_ops is not None:
+                measure_sample_ops.append(operation[1:])
+            else:
+                self._add_measure(*operation[1:])
+
     def _validate_initial_statevector(self) -> None:
         """Validate an initial statevector"""
         # If the initial statevector isn't set we don't need to validate
@@ -362,6 +586,8 @@ class BasicSimulator(BackendV2):
         self._memory = self.options.get("memory")
         self._initial_statevector = self.options.get("initial_statevector")
         self._seed_simulator = self.options.get("seed_simulator")
+        self._fusion_max_qubits = self.options.get("fusion_max_qubits")
+        self._max_shared_prefix_bytes = self.options.get("max_shared_prefix_bytes")
 
         # Apply custom run options
         if run_options.get("initial_statevector", None) is not None:
@@ -381,6 +607,14 @@ class BasicSimulator(BackendV2):
             self._seed_simulator = np.random.randint(2147483647, dtype="int32")
         if "memory" in run_options:
             self._memory = run_options["memory"]
+        if "fusion_max_qubits" in run_options:
+            self._fusion_max_qubits = run_options["fusion_max_qubits"]
+        if self._fusion_max_qubits is not None and self._fusion_max_qubits < 1:
+            raise BasicProviderError(
+                f"fusion_max_qubits must be at least 1, not {self._fusion_max_qubits}"
+            )
+        if "max_shared_prefix_bytes" in run_options:
+            self._max_shared_prefix_bytes = run_options["max_shared_prefix_bytes"]
         # Set seed for local random number gen.
         self._local_rng = np.random.default_rng(seed=self._seed_simulator)
 
@@ -449,6 +683,21 @@ class BasicSimulator(BackendV2):
                 * "memory": bool. If True, the result will contain the results
                   of every individual shot simulation.
 
+                * "fusion_max_qubits": int or None. If set, consecutive gates are
+                  fused into unitaries acting on up to this many qubits before
+                  the simulation, and each fused unitary is contracted with the
+                  statevector with :func:`numpy.tensordot`. It must be at least
+                  1. If None (default), gates are applied one at a time.
+
+                * "max_shared_prefix_bytes": int or None. If set, and all the
+                  circuits in ``run_input`` start with the same gates, this
+                  shared prefix is simulated only once, and every circuit (and
+                  every shot that is simulated separately) starts from a copy
+                  of the resulting statevector. The prefix is only reused if
+                  its statevector takes at most this many bytes; otherwise,
+                  every circuit is simulated from the start. If None (default),
+                  prefixes are not reused.
+
             Example::
 
                 backend.run(
@@ -466,9 +715,25 @@ class BasicSimulator(BackendV2):
                 out_options[key] = value
         self._set_run_options(run_options=run_options)
         job_id = str(uuid.uuid4())
+        if (executor := get_job_executor()) is not None:
+            # Fix the seed now, so that it does not depend on when the job starts running.
+            run_options = {**run_options, "seed_simulator": self._seed_simulator}
+            return BasicProviderJob(
+                self, job_id, executor.submit(self._run_job_locked, job_id, run_input, run_options)
+            )
         job = BasicProviderJob(self, job_id, self._run_job(job_id, run_input))
         return job
 
+    def _run_job_locked(self, job_id: str, run_input, run_options: dict) -> Result:
+        """Run circuits in run_input from a shared job executor.
+
+        The simulation state is stored on the backend instance, so the jobs of an instance run on
+        an executor are serialized, and the run options of each job are set again when it starts.
+        """
+        with self._run_lock:
+            self._set_run_options(run_options=run_options)
+            return self._run_job(job_id, run_input)
+
     def _run_job(self, job_id: str, run_input) -> Result:
         """Run circuits in run_input.
 
@@ -485,8 +750,9 @@ class BasicSimulator(BackendV2):
         self._validate(run_input)
         result_list = []
         start = time.time()
+        prefix = self._simulate_shared_prefix(run_input)
         for circuit in run_input:
-            result_list.append(self._run_circuit(circuit))
+            result_list.append(self._run_circuit(circuit, prefix))
         end = time.time()
         result = {
             "backend_name": self.name,
@@ -500,11 +766,70 @@ class BasicSimulator(BackendV2):
 
         return Result.from_dict(result)
 
-    def _run_circuit(self, circuit) -> dict:
+    def _shared_prefix_length(self, circuits: list[QuantumCircuit]) -> int:
+        """Return the number of leading instructions that all circuits have in common.
+
+        Only instructions that do not depend on random outcomes, i.e. that are not measurements or
+        resets, are included in the shared prefix.
+        """
+        first, others = circuits[0], circuits[1:]
+        if any(other.num_qubits != first.num_qubits for other in others):
+            return 0
+        length = 0
+        for instruction in first.data:
+            if instruction.name in ("measure", "reset"):
+                break
+            qubits = [first.find_bit(bit).index for bit in instruction.qubits]
+            for other in others:
+                if len(other.data) <= length:
+                    return length
+                other_instruction = other.data[length]
+                if other_instruction.operation != instruction.operation or qubits != [
+                    other.find_bit(bit).index for bit in other_instruction.qubits
+                ]:
+                    return length
+            length += 1
+        return length
+
+    def _simulate_shared_prefix(
+        self, circuits: list[QuantumCircuit]
+    ) -> tuple[int, np.ndarray] | None:
+        """Simulate the instructions that all circuits start with.
+
+        Args:
+            circuits: the circuits of the job.
+
+        Returns:
+            The length of the shared prefix and the statevector after simulating it, without the
+            global phase of the circuits, or ``None`` if prefix reuse is disabled, if there is no
+            shared prefix, or if the statevector is larger than ``max_shared_prefix_bytes``.
+        """
+        if self._max_shared_prefix_bytes is None or len(circuits) < 2:
+            return None
+        num_qubits = circuits[0].num_qubits
+        if np.dtype(complex).itemsize * 2**num_qubits > self._max_shared_prefix_bytes:
+            return None
+        length = self._shared_prefix_length(circuits)
+        if length == 0:
+            return None
+
+        self._number_of_qubits = num_qubits
+        self._validate_initial_statevector()
+        self._initialize_statevector()
+        if self._fusion_max_qubits is not None:
+            self._apply_fused_operations(self._fused_operations(circuits[0], stop=length), None)
+        else:
+            for operation in circuits[0].data[:length]:
+                self._add_operation(circuits[0], operation, None)
+        return length, self._statevector
+
+    def _run_circuit(self, circuit, prefix: tuple[int, np.ndarray] | None = None) -> dict:
         """Simulate a single circuit run.
 
         Args:
             circuit: circuit to be run.
+            prefix: the length of a prefix of the circuit that was already simulated, and the
+                statevector after it, as returned by :meth:`_simulate_shared_prefix`.
 
         Returns:
              A result dictionary which looks something like::
@@ -550,85 +875,39 @@ class BasicSimulator(BackendV2):
 
         # List of final counts for all shots
         memory = []
+        # Store (qubit, cmembit) pairs for all measure ops in circuit to
+        # be sampled
+        measure_sample_ops = []
         # Check if we can sample measurements, if so we only perform 1 shot
         # and sample all outcomes from the final state vector
         if self._sample_measure:
             shots = 1
-            # Store (qubit, cmembit) pairs for all measure ops in circuit to
-            # be sampled
-            measure_sample_ops = []
         else:
             shots = self._shots
 
+        prefix_length, prefix_statevector = prefix if prefix is not None else (0, None)
+        fused_operations = None
+        if self._fusion_max_qubits is not None:
+            fused_operations = self._fused_operations(circuit, start=prefix_length)
         for _ in range(shots):
-            self._initialize_statevector()
+            if prefix_statevector is None:
+                self._initialize_statevector()
+            else:
+                self._statevector = prefix_statevector.copy()
             # apply global_phase
             self._statevector *= np.exp(1j * circuit.global_phase)
             # Initialize classical memory to all 0
             self._classical_memory = 0
 
-            for operation in circuit.data:
-                if operation.name == "unitary":
-                    qubits = [circuit.find_bit(bit).index for bit in operation.qubits]
-                    gate = operation.operation.params[0]
-                    self._add_unitary(gate, qubits)
-                elif operation.name in ("id", "u0", "delay"):
-                    pass
-                elif operation.name == "global_phase":
-                    params = getattr(operation, "params", None)
-                    gate = GlobalPhaseGate(*params).to_matrix()
-                    self._add_unitary(gate, [])
-                # Check if single qubit gate
-                elif operation.name in SINGLE_QUBIT_GATES:
-                    params = getattr(operation, "params", None)
-                    qubit = [circuit.find_bit(bit).index for bit in operation.qubits][0]
-                    gate = single_gate_matrix(operation.name, params)
-                    self._add_unitary(gate, [qubit])
-                elif operation.name in TWO_QUBIT_GATES_WITH_PARAMETERS:
-                    params = getattr(operation, "params", None)
-                    qubits = [circuit.find_bit(bit).index for bit in operation.qubits]
-                    qubit0 = qubits[0]
-                    qubit1 = qubits[1]
-                    gate = TWO_QUBIT_GATES_WITH_PARAMETERS[operation.name](*params).to_matrix()
-                    self._add_unitary(gate, [qubit0, qubit1])
-                elif operation.name in ("id", "u0"):
-                    pass
-                elif operation.name in TWO_QUBIT_GATES:
-                    qubits = [circuit.find_bit(bit).index for bit in operation.qubits]
-                    qubit0 = qubits[0]
-                    qubit1 = qubits[1]
-                    gate = TWO_QUBIT_GATES[operation.name]
-                    self._add_unitary(gate, [qubit0, qubit1])
-                elif operation.name in THREE_QUBIT_GATES:
-                    qubits = [circuit.find_bit(bit).index for bit in operation.qubits]
-                    qubit0 = qubits[0]
-                    qubit1 = qubits[1]
-                    qubit2 = qubits[2]
-                    gate = THREE_QUBIT_GATES[operation.name]
-                    self._add_unitary(gate, [qubit0, qubit1, qubit2])
-                # Check if reset
-                elif operation.name == "reset":
-                    qubits = [circuit.find_bit(bit).index for bit in operation.qubits]
-                    qubit = qubits[0]
-                    self._add_reset(qubit)
-                # Check if barrier
-                elif operation.name == "barrier":
-                    pass
-                # Check if measure
-                elif operation.name == "measure":
-                    qubit = [circuit.find_bit(bit).index for bit in operation.qubits][0]
-                    cmembit = [circuit.find_bit(bit).index for bit in operation.clbits][0]
-                    if self._sample_measure:
-                        # If sampling measurements record the qubit and cmembit
-                        # for this measurement for later sampling
-                        measure_sample_ops.append((qubit, cmembit))
-                    else:
-                        # If not sampling perform measurement as normal
-                        self._add_measure(qubit, cmembit)
-                else:
-                    backend = self.name
-                    err_msg = '{0} encountered unrecognized operation "{1}"'
-                    raise BasicProviderError(err_msg.format(backend, operation.name))
+            if fused_operations is not None:
+                self._apply_fused_operations(
+                    fused_operations, measure_sample_ops if self._sample_measure else None
+                )
+            else:
+                for operation in circuit.data[prefix_length:]:
+                    self._add_operation(
+                        circuit, operation, measure_sample_ops if self._sample_measure else None
+                    )
 
             # Add final creg data to memory list
             if self._number_of_cmembits > 0:
@@ -100,6 +100,13 @@ API documentation
 .. autofunction:: load
 .. autofunction:: dump
 .. autofunction:: get_qpy_version
+.. autofunction:: open
+
+.. autoclass:: Reader
+   :members:
+
+.. autoclass:: Writer
+   :members:
 
 These functions will raise a custom subclass of :exc:`.QiskitError` if they encounter problems
 during serialization or deserialization.
@@ -2159,7 +2166,14 @@ References
 """
 
 from .exceptions import QpyError, UnsupportedFeatureForVersion, QPYLoadingDeprecatedFeatureWarning
-from .interface import dump, load, get_qpy_version
+from .interface import (  # pylint: disable=redefined-builtin
+    dump,
+    load,
+    get_qpy_version,
+    open,
+    Reader,
+    Writer,
+)
 
 # For backward compatibility. Provide, Runtime, Experiment call these private functions.
 from .binary_io import (
@@ -343,23 +343,31 @@ def _loads_register_param(data_bytes, circuit, registers):
     return registers["c"][data_bytes]
 
 
-def _read_instruction(
-    file_obj,
-    circuit,
-    registers,
-    custom_operations,
-    version,
-    vectors,
-    use_symengine,
-    standalone_vars,
-    annotation_state,
-):
+_INSTRUCTION_STRUCT = struct.Struct(formats.CIRCUIT_INSTRUCTION_PACK)
+_INSTRUCTION_V2_STRUCT = struct.Struct(formats.CIRCUIT_INSTRUCTION_V2_PACK)
+_INSTRUCTION_ARG_STRUCT = struct.Struct(formats.CIRCUIT_INSTRUCTION_ARG_PACK)
+_INSTRUCTION_PARAM_STRUCT = struct.Struct(formats.INSTRUCTION_PARAM_PACK)
+# TODO This uses little endian. Should be fixed in the next QPY version.
+_FLOAT_PARAM_STRUCT = struct.Struct("<d")
+_NO_CONDITION = type_keys.Condition.NONE
+_HAS_ANNOTATIONS = int(type_keys.InstructionExtraFlags.HAS_ANNOTATIONS)
+
+
+def _read_instruction_header(file_obj, version, with_args):
+    """Read the fixed-size header of an instruction, and the variable-size data that follows it.
+
+    The name, label and condition register of the instruction are read together and, unless the
+    instruction has an expression condition, which comes between them and the arguments, so are
+    the arguments if ``with_args`` is true.
+
+    Returns:
+        The instruction header, the condition key, whether the instruction has annotations, the
+        gate name, the label, the condition register name, and the bytes of the arguments, or
+        ``None`` if they were not read.
+    """
     if version < 5:
         instruction = formats.CIRCUIT_INSTRUCTION._make(
-            struct.unpack(
-                formats.CIRCUIT_INSTRUCTION_PACK,
-                file_obj.read(formats.CIRCUIT_INSTRUCTION_SIZE),
-            )
+            _INSTRUCTION_STRUCT.unpack(file_obj.read(_INSTRUCTION_STRUCT.size))
         )
         conditional_key = (
             type_keys.Condition.TWO_TUPLE if instruction.has_condition else type_keys.Condition.NONE
@@ -367,19 +375,88 @@ def _read_instruction(
         has_annotations = False
     else:
         instruction = formats.CIRCUIT_INSTRUCTION_V2._make(
-            struct.unpack(
-                formats.CIRCUIT_INSTRUCTION_V2_PACK,
-                file_obj.read(formats.CIRCUIT_INSTRUCTION_V2_SIZE),
-            )
+            _INSTRUCTION_V2_STRUCT.unpack(file_obj.read(_INSTRUCTION_V2_STRUCT.size))
         )
-        conditional_key = type_keys.Condition(instruction.extras_key & 0b11)
-        has_annotations = bool(
-            instruction.extras_key & type_keys.InstructionExtraFlags.HAS_ANNOTATIONS
+        extras_key = instruction.extras_key
+        # Constructing the enumerations is slow compared to the rest of reading an instruction.
+        conditional_key = (
+            type_keys.Condition(extras_key & 0b11) if extras_key & 0b11 else _NO_CONDITION
         )
+        has_annotations = bool(extras_key & _HAS_ANNOTATIONS)
+    name_end = instruction.name_size
+    label_end = name_end + instruction.label_size
+    strings_end = label_end + instruction.condition_register_size
+    args_size = 0
+    if with_args and conditional_key != type_keys.Condition.EXPRESSION:
+        args_size = (instruction.num_qargs + instruction.num_cargs) * _INSTRUCTION_ARG_STRUCT.size
+    data = file_obj.read(strings_end + args_size)
+    gate_name = data[:name_end].decode(common.ENCODE)
+    label = data[name_end:label_end].decode(common.ENCODE)
+    condition_register = data[label_end:strings_end].decode(common.ENCODE)
+    args = data[strings_end:] if args_size else None
+    return instruction, conditional_key, has_annotations, gate_name, label, condition_register, args
+
+
+def _read_instruction_args(args, instruction, circuit):
+    """Resolve the qubits and clbits of an instruction from the bytes of its arguments."""
+    qubits = circuit.qubits
+    clbits = circuit.clbits
+    qargs = []
+    cargs = []
+    num_qargs = instruction.num_qargs
+    for index, (arg_type, arg) in enumerate(_INSTRUCTION_ARG_STRUCT.iter_unpack(args)):
+        if index < num_qargs:
+            if arg_type == b"c":
+                raise TypeError("Invalid input carg prior to all qargs")
+            qargs.append(qubits[arg])
+        else:
+            if arg_type == b"q":
+                raise TypeError("Invalid input qarg after all qargs")
+            cargs.append(clbits[arg])
+    return qargs, cargs
 
-    gate_name = file_obj.read(instruction.name_size).decode(common.ENCODE)
-    label = file_obj.read(instruction.label_size).decode(common.ENCODE)
-    condition_register = file_obj.read(instruction.condition_register_size).decode(common.ENCODE)
+
+def _read_instruction(
+    file_obj,
+    circuit,
+    registers,
+    custom_operations,
+    version,
+    vectors,
+    use_symengine,
+    standalone_vars,
+    annotation_state,
+):
+    header = _read_instruction_header(file_obj, version, circuit is not None)
+    return _read_instruction_body(
+        file_obj,
+        header,
+        circuit,
+        registers,
+        custom_operations,
+        version,
+        vectors,
+        use_symengine,
+        standalone_vars,
+        annotation_state,
+    )
+
+
+def _read_instruction_body(
+    file_obj,
+    header,
+    circuit,
+    registers,
+    custom_operations,
+    version,
+    vectors,
+    use_symengine,
+    standalone_vars,
+    annotation_state,
+):
+    instruction, conditional_key, has_annotations, gate_name, label, condition_register, args = (
+        header
+    )
     qargs = []
     cargs = []
     params = []
@@ -402,26 +479,11 @@ def _read_instruction(
 
     # Load Arguments
     if circuit is not None:
-        for _qarg in range(instruction.num_qargs):
-            qarg = formats.CIRCUIT_INSTRUCTION_ARG._make(
-                struct.unpack(
-                    formats.CIRCUIT_INSTRUCTION_ARG_PACK,
-                    file_obj.read(formats.CIRCUIT_INSTRUCTION_ARG_SIZE),
-                )
+        if args is None:
+            args = file_obj.read(
+                (instruction.num_qargs + instruction.num_cargs) * _INSTRUCTION_ARG_STRUCT.size
             )
-            if qarg.type.decode(common.ENCODE) == "c":
-                raise TypeError("Invalid input carg prior to all qargs")
-            qargs.append(circuit.qubits[qarg.size])
-        for _carg in range(instruction.num_cargs):
-            carg = formats.CIRCUIT_INSTRUCTION_ARG._make(
-                struct.unpack(
-                    formats.CIRCUIT_INSTRUCTION_ARG_PACK,
-                    file_obj.read(formats.CIRCUIT_INSTRUCTION_ARG_SIZE),
-                )
-            )
-            if carg.type.decode(common.ENCODE) == "q":
-                raise TypeError("Invalid input qarg after all qargs")
-            cargs.append(circuit.clbits[carg.size])
+        qargs, cargs = _read_instruction_args(args, instruction, circuit)
 
     # Load Parameters
     for _param in range(instruction.num_parameters):
@@ -593,6 +655,131 @@ def _read_instruction(
     return None
 
 
+def _standard_gate(gate_name):
+    """Return the :class:`.StandardGate` that the gate name of an instruction resolves to, if any."""
+    try:
+        return _STANDARD_GATES[gate_name]
+    except KeyError:
+        pass
+    gate_class = getattr(library, gate_name, None)
+    standard = None
+    if isinstance(gate_class, type) and issubclass(gate_class, Gate):
+        standard = getattr(gate_class, "_standard_gate", None)
+    _STANDARD_GATES[gate_name] = standard
+    return standard
+
+
+# The standard gates of the gate names of instructions, or `None` for other names.
+_STANDARD_GATES = {}
+_MISSING = object()
+
+
+def _read_instructions(
+    file_obj,
+    circuit,
+    num_instructions,
+    registers,
+    custom_operations,
+    version,
+    vectors,
+    use_symengine,
+    standalone_vars,
+    annotation_state,
+):
+    """Read the instructions of ``circuit``.
+
+    Instructions of standard gates without conditions or annotations, which make up most of
+    typical circuits, are built directly as :class:`.CircuitInstruction` objects of their
+    :class:`.StandardGate`, without constructing gate objects, and are added to the circuit data
+    in bulk.  Other instructions are read by :func:`_read_instruction_body`.
+    """
+    if version < 5:
+        for _ in range(num_instructions):
+            _read_instruction(
+                file_obj,
+                circuit,
+                registers,
+                custom_operations,
+                version,
+                vectors,
+                use_symengine,
+                standalone_vars,
+                annotation_state,
+            )
+        return
+    read = file_obj.read
+    qubits = circuit.qubits
+    iter_args = _INSTRUCTION_ARG_STRUCT.iter_unpack
+    standard_gates = _STANDARD_GATES
+    from_standard = CircuitInstruction.from_standard
+    param_size = _INSTRUCTION_PARAM_STRUCT.size
+    unpack_param = _INSTRUCTION_PARAM_STRUCT.unpack
+    unpack_float = _FLOAT_PARAM_STRUCT.unpack
+    batch = []
+    for _ in range(num_instructions):
+        header = _read_instruction_header(file_obj, version, True)
+        instruction, _, _, gate_name, label, _, args = header
+        standard = None
+        if (
+            not instruction.extras_key
+            and not instruction.num_cargs
+            and gate_name not in custom_operations
+        ):
+            standard = standard_gates.get(gate_name, _MISSING)
+            if standard is _MISSING:
+                standard = _standard_gate(gate_name)
+        if standard is None or (
+            instruction.num_ctrl_qubits != standard.num_ctrl_qubits
+            or instruction.ctrl_state != (1 << standard.num_ctrl_qubits) - 1
+        ):
+            if batch:
+                circuit._data.extend(batch)
+                batch.clear()
+            _read_instruction_body(
+                file_obj,
+                header,
+                circuit,
+                registers,
+                custom_operations,
+                version,
+                vectors,
+                use_symengine,
+                standalone_vars,
+                annotation_state,
+            )
+            continue
+        qargs = []
+        for arg_type, index in iter_args(args):
+            if arg_type == b"c":
+                raise TypeError("Invalid input carg prior to all qargs")
+            qargs.append(qubits[index])
+        params = []
+        for _param in range(instruction.num_parameters):
+            type_key, size = unpack_param(read(param_size))
+            data_bytes = read(size)
+            if type_key == type_keys.Value.FLOAT:
+                params.append(unpack_float(data_bytes)[0])
+            else:
+                params.append(
+                    _loads_instruction_parameter(
+                        type_key,
+                        data_bytes,
+                        version,
+                        vectors,
+                        registers,
+                        circuit,
+                        use_symengine,
+                        standalone_vars,
+                        annotation_factories=annotation_state.factories,
+                    )
+                )
+        batch.append(from_standard(standard, qargs, params, label or None))
+    if batch:
+        circuit._data.extend(batch)
+    circuit._duration = None
+    circuit._unit = "dt"
+
+
 def _parse_custom_operation(
     custom_operations,
     gate_name,
@@ -1652,18 +1839,18 @@ def read_circuit(
     else:
         annotation_state = _AnnotationDeserializationState(annotation_factories or {})
     custom_operations = _read_custom_operations(file_obj, version, vectors, annotation_state)
-    for _instruction in range(num_instructions):
-        _read_instruction(
-            file_obj,
-            circ,
-            out_registers,
-            custom_operations,
-            version,
-            vectors,
-            use_symengine,
-            standalone_var_indices,
-            annotation_state=annotation_state,
-        )
+    _read_instructions(
+        file_obj,
+        circ,
+        num_instructions,
+        out_registers,
+        custom_operations,
+        version,
+        vectors,
+        use_symengine,
+        standalone_var_indices,
+        annotation_state,
+    )
 
     # Consume calibrations, but don't use them since pulse gates are not supported as of Qiskit 2.0
     if version >= 5:
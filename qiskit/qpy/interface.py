@@ -14,12 +14,19 @@
 
 from __future__ import annotations
 
+import contextlib
 import gzip
 import io
+import itertools
+import mmap
+import operator
+import os
 import shutil
+import tempfile
 from json import JSONEncoder, JSONDecoder
 from typing import Union, List, BinaryIO, Type, Optional, Callable, TYPE_CHECKING
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import Executor
 import struct
 import warnings
 import re
@@ -29,6 +36,7 @@ from qiskit.exceptions import QiskitError
 from qiskit.qpy import formats, common, binary_io, type_keys
 from qiskit.qpy.exceptions import QpyError
 from qiskit import user_config
+from qiskit.utils.parallel import parallel_map, should_run_in_parallel
 from qiskit.version import __version__
 
 if TYPE_CHECKING:
@@ -93,6 +101,9 @@ def dump(
     use_symengine: bool = False,
     version: int = common.QPY_VERSION,
     annotation_factories: Optional[Mapping[str, Callable[[], annotation.QPYSerializer]]] = None,
+    *,
+    num_processes: Optional[int] = None,
+    executor: Optional[Executor] = None,
 ):
     """Write QPY binary data to a file
 
@@ -172,7 +183,15 @@ def dump(
             :class:`.Annotation` objects.  The subsequent call to :func:`load` will need to use
             similar serializer objects, that understand the custom output format of those
             serializers.
+        num_processes: The number of processes to serialize the programs in parallel.  If
+            ``None``, the default, the programs are serialized in this process.  Parallelism is
+            subject to :func:`.should_run_in_parallel`, like :func:`.parallel_map`.
+        executor: A :class:`~concurrent.futures.Executor` to serialize the programs in, which
+            takes priority over ``num_processes``.  The programs, ``metadata_serializer`` and
+            ``annotation_factories`` must be picklable to use a process-based executor.
 
+    The programs are always written to ``file_obj`` in order, and the output is the same whether
+    they were serialized in parallel or not.
 
     Raises:
         TypeError: When invalid data type is input.
@@ -186,95 +205,253 @@ def dump(
         if not issubclass(type(program), QuantumCircuit):
             raise TypeError(f"'{type(program)}' is not a supported data type.")
 
-    if version is None:
-        version = common.QPY_VERSION
-    elif common.QPY_COMPATIBILITY_VERSION > version or version > common.QPY_VERSION:
-        raise ValueError(
-            f"Dumping payloads with the specified QPY version ({version}) is not supported by "
-            f"this version of Qiskit. Try selecting a version between "
-            f"{common.QPY_COMPATIBILITY_VERSION} and {common.QPY_VERSION} for `qpy.dump`."
-        )
+    with Writer(
+        file_obj,
+        metadata_serializer=metadata_serializer,
+        use_symengine=use_symengine,
+        version=version,
+        annotation_factories=annotation_factories,
+        num_programs=len(programs),
+    ) as writer:
+        if len(programs) > 1 and (
+            executor is not None
+            or (num_processes is not None and should_run_in_parallel(num_processes))
+        ):
+            task_args = (writer._version, metadata_serializer, use_symengine, annotation_factories)
+            for serialized in _map(_dump_program, programs, task_args, num_processes, executor):
+                writer._write_serialized(serialized)
+        else:
+            for program in programs:
+                writer.write(program)
 
-    version_match = VERSION_PATTERN_REGEX.search(__version__)
-    version_parts = [int(x) for x in version_match.group("release").split(".")]
-    encoding = type_keys.SymExprEncoding.assign(use_symengine)
-    header = struct.pack(
-        formats.FILE_HEADER_V10_PACK,
-        b"QISKIT",
-        version,
-        version_parts[0],
-        version_parts[1],
-        version_parts[2],
-        len(programs),
-        encoding,
-    )
-    file_obj.write(header)
-    common.write_type_key(file_obj, type_keys.Program.CIRCUIT)
-    header_bytes_written = formats.FILE_HEADER_V10_SIZE + formats.TYPE_KEY_SIZE
 
-    def _write_circuit(out_stream, circuit):
+class Writer:
+    """Write QPY data one program at a time.
+
+    Unlike :func:`.dump`, which needs all the programs up front, the writer serializes each
+    program as soon as it is passed to :meth:`write`, so the programs need not be held in memory
+    together, and the QPY header and table of program offsets are finalized by :meth:`close`.  The
+    writer should be used as a context manager, which closes it on exit.  For example, to stream
+    the output of the transpiler to a file:
+
+    .. code-block:: python
+
+        from qiskit import qpy, transpile
+
+        with open("isa_circuits.qpy", "wb") as fd, qpy.Writer(fd) as writer:
+            for circuit in circuits:
+                writer.write(transpile(circuit, backend))
+
+    The table of program offsets of QPY format version 16 and above comes before the programs,
+    and its size depends on the number of programs.  The programs are written directly into
+    ``file_obj`` if it is seekable and ``num_programs`` is given, so that the table can be reserved
+    and filled in on :meth:`close`.  Otherwise, the programs are written to a temporary file, which
+    is kept in memory until it grows large and is then moved to disk, and copied to ``file_obj`` on
+    :meth:`close`.  Older format versions have no table, and their programs are always written
+    directly into ``file_obj``, provided that it is seekable or ``num_programs`` is given.
+
+    The data is only valid once the writer is closed.  Closing the writer does not close
+    ``file_obj``.
+    """
+
+    # The size of the temporary file of programs above which it is moved from memory to disk.
+    _SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+    def __init__(
+        self,
+        file_obj: BinaryIO,
+        metadata_serializer: Optional[Type[JSONEncoder]] = None,
+        use_symengine: bool = False,
+        version: int = common.QPY_VERSION,
+        annotation_factories: Optional[Mapping[str, Callable[[], annotation.QPYSerializer]]] = None,
+        *,
+        num_programs: Optional[int] = None,
+    ):
+        """
+        Args:
+            file_obj: The file like object to write the QPY data to.
+            metadata_serializer: The JSON encoder of the circuit metadata, see :func:`.dump`.
+            use_symengine: Unused by the supported QPY versions, see :func:`.dump`.
+            version: The QPY format version to emit, see :func:`.dump`.
+            annotation_factories: The serializers of custom annotations, see :func:`.dump`.
+            num_programs: The number of programs that will be written, if it is known.  This lets
+                the writer reserve the table of program offsets and write the programs directly
+                into ``file_obj``.
+
+        Raises:
+            ValueError: When an unsupported version number is passed in for the ``version``
+                argument.
+        """
+        if version is None:
+            version = common.QPY_VERSION
+        elif common.QPY_COMPATIBILITY_VERSION > version or version > common.QPY_VERSION:
+            raise ValueError(
+                f"Dumping payloads with the specified QPY version ({version}) is not supported by "
+                f"this version of Qiskit. Try selecting a version between "
+                f"{common.QPY_COMPATIBILITY_VERSION} and {common.QPY_VERSION} for `qpy.dump`."
+            )
+        self._file_obj = file_obj
+        self._metadata_serializer = metadata_serializer
+        self._use_symengine = use_symengine
+        self._version = version
+        self._annotation_factories = annotation_factories
+        self._num_programs = num_programs
+        # The offsets of the programs in `_stream`, if the format has a table of offsets.
+        self._offsets = []
+        self._num_written = 0
+        self._closed = False
+        seekable = file_obj.seekable() and not isinstance(file_obj, KNOWN_BAD_SEEKERS)
+        if version < 16:
+            direct = num_programs is not None or seekable
+        else:
+            direct = num_programs is not None and seekable
+        if direct:
+            self._header_start = file_obj.tell() if num_programs is None else None
+            self._write_header(file_obj, 0 if num_programs is None else num_programs)
+            if version >= 16:
+                # Skip past the circuit table to write circuit contents first.
+                self._table_start = file_obj.tell()
+                file_obj.seek(num_programs * formats.CIRCUIT_TABLE_ENTRY_SIZE, 1)
+            self._stream = file_obj
+        else:
+            # The writer owns the buffer until it is closed, by `close` or `__exit__`, so it can't
+            # be opened in a `with` statement here.
+            self._stream = tempfile.SpooledTemporaryFile(  # pylint: disable=consider-using-with
+                max_size=self._SPOOL_MAX_SIZE
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *_):
+        if exc_type is None:
+            self.close()
+            return
+        # Don't finish the data if writing failed.
+        self._closed = True
+        if self._stream is not self._file_obj:
+            self._stream.close()
+
+    @property
+    def num_written(self) -> int:
+        """The number of programs written so far."""
+        return self._num_written
+
+    def write(self, program: QPY_SUPPORTED_TYPES):
+        """Serialize a program and write it out.
+
+        Args:
+            program: The program to write.
+
+        Raises:
+            TypeError: When invalid data type is input.
+            QpyError: If the writer is closed, or more programs are written than the
+                ``num_programs`` it was created with.
+        """
+        if self._closed:
+            raise QpyError("Cannot write to a closed QPY writer.")
+        if not issubclass(type(program), QuantumCircuit):
+            raise TypeError(f"'{type(program)}' is not a supported data type.")
+        self._start_program()
         binary_io.write_circuit(
-            out_stream,
-            circuit,
-            metadata_serializer=metadata_serializer,
-            use_symengine=use_symengine,
-            version=version,
-            annotation_factories=annotation_factories,
+            self._stream,
+            program,
+            metadata_serializer=self._metadata_serializer,
+            use_symengine=self._use_symengine,
+            version=self._version,
+            annotation_factories=self._annotation_factories,
         )
 
-    if version >= 16:
-        # We need a circuit table.
-        if file_obj.seekable() and not isinstance(file_obj, KNOWN_BAD_SEEKERS):
-            # Fast path for properly seekable streams
-            file_offsets = []
-            table_start = file_obj.tell()
-            # Skip past the circuit table to write circuit contents first.
-            file_obj.seek(len(programs) * formats.CIRCUIT_TABLE_ENTRY_SIZE, 1)
-            for program in programs:
-                file_offsets.append(file_obj.tell())
-                _write_circuit(file_obj, program)
-            # Seek back to the table start and write it out.
-            file_obj.seek(table_start)
-            for offset in file_offsets:
-                file_obj.write(
-                    struct.pack(
-                        formats.CIRCUIT_TABLE_ENTRY_PACK, *formats.CIRCUIT_TABLE_ENTRY(offset)
-                    )
+    def _write_serialized(self, data: bytes):
+        # Write a program that was already serialized with the settings of this writer.
+        if self._closed:
+            raise QpyError("Cannot write to a closed QPY writer.")
+        self._start_program()
+        self._stream.write(data)
+
+    def _start_program(self):
+        if self._num_programs is not None and self._num_written == self._num_programs:
+            raise QpyError(f"The QPY writer was created for {self._num_programs} programs.")
+        if self._version >= 16:
+            self._offsets.append(self._stream.tell())
+        self._num_written += 1
+
+    def close(self):
+        """Write the QPY header and table of program offsets, to finish the QPY data.
+
+        Raises:
+            QpyError: If fewer programs were written than the ``num_programs`` the writer was
+                created with.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        num_programs = self._num_written
+        if self._num_programs is not None and num_programs != self._num_programs:
+            if self._stream is not self._file_obj:
+                self._stream.close()
+            raise QpyError(
+                f"The QPY writer was created for {self._num_programs} programs, "
+                f"but {num_programs} were written."
+            )
+        file_obj = self._file_obj
+        if self._stream is file_obj:
+            if self._version >= 16:
+                # Seek back to the table start and write it out.
+                file_obj.seek(self._table_start)
+                self._write_table(file_obj, self._offsets)
+                file_obj.seek(0, 2)
+            elif self._header_start is not None:
+                # Seek back to the header to set the number of programs.
+                file_obj.seek(self._header_start)
+                self._write_header(file_obj, num_programs)
+                file_obj.seek(0, 2)
+            return
+        with self._stream as programs_buffer:
+            self._write_header(file_obj, num_programs)
+            if self._version >= 16:
+                # Write circuit table to the output stream, adjusting offsets.
+                start = (
+                    formats.FILE_HEADER_V10_SIZE
+                    + formats.TYPE_KEY_SIZE
+                    + num_programs * formats.CIRCUIT_TABLE_ENTRY_SIZE
                 )
-            # Seek to the end of the stream.
-            file_obj.seek(0, 2)
-        else:
-            # We need to create a temporary BytesIO buffer since the input
-            # stream isn't seekable.
-            buffer_offsets = []
-            offset_table_size = len(programs) * formats.CIRCUIT_TABLE_ENTRY_SIZE
-            with io.BytesIO() as circuits_buffer:
-                for program in programs:
-                    buffer_offsets.append(circuits_buffer.tell())
-                    _write_circuit(circuits_buffer, program)
-                # Write circuit table to input stream, adjusting offsets.
-                for offset in buffer_offsets:
-                    file_obj.write(
-                        struct.pack(
-                            formats.CIRCUIT_TABLE_ENTRY_PACK,
-                            *formats.CIRCUIT_TABLE_ENTRY(
-                                header_bytes_written + offset_table_size + offset
-                            ),
-                        )
-                    )
-                # Write circuits to the input stream.
-                circuits_buffer.seek(0)
-                shutil.copyfileobj(circuits_buffer, file_obj)
-    else:
-        # No circuit table needed, just write the circuits sequentially.
-        for program in programs:
-            _write_circuit(file_obj, program)
+                self._write_table(file_obj, [start + offset for offset in self._offsets])
+            # Write circuits to the output stream.
+            programs_buffer.seek(0)
+            shutil.copyfileobj(programs_buffer, file_obj)
+
+    def _write_header(self, file_obj, num_programs):
+        version_match = VERSION_PATTERN_REGEX.search(__version__)
+        version_parts = [int(x) for x in version_match.group("release").split(".")]
+        header = struct.pack(
+            formats.FILE_HEADER_V10_PACK,
+            b"QISKIT",
+            self._version,
+            version_parts[0],
+            version_parts[1],
+            version_parts[2],
+            num_programs,
+            type_keys.SymExprEncoding.assign(self._use_symengine),
+        )
+        file_obj.write(header)
+        common.write_type_key(file_obj, type_keys.Program.CIRCUIT)
+
+    @staticmethod
+    def _write_table(file_obj, offsets):
+        for offset in offsets:
+            file_obj.write(
+                struct.pack(formats.CIRCUIT_TABLE_ENTRY_PACK, *formats.CIRCUIT_TABLE_ENTRY(offset))
+            )
 
 
 def load(
     file_obj: BinaryIO,
     metadata_deserializer: Optional[Type[JSONDecoder]] = None,
     annotation_factories: Optional[Mapping[str, Callable[[], annotation.QPYSerializer]]] = None,
+    *,
+    num_processes: Optional[int] = None,
+    executor: Optional[Executor] = None,
 ) -> List[QPY_SUPPORTED_TYPES]:
     """Load a QPY binary file
 
@@ -315,6 +492,17 @@ def load(
         annotation_factories: Mapping of namespaces to functions that create new instances of
             :class:`.annotation.QPUSerializer`, for handling the loading of custom
             :class:`.Annotation` objects.
+        num_processes: The number of processes to deserialize the programs in parallel.  If
+            ``None``, the default, the programs are deserialized in this process.  Parallelism is
+            subject to :func:`.should_run_in_parallel`, like :func:`.parallel_map`.
+        executor: A :class:`~concurrent.futures.Executor` to deserialize the programs in, which
+            takes priority over ``num_processes``.  ``metadata_deserializer`` and
+            ``annotation_factories`` must be picklable to use a process-based executor.
+
+    The programs can only be deserialized in parallel for QPY format version 16 and above, whose
+    header has the byte offset of each program.  If ``file_obj`` is a file on disk, each worker
+    memory-maps it and decodes its programs from their offsets, so that the workers share the
+    pages of the file.  Otherwise, each worker is sent the bytes of its programs.
 
     Returns:
         The list of Qiskit programs contained in the QPY data.
@@ -330,6 +518,215 @@ def load(
         QpyError: if known but unsupported data type is loaded.
     """
 
+    data, use_symengine, program_offsets = _read_file_header(file_obj)
+
+    if (
+        program_offsets is not None
+        and len(program_offsets) > 1
+        and (
+            executor is not None
+            or (num_processes is not None and should_run_in_parallel(num_processes))
+        )
+    ):
+        path = _mappable_path(file_obj)
+        if path is None:
+            # Send each worker the bytes of its program.
+            file_obj.seek(0)
+            buffer = file_obj.read()
+            bounds = sorted(program_offsets) + [len(buffer)]
+            ends = dict(zip(bounds, bounds[1:]))
+            tasks = [(buffer[offset : ends[offset]], 0) for offset in program_offsets]
+        else:
+            tasks = [(path, offset) for offset in program_offsets]
+            file_obj.seek(0, 2)
+        task_args = (data.qpy_version, metadata_deserializer, use_symengine, annotation_factories)
+        return _map(_load_program, tasks, task_args, num_processes, executor)
+
+    programs = []
+    for i in range(data.num_programs):
+        if program_offsets is not None:
+            # Deserialize each program using their byte offsets
+            file_obj.seek(program_offsets[i])
+        programs.append(
+            binary_io.read_circuit(
+                file_obj,
+                data.qpy_version,
+                metadata_deserializer=metadata_deserializer,
+                use_symengine=use_symengine,
+                annotation_factories=annotation_factories,
+            )
+        )
+    return programs
+
+
+class Reader(Sequence):
+    """A sequence of the programs in QPY data, which are decoded only when they are accessed.
+
+    Instances are returned by :func:`.qpy.open`.  The reader supports :func:`len`, indexing,
+    slicing and iteration, like the list returned by :func:`.qpy.load`, but it only reads the
+    header of the data up front.  Each access decodes the program it returns, so accessing the
+    same index twice returns two independent copies.
+
+    QPY format versions 16 and above store the byte offset of each program in the header, so any
+    program is decoded directly.  The programs of older versions must be decoded in order to find
+    where the next one starts, so accessing a program decodes the preceding programs that were
+    not accessed before.
+
+    The reader should be closed with :meth:`close` when it is no longer needed, or used as a
+    context manager.  This closes the files and memory maps opened by :func:`.qpy.open`, but not
+    a file object passed to it.
+    """
+
+    def __init__(
+        self,
+        file_obj: BinaryIO,
+        metadata_deserializer: Optional[Type[JSONDecoder]] = None,
+        annotation_factories: Optional[Mapping[str, Callable[[], annotation.QPYSerializer]]] = None,
+    ):
+        """
+        Args:
+            file_obj: A seekable file like object that contains the QPY binary data, positioned at
+                its start.
+            metadata_deserializer: The JSON decoder of the circuit metadata, see :func:`.load`.
+            annotation_factories: The serializers of custom annotations, see :func:`.load`.
+        """
+        self._file_obj = file_obj
+        # The files and memory maps to close with the reader.
+        self._owned = contextlib.ExitStack()
+        self._metadata_deserializer = metadata_deserializer
+        self._annotation_factories = annotation_factories
+        data, self._use_symengine, offsets = _read_file_header(file_obj)
+        self._qpy_version = data.qpy_version
+        self._num_programs = data.num_programs
+        # For versions without a table of offsets, these are the offsets of the programs found so
+        # far by decoding them in order.
+        self._offsets = [file_obj.tell()] if offsets is None else offsets
+
+    @property
+    def qpy_version(self) -> int:
+        """The QPY format version of the data."""
+        return self._qpy_version
+
+    def __len__(self):
+        return self._num_programs
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._decode(i) for i in range(*index.indices(self._num_programs))]
+        index = operator.index(index)
+        if index < 0:
+            index += self._num_programs
+        if not 0 <= index < self._num_programs:
+            raise IndexError(f"program index {index} out of range")
+        return self._decode(index)
+
+    def __iter__(self):
+        for index in range(self._num_programs):
+            yield self._decode(index)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        """Close the files and memory maps opened for this reader."""
+        self._owned.close()
+
+    def _read_at(self, offset):
+        self._file_obj.seek(offset)
+        return binary_io.read_circuit(
+            self._file_obj,
+            self._qpy_version,
+            metadata_deserializer=self._metadata_deserializer,
+            use_symengine=self._use_symengine,
+            annotation_factories=self._annotation_factories,
+        )
+
+    def _decode(self, index):
+        # Find the offset of the program by decoding the programs before it, if needs be.
+        while len(self._offsets) <= index:
+            self._read_at(self._offsets[-1])
+            self._offsets.append(self._file_obj.tell())
+        out = self._read_at(self._offsets[index])
+        if len(self._offsets) == index + 1 and index + 1 < self._num_programs:
+            self._offsets.append(self._file_obj.tell())
+        return out
+
+
+def open(  # pylint: disable=redefined-builtin
+    file: Union[str, os.PathLike, BinaryIO],
+    metadata_deserializer: Optional[Type[JSONDecoder]] = None,
+    annotation_factories: Optional[Mapping[str, Callable[[], annotation.QPYSerializer]]] = None,
+    *,
+    use_mmap: bool = True,
+) -> Reader:
+    """Open QPY data for random access to its programs.
+
+    Unlike :func:`.load`, which decodes every program in the data, this returns a
+    :class:`.qpy.Reader`, which decodes each program only when it is accessed.  For example, to
+    get a single circuit out of a large file:
+
+    .. code-block:: python
+
+        from qiskit import qpy
+
+        with qpy.open("circuits.qpy") as reader:
+            print(len(reader))
+            circuit = reader[9000]
+            first_ten = reader[:10]
+
+    Args:
+        file: The path of a QPY file, or a seekable binary file object positioned at the start of
+            the QPY data.
+        metadata_deserializer: The JSON decoder of the circuit metadata, see :func:`.load`.
+        annotation_factories: The serializers of custom annotations, see :func:`.load`.
+        use_mmap: Whether to memory-map the file, if it has a file descriptor.  The operating
+            system then only reads the parts of the file that are decoded, and the position of
+            ``file``, if it is a file object, is not changed by the reader.
+
+    Returns:
+        A reader of the programs in the QPY data.
+
+    Raises:
+        QiskitError: if ``file`` does not contain valid QPY data.
+        QpyError: if the QPY version of the data is lower than the configured ``min_qpy_version``.
+        TypeError: When invalid data type is loaded.
+    """
+    # The files and memory maps opened here are closed if reading the header fails, and are
+    # otherwise handed over to the reader to close.
+    with contextlib.ExitStack() as owned:
+        if isinstance(file, (str, os.PathLike)):
+            file_obj = owned.enter_context(io.open(file, "rb"))
+        else:
+            file_obj = file
+        if use_mmap and not isinstance(file_obj, KNOWN_BAD_SEEKERS):
+            try:
+                fileno = file_obj.fileno()
+            except (AttributeError, OSError):
+                fileno = None
+            if fileno is not None:
+                try:
+                    mapped = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    # Empty files, and some special files, can't be memory-mapped.
+                    pass
+                else:
+                    file_obj = owned.enter_context(mapped)
+        reader = Reader(file_obj, metadata_deserializer, annotation_factories)
+        reader._owned = owned.pop_all()
+    return reader
+
+
+def _read_file_header(file_obj):
+    """Read the header of the QPY data at the start of ``file_obj``.
+
+    Returns:
+        The file header, whether the symbolic expressions are encoded with symengine, and the
+        byte offsets of the programs, or ``None`` if the format version has no table of offsets.
+        ``file_obj`` is left at the start of the first program.
+    """
     # identify file header version
     version = struct.unpack("!6sB", file_obj.read(7))[1]
     file_obj.seek(0)
@@ -408,6 +805,7 @@ def load(
     else:
         use_symengine = data.symbolic_encoding == type_keys.SymExprEncoding.SYMENGINE
 
+    program_offsets = None
     if data.qpy_version >= 16:
         # Obtain the byte offsets for each program
         program_offsets = []
@@ -420,22 +818,61 @@ def load(
                     )
                 ).offset
             )
+    return data, use_symengine, program_offsets
 
-    programs = []
-    for i in range(data.num_programs):
-        if data.qpy_version >= 16:
-            # Deserialize each program using their byte offsets
-            file_obj.seek(program_offsets[i])
-        programs.append(
-            binary_io.read_circuit(
+
+def _map(task, values, task_args, num_processes, executor):
+    if executor is None:
+        return parallel_map(task, values, task_args=task_args, num_processes=num_processes)
+    return list(executor.map(task, values, *(itertools.repeat(arg) for arg in task_args)))
+
+
+def _mappable_path(file_obj):
+    """Return the path of the file that ``file_obj`` reads from the start, if it can be mapped."""
+    if isinstance(file_obj, KNOWN_BAD_SEEKERS) or not isinstance(file_obj, io.BufferedReader):
+        return None
+    path = file_obj.name
+    if not isinstance(path, (str, bytes, os.PathLike)) or not os.path.isfile(path):
+        return None
+    return path
+
+
+def _dump_program(
+    program, version, metadata_serializer, use_symengine, annotation_factories
+) -> bytes:
+    with io.BytesIO() as buffer:
+        binary_io.write_circuit(
+            buffer,
+            program,
+            metadata_serializer=metadata_serializer,
+            use_symengine=use_symengine,
+            version=version,
+            annotation_factories=annotation_factories,
+        )
+        return buffer.getvalue()
+
+
+def _load_program(task, version, metadata_deserializer, use_symengine, annotation_factories):
+    source, offset = task
+    if isinstance(source, bytes):
+        with io.BytesIO(source) as file_obj:
+            return binary_io.read_circuit(
                 file_obj,
-                data.qpy_version,
+                version,
+                metadata_deserializer=metadata_deserializer,
+                use_symengine=use_symengine,
+                annotation_factories=annotation_factories,
+            )
+    with io.open(source, "rb") as file_obj:
+        with mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            buffer.seek(offset)
+            return binary_io.read_circuit(
+                buffer,
+                version,
                 metadata_deserializer=metadata_deserializer,
                 use_symengine=use_symengine,
                 annotation_factories=annotation_factories,
             )
-        )
-    return programs
 
 
 def get_qpy_version(
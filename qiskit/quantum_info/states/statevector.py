@@ -32,6 +32,7 @@ from qiskit.quantum_info.operators.operator import Operator, BaseOperator
 from qiskit.quantum_info.operators.symplectic import Pauli, SparsePauliOp
 from qiskit.quantum_info.operators.op_shape import OpShape
 from qiskit.quantum_info.operators.predicates import matrix_equal
+from qiskit.result.counts import Counts
 
 from qiskit._accelerate.pauli_expval import (
     expval_pauli_no_x,
@@ -83,7 +84,10 @@ class Statevector(QuantumState, TolerancesMixin):
               If it is not a power of two the state will have a single
               d-dimensional subsystem.
         """
-        if isinstance(data, (list, np.ndarray)):
+        if isinstance(data, np.memmap):
+            # Keep memory-mapped arrays as they are, so that the state stays backed by its file.
+            self._data = np.asanyarray(data, dtype=complex)
+        elif isinstance(data, (list, np.ndarray)):
             # Finally we check if the input is a raw vector in either a
             # python list or numpy array format.
             self._data = np.asarray(data, dtype=complex)
@@ -369,7 +373,11 @@ class Statevector(QuantumState, TolerancesMixin):
         return ret
 
     def evolve(
-        self, other: Operator | QuantumCircuit | Instruction, qargs: list[int] | None = None
+        self,
+        other: Operator | QuantumCircuit | Instruction,
+        qargs: list[int] | None = None,
+        *,
+        chunk_size: int | None = None,
     ) -> Statevector:
         """Evolve a quantum state by the operator.
 
@@ -377,6 +385,10 @@ class Statevector(QuantumState, TolerancesMixin):
             other (Operator | QuantumCircuit | circuit.Instruction): The operator to evolve by.
             qargs (list): a list of Statevector subsystem positions to apply
                            the operator on.
+            chunk_size (int): if set, copy the data once and then apply each operator that acts
+                on a subset of the subsystems to the copy, one block of at most ``chunk_size``
+                amplitudes at a time, so that no other temporary full-size array is allocated
+                (Default: None).
 
         Returns:
             Statevector: the output quantum state.
@@ -384,20 +396,71 @@ class Statevector(QuantumState, TolerancesMixin):
         Raises:
             QiskitError: if the operator dimension does not match the
                          specified Statevector subsystem dimensions.
+
+        Additional Information:
+            This statevector is never modified.  To evolve a statevector in place, for example
+            one backed by a memory-mapped file (see :meth:`from_memmap`), use
+            :meth:`evolve_inplace`.
+        """
+        ret = _copy.copy(self)
+        if chunk_size is not None:
+            ret._data = np.array(self._data)
+        return self._evolve(ret, other, qargs, chunk_size)
+
+    def evolve_inplace(
+        self,
+        other: Operator | QuantumCircuit | Instruction,
+        qargs: list[int] | None = None,
+        *,
+        chunk_size: int | None = None,
+    ) -> None:
+        """Evolve this quantum state in place by the operator.
+
+        Unlike :meth:`evolve`, this overwrites the data of this statevector.  For a statevector
+        backed by a memory-mapped file (see :meth:`from_memmap`), the evolved state is written to
+        the file.
+
+        Args:
+            other (Operator | QuantumCircuit | circuit.Instruction): The operator to evolve by.
+            qargs (list): a list of Statevector subsystem positions to apply
+                           the operator on.
+            chunk_size (int): if set, apply each operator that acts on a subset of the
+                subsystems one block of at most ``chunk_size`` amplitudes at a time, so that
+                no temporary full-size array is allocated (Default: None).
+
+        Raises:
+            QiskitError: if the data of this statevector is read-only, if the operator dimension
+                does not match the specified Statevector subsystem dimensions, or if the operator
+                changes the subsystem dimensions.
         """
+        if not self._data.flags.writeable:
+            raise QiskitError("Cannot evolve a statevector with read-only data in place.")
+        data, op_shape = self._data, self._op_shape
+        self._evolve(self, other, qargs, chunk_size)
+        if self._op_shape != op_shape:
+            # Operators that change the dimensions are never applied block by block, so the
+            # original data has not been modified.
+            self._data, self._op_shape = data, op_shape
+            raise QiskitError(
+                "Cannot evolve a statevector in place by an operator that changes its dimensions."
+            )
+        if self._data is not data:
+            # Instructions that are not applied block by block replace the data.
+            data[...] = self._data
+            self._data = data
+
+    def _evolve(self, ret, other, qargs, chunk_size):
+        """Evolve the statevector ``ret``, a copy of this statevector or itself, by the operator."""
         if qargs is None:
             qargs = getattr(other, "qargs", None)
 
-        # Get return vector
-        ret = _copy.copy(self)
-
         # Evolution by a circuit or instruction
         if isinstance(other, QuantumCircuit):
             other = other.to_instruction()
         if isinstance(other, Instruction):
             if self.num_qubits is None:
                 raise QiskitError("Cannot apply QuantumCircuit to non-qubit Statevector.")
-            return self._evolve_instruction(ret, other, qargs=qargs)
+            return self._evolve_instruction(ret, other, qargs=qargs, chunk_size=chunk_size)
 
         # Evolution by an Operator
         if not isinstance(other, Operator):
@@ -409,7 +472,7 @@ class Statevector(QuantumState, TolerancesMixin):
             raise QiskitError(
                 "Operator input dimensions are not equal to statevector subsystem dimensions."
             )
-        return Statevector._evolve_operator(ret, other, qargs=qargs)
+        return Statevector._evolve_operator(ret, other, qargs=qargs, chunk_size=chunk_size)
 
     def equiv(
         self, other: Statevector, rtol: float | None = None, atol: float | None = None
@@ -521,7 +584,11 @@ class Statevector(QuantumState, TolerancesMixin):
         return np.dot(conj.data, val.data)
 
     def probabilities(
-        self, qargs: None | list[int] = None, decimals: None | int = None
+        self,
+        qargs: None | list[int] = None,
+        decimals: None | int = None,
+        *,
+        chunk_size: int | None = None,
     ) -> np.ndarray:
         """Return the subsystem measurement probability vector.
 
@@ -533,6 +600,9 @@ class Statevector(QuantumState, TolerancesMixin):
                 if None return for all subsystems (Default: None).
             decimals (None or int): the number of decimal places to round
                 values. If None no rounding is done (Default: None).
+            chunk_size (None or int): if set, compute the probabilities from blocks
+                of at most ``chunk_size`` amplitudes at a time, so that only the
+                returned array is allocated at full size (Default: None).
 
         Returns:
             np.array: The Numpy vector array of probabilities.
@@ -594,6 +664,13 @@ class Statevector(QuantumState, TolerancesMixin):
                 Swapped probs: [0.5 0.5 0.  0. ]
 
         """
+        if chunk_size is not None:
+            probs = self._chunked_probabilities(qargs, chunk_size)
+            np.clip(probs, a_min=0, a_max=1, out=probs)
+            if decimals is not None:
+                probs.round(decimals=decimals, out=probs)
+            return probs
+
         probs = self._subsystem_probabilities(
             np.abs(self.data) ** 2, self._op_shape.dims_l(), qargs=qargs
         )
@@ -606,6 +683,89 @@ class Statevector(QuantumState, TolerancesMixin):
 
         return probs
 
+    def _chunked_probabilities(self, qargs: None | list[int], chunk_size: int) -> np.ndarray:
+        """Return the unrounded probabilities, computed block by block."""
+        if qargs is None:
+            probs = np.empty(self._data.shape, dtype=float)
+            for start in range(0, len(probs), chunk_size):
+                probs[start : start + chunk_size] = (
+                    np.abs(self._data[start : start + chunk_size]) ** 2
+                )
+            return probs
+        tensor = np.reshape(self._data, self._op_shape.tensor_shape)
+        ndim = tensor.ndim
+        qargs_axes = [ndim - 1 - i for i in reversed(qargs)]
+        probs_tens = np.zeros([tensor.shape[axis] for axis in sorted(qargs_axes)])
+        for outer, _, block in _blocks(tensor, qargs_axes, chunk_size):
+            remaining = [axis for axis in range(ndim) if axis not in outer]
+            sum_axis = tuple(i for i, axis in enumerate(remaining) if axis not in qargs_axes)
+            probs_tens += np.sum(np.abs(block) ** 2, axis=sum_axis)
+        # Permute probability vector for desired qargs order
+        probs_tens = np.transpose(probs_tens, axes=np.argsort(np.argsort(qargs_axes)))
+        return np.reshape(probs_tens, (probs_tens.size,))
+
+    def sample_counts(
+        self, shots: int, qargs: None | list[int] = None, *, chunk_size: int | None = None
+    ) -> Counts:
+        """Sample a dict of qubit measurement outcomes in the computational basis.
+
+        Args:
+            shots (int): number of samples to generate.
+            qargs (None or list): subsystems to sample measurements for,
+                                if None sample measurement of all
+                                subsystems (Default: None).
+            chunk_size (None or int): if set, sample from blocks of at most
+                ``chunk_size`` amplitudes at a time, so that no full-size
+                probability or label array is allocated (Default: None).
+
+        Returns:
+            Counts: sampled counts dictionary.
+
+        Additional Information:
+
+            This function *samples* measurement outcomes using the measure
+            :meth:`probabilities` for the current state and `qargs`. It does
+            not actually implement the measurement so the current state is
+            not modified.
+
+            The seed for random number generator used for sampling can be
+            set to a fixed value by using the stats :meth:`seed` method.
+            Sampling with a ``chunk_size`` uses the random number generator
+            differently, so it gives different samples for the same seed.
+        """
+        if chunk_size is None:
+            return super().sample_counts(shots, qargs=qargs)
+
+        rng = self._rng
+        if qargs is not None:
+            probs = self.probabilities(qargs, chunk_size=chunk_size)
+            samples = rng.choice(len(probs), p=probs / probs.sum(), size=shots)
+        else:
+            # First choose how many shots fall into each block, then sample within the blocks.
+            starts = range(0, len(self._data), chunk_size)
+            weights = np.array(
+                [
+                    np.vdot(
+                        self._data[start : start + chunk_size],
+                        self._data[start : start + chunk_size],
+                    ).real
+                    for start in starts
+                ]
+            )
+            block_shots = rng.multinomial(shots, weights / weights.sum())
+            samples = []
+            for start, num_shots in zip(starts, block_shots):
+                if num_shots:
+                    probs = np.abs(self._data[start : start + chunk_size]) ** 2
+                    samples.append(
+                        start + rng.choice(len(probs), p=probs / probs.sum(), size=num_shots)
+                    )
+            samples = np.concatenate(samples) if samples else np.zeros(0, dtype=int)
+
+        inds, counts = np.unique(samples, return_counts=True)
+        labels = self._index_to_ket_array(inds, self.dims(qargs), string_labels=True)
+        return Counts(zip(labels, counts))
+
     def reset(self, qargs: list[int] | None = None) -> Statevector:
         """Reset state or subsystems to the 0-state.
 
@@ -749,6 +909,33 @@ class Statevector(QuantumState, TolerancesMixin):
         state[i] = 1.0
         return Statevector(state, dims=dims)
 
+    @staticmethod
+    def from_memmap(filename: str, dims: int | tuple | list, mode: str = "r+") -> Statevector:
+        """Return a statevector whose data is stored in a memory-mapped file.
+
+        The data of the statevector is a :class:`numpy.memmap` of complex128 amplitudes, so
+        that the operating system pages it in and out of host memory as needed.  Together with
+        the ``chunk_size`` arguments of :meth:`evolve_inplace`, :meth:`probabilities` and
+        :meth:`sample_counts`, this allows to simulate and sample states that do not fit in
+        host memory.
+
+        Args:
+            filename (str): the path of the file that stores the amplitudes.
+            dims (int or tuple or list): The subsystem dimensions of the statevector
+                                         (see :meth:`from_int`).
+            mode (str): the mode to open the file with (see :class:`numpy.memmap`).  If
+                ``"w+"``, a new file is created and initialized to the state
+                :math:`|0\rangle` (Default: ``"r+"``).
+
+        Returns:
+            Statevector: the memory-mapped statevector.
+        """
+        size = int(np.prod(dims))
+        data = np.memmap(filename, dtype=complex, mode=mode, shape=(size,))
+        if mode == "w+":
+            data[0] = 1.0
+        return Statevector(data, dims=dims)
+
     @classmethod
     def from_instruction(cls, instruction: Instruction | QuantumCircuit) -> Statevector:
         """Return the output statevector of an instruction.
@@ -857,9 +1044,11 @@ class Statevector(QuantumState, TolerancesMixin):
         )
 
     @staticmethod
-    def _evolve_operator(statevec, oper, qargs=None):
+    def _evolve_operator(statevec, oper, qargs=None, chunk_size=None):
         """Evolve a qudit statevector"""
         new_shape = statevec._op_shape.compose(oper._op_shape, qargs=qargs)
+        if chunk_size is not None and new_shape == statevec._op_shape:
+            return Statevector._evolve_operator_chunked(statevec, oper, qargs, chunk_size)
         if qargs is None:
             # Full system evolution
             statevec._data = np.dot(oper._data, statevec._data)
@@ -897,7 +1086,26 @@ class Statevector(QuantumState, TolerancesMixin):
         return statevec
 
     @staticmethod
-    def _evolve_instruction(statevec, obj, qargs=None):
+    def _evolve_operator_chunked(statevec, oper, qargs, chunk_size):
+        """Evolve a qudit statevector in place, block by block"""
+        tensor = np.reshape(statevec._data, statevec._op_shape.tensor_shape)
+        num_qargs = tensor.ndim
+        if qargs is None:
+            qargs = range(num_qargs)
+        indices = [num_qargs - 1 - i for i in reversed(qargs)]
+        contract_dim = oper._op_shape.shape[1]
+        for outer, _, block in _blocks(tensor, indices, chunk_size):
+            # Move the contracted axes of the block to the front, as in _evolve_operator
+            remaining = [i for i in range(num_qargs) if i not in outer]
+            positions = [remaining.index(i) for i in indices]
+            block = np.moveaxis(block, positions, range(len(positions)))
+            block[...] = np.reshape(
+                np.dot(oper.data, np.reshape(block, (contract_dim, -1))), block.shape
+            )
+        return statevec
+
+    @staticmethod
+    def _evolve_instruction(statevec, obj, qargs=None, chunk_size=None):
         """Update the current Statevector by applying an instruction."""
         from qiskit.circuit.reset import Reset
         from qiskit.circuit.barrier import Barrier
@@ -912,7 +1120,9 @@ class Statevector(QuantumState, TolerancesMixin):
         if mat is not None:
             # Perform the composition and inplace update the current state
             # of the operator
-            return Statevector._evolve_operator(statevec, Operator(mat), qargs=qargs)
+            return Statevector._evolve_operator(
+                statevec, Operator(mat), qargs=qargs, chunk_size=chunk_size
+            )
 
         # Special instruction types
         if isinstance(obj, Reset):
@@ -958,7 +1168,12 @@ class Statevector(QuantumState, TolerancesMixin):
             )
 
         if obj.definition.global_phase:
-            statevec._data *= np.exp(1j * float(obj.definition.global_phase))
+            phase = np.exp(1j * float(obj.definition.global_phase))
+            if chunk_size is None:
+                # The data may still be shared with the statevector that is evolved.
+                statevec._data = statevec._data * phase
+            else:
+                statevec._data *= phase
         qubits = {qubit: i for i, qubit in enumerate(obj.definition.qubits)}
         for instruction in obj.definition:
             if instruction.clbits:
@@ -970,5 +1185,32 @@ class Statevector(QuantumState, TolerancesMixin):
                 new_qargs = [qubits[tup] for tup in instruction.qubits]
             else:
                 new_qargs = [qargs[qubits[tup]] for tup in instruction.qubits]
-            Statevector._evolve_instruction(statevec, instruction.operation, qargs=new_qargs)
+            Statevector._evolve_instruction(
+                statevec, instruction.operation, qargs=new_qargs, chunk_size=chunk_size
+            )
         return statevec
+
+
+def _blocks(tensor, axes, chunk_size):
+    """Yield blocks of ``tensor`` of at most ``chunk_size`` elements that span all of ``axes``.
+
+    The blocks are views of ``tensor`` that fix the indices of its leading axes that are not in
+    ``axes``.  A block is larger than ``chunk_size`` only if ``axes`` alone span more elements.
+
+    Yields:
+        tuple: ``(outer, index, block)`` where ``outer`` is the list of fixed axes, ``index``
+        their values, and ``block`` the view of ``tensor`` over the remaining axes.
+    """
+    outer = []
+    size = tensor.size
+    for axis in range(tensor.ndim):
+        if size <= chunk_size:
+            break
+        if axis not in axes:
+            outer.append(axis)
+            size //= tensor.shape[axis]
+    for index in np.ndindex(*(tensor.shape[axis] for axis in outer)):
+        key = [slice(None)] * tensor.ndim
+        for axis, value in zip(outer, index):
+            key[axis] = value
+        yield outer, index, tensor[tuple(key)]
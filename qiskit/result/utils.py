@@ -261,6 +261,15 @@ def _marginalize(counts, indices=None):
     # Since bitstrings have qubit-0 as least significant bit
     indices = sorted(indices, reverse=True)
 
+    if num_clbits <= _MAX_INTEGER_CLBITS:
+        marginal = _marginalize_integer(counts, indices)
+        if marginal is not None:
+            outcomes, values = marginal
+            width = len(indices)
+            return {
+                format(outcome, f"0{width}b"): value for outcome, value in zip(outcomes, values)
+            }
+
     # Build the return list
     new_counts = Counter()
     for key, val in counts.items():
@@ -269,23 +278,58 @@ def _marginalize(counts, indices=None):
     return dict(new_counts)
 
 
+# The largest number of clbits whose outcomes are marginalized as NumPy integers.
+_MAX_INTEGER_CLBITS = 63
+
+
+def _marginalize_integer(counts, indices):
+    """Marginalize counts over the indices, given in descending order, with integer outcomes.
+
+    The bitstrings are converted to integers once, the bits of interest are gathered with bit
+    masks, and the values of equal outcomes are summed with NumPy.
+
+    Returns:
+        The marginal outcomes as a list of integers, in order of their first occurrence in
+        ``counts``, and the list of their values, or ``None`` if the values are not numbers.
+    """
+    values = np.asarray(list(counts.values()))
+    if values.dtype.kind not in "iuf":
+        return None
+    keys = np.fromiter(
+        (int(_remove_space_underscore(key), 2) for key in counts),
+        dtype=np.uint64,
+        count=len(counts),
+    )
+    outcomes = np.zeros_like(keys)
+    for position, index in enumerate(reversed(indices)):
+        outcomes |= ((keys >> np.uint64(index)) & np.uint64(1)) << np.uint64(position)
+    outcomes, first, inverse = np.unique(outcomes, return_index=True, return_inverse=True)
+    if values.dtype.kind == "f":
+        totals = np.bincount(inverse, weights=values, minlength=len(outcomes))
+    else:
+        totals = np.zeros(len(outcomes), dtype=values.dtype)
+        np.add.at(totals, inverse, values)
+    order = np.argsort(first, kind="stable")
+    return outcomes[order].tolist(), totals[order].tolist()
+
+
 def _format_marginal(counts, marg_counts, indices):
     """Take the output of marginalize and add placeholders for
     multiple cregs and non-indices."""
     format_counts = {}
     counts_template = next(iter(counts))
-    counts_len = len(counts_template.replace(" ", ""))
     indices_rev = sorted(indices, reverse=True)
-
-    for count in marg_counts:
-        index_dict = dict(zip(indices_rev, count))
-        count_bits = "".join(
-            [index_dict[index] if index in index_dict else "_" for index in range(counts_len)]
-        )[::-1]
-        for index, bit in enumerate(counts_template):
-            if bit == " ":
-                count_bits = count_bits[:index] + " " + count_bits[index:]
-        format_counts[count_bits] = marg_counts[count]
+    # The position of each bit in the formatted bitstring, where bit 0 is the rightmost one that
+    # isn't a space between registers.
+    positions = [index for index, bit in enumerate(counts_template) if bit != " "][::-1]
+    template = [" " if bit == " " else "_" for bit in counts_template]
+    targets = [positions[index] for index in indices_rev]
+
+    for count, value in marg_counts.items():
+        count_bits = template.copy()
+        for target, bit in zip(targets, count):
+            count_bits[target] = bit
+        format_counts["".join(count_bits)] = value
     return format_counts
 
 
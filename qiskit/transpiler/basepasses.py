@@ -14,6 +14,7 @@
 from __future__ import annotations
 
 import abc
+import copy
 from abc import abstractmethod
 from collections.abc import Callable, Hashable, Iterable
 from inspect import signature
@@ -152,7 +153,57 @@ class BasePass(GenericPass, metaclass=MetaPass):
 
 
 class AnalysisPass(BasePass):  # pylint: disable=abstract-method
-    """An analysis pass: change property set, not DAG."""
+    """An analysis pass: change property set, not DAG.
+
+    An analysis pass whose results only depend on the DAG and on the arguments of the pass, and not
+    on the property set, can set the class attribute :attr:`depends_only_on_dag` to ``True``.  The
+    pass manager then remembers the property set entries that such passes wrote for the latest
+    DAG they were run on.  When the pass is run again and the DAG is structurally equal to that DAG
+    (see :meth:`.DAGCircuit.structurally_equal`), the pass is skipped and its entries are restored.
+    This avoids recomputing expensive analysis in :class:`.DoWhileController` loops whose
+    transformations did not change the DAG.
+    """
+
+    depends_only_on_dag: bool = False
+    """Whether the results of the pass only depend on the DAG and the arguments of the pass."""
+
+    def execute(
+        self,
+        passmanager_ir: PassManagerIR,
+        state: PassManagerState,
+        callback: Callable = None,
+    ) -> tuple[PassManagerIR, PassManagerState]:
+        status = state.workflow_status
+        if (
+            not self.depends_only_on_dag
+            or self.requires
+            or self in status.completed_passes
+            or not isinstance(passmanager_ir, DAGCircuit)
+        ):
+            return super().execute(passmanager_ir=passmanager_ir, state=state, callback=callback)
+        unchanged = status.memoized_ir is not None and passmanager_ir.structurally_equal(
+            status.memoized_ir
+        )
+        if unchanged and self in status.memoized_results:
+            state.property_set.update(status.memoized_results[self])
+            status.completed_passes.add(self)
+            return super().execute(passmanager_ir=passmanager_ir, state=state, callback=callback)
+
+        before = dict(state.property_set)
+        passmanager_ir, state = super().execute(
+            passmanager_ir=passmanager_ir, state=state, callback=callback
+        )
+        status = state.workflow_status
+        if status.previous_run == RunState.SUCCESS:
+            if not unchanged:
+                status.memoized_ir = copy.deepcopy(passmanager_ir)
+                status.memoized_results = {}
+            status.memoized_results[self] = {
+                key: value
+                for key, value in state.property_set.items()
+                if key not in before or before[key] is not value
+            }
+        return passmanager_ir, state
 
 
 class TransformationPass(BasePass):  # pylint: disable=abstract-method
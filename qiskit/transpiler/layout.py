@@ -973,3 +973,35 @@ class TranspileLayout:
             property_set["final_layout"] = self.final_layout.copy()
         if self._input_qubit_count is not None:
             property_set["num_input_qubits"] = self._input_qubit_count
+
+    def _with_input_circuit(self, input_circuit: circuit.QuantumCircuit) -> TranspileLayout:
+        """Return a copy of this layout that refers to the virtual qubits of ``input_circuit``, in
+        place of the virtual qubits with the same indices.
+
+        This is used when the transpiled circuit went through a serialization that does not keep
+        the identity of the input qubits, such as QPY with anonymous bits.
+        """
+        qubits = input_circuit.qubits
+        bits = {
+            bit: qubits[index] if index < len(qubits) else bit
+            for bit, index in self.input_qubit_mapping.items()
+        }
+        initial_layout = Layout(
+            {
+                bits.get(bit, bit): physical
+                for bit, physical in self.initial_layout.get_virtual_bits().items()
+            }
+        )
+        for register in input_circuit.qregs:
+            initial_layout.add_register(register)
+        for register in self.initial_layout.get_registers():
+            if all(bits.get(bit, bit) is bit for bit in register):
+                # Registers of ancillas that the transpiler added are unchanged.
+                initial_layout.add_register(register)
+        return TranspileLayout(
+            initial_layout,
+            {bits[bit]: index for bit, index in self.input_qubit_mapping.items()},
+            self.final_layout,
+            self._input_qubit_count,
+            self._output_qubit_list,
+        )
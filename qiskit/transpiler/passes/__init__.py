@@ -172,6 +172,8 @@ Additional Passes
    MinimumPoint
    RemoveBarriers
    RemoveFinalMeasurements
+   SetTimeBudget
+   CheckTimeBudget
    UnrollForLoops
    WrapAngles
 
@@ -298,4 +300,6 @@ from .utils import MergeAdjacentBarriers
 from .utils import MinimumPoint
 from .utils import RemoveBarriers
 from .utils import RemoveFinalMeasurements
+from .utils import SetTimeBudget
+from .utils import CheckTimeBudget
 from .utils import UnrollForLoops
@@ -168,22 +168,13 @@ def _build_error_matrix(num_qubits, qubit_map, target=None):
     error_mat = np.zeros((num_qubits, num_qubits))
     use_error = False
     if target is not None and target.qargs is not None:
-        for qargs in target.qargs:
+        # Use max error rate to represent operation error on a qubit(s). If there is more than 1
+        # operation available we don't know what will be used on the qubits eventually so we take
+        # the highest error operation as a proxy for the possible worst case.
+        for qargs, max_error in target._max_errors().items():
             # Ignore gates over 2q DenseLayout only works with 2q
             if len(qargs) > 2:
                 continue
-            error = 0.0
-            ops = target.operation_names_for_qargs(qargs)
-            for op in ops:
-                props = target[op].get(qargs, None)
-                if props is not None and props.error is not None:
-                    # Use max error rate to represent operation error
-                    # on a qubit(s). If there is more than 1 operation available
-                    # we don't know what will be used on the qubits eventually
-                    # so we take the highest error operation as a proxy for
-                    # the possible worst case.
-                    error = max(error, props.error)
-            max_error = error
             if any(qubit not in qubit_map for qubit in qargs):
                 continue
             # TODO: Factor in T1 and T2 to error matrix after #7736
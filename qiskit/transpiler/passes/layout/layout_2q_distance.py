@@ -62,12 +62,15 @@ class Layout2qDistance(AnalysisPass):
             self.property_set[self.property_name] = 0
             return
 
-        self.coupling_map.compute_distance_matrix()
+        if self.target is None:
+            self.coupling_map.compute_distance_matrix()
+            dist_matrix = self.coupling_map.distance_matrix
+        else:
+            dist_matrix = self.target._distance_matrix()
 
         sum_distance = 0
 
         virtual_physical_map = layout.get_virtual_bits()
-        dist_matrix = self.coupling_map.distance_matrix
         for gate in dag.two_qubit_ops():
             physical_q0 = virtual_physical_map[gate.qargs[0]]
             physical_q1 = virtual_physical_map[gate.qargs[1]]
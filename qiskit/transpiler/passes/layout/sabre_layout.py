@@ -30,10 +30,14 @@ from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.transpiler.target import Target, _FakeTarget
 from qiskit._accelerate.sabre import sabre_layout_and_routing, Heuristic, SetScaling
+from qiskit.transpiler.passes.utils.time_budget import remaining_time, record_time_budget_metric
 from qiskit.utils import default_num_processes
 
 logger = logging.getLogger(__name__)
 
+# The share of the remaining time budget, if there is one, that the layout trials may use.
+_TIME_BUDGET_SHARE = 0.5
+
 
 class SabreLayout(TransformationPass):
     """Choose a Layout via iterative bidirectional routing of the input circuit.
@@ -81,6 +85,13 @@ class SabreLayout(TransformationPass):
         An optional list of :class:`~.Layout` objects to use for additional layout trials. This is
         in addition to the full random trials specified with the ``layout_trials`` argument.
 
+    ``time_budget_deadline`` (``float``)
+        If set by :class:`.SetTimeBudget`, the layout trials are run in batches of as many trials
+        as can run in parallel, until either all the ``layout_trials`` have run, or the next batch
+        would likely take more than half of the remaining time.  The result with the fewest swaps
+        is used, and the number of trials that were run is recorded as ``"sabre_layout_trials"``
+        in ``property_set["time_budget_metrics"]``.  This is not done with ``skip_routing``.
+
     Property Set Values Written
     ---------------------------
 
@@ -270,18 +281,24 @@ class SabreLayout(TransformationPass):
             .with_decay(0.001, 5)
         )
         sabre_start = time.perf_counter()
-        # If `skip_routing`, then `out_dag` and `final` are meaningless but well-typed.
-        out_dag, initial, final = sabre_layout_and_routing(
-            dag,
-            self.target,
-            heuristic,
-            max_iterations=self.max_iterations,
-            num_swap_trials=self.swap_trials or 1,
-            num_random_trials=self.layout_trials,
-            seed=self.seed,
-            partial_layouts=starting_layouts,
-            skip_routing=self.skip_routing,
-        )
+        remaining = remaining_time(self.property_set)
+        if remaining is not None and not self.skip_routing:
+            out_dag, initial, final = self._run_within_time_budget(
+                dag, heuristic, starting_layouts, sabre_start + _TIME_BUDGET_SHARE * remaining
+            )
+        else:
+            # If `skip_routing`, then `out_dag` and `final` are meaningless but well-typed.
+            out_dag, initial, final = sabre_layout_and_routing(
+                dag,
+                self.target,
+                heuristic,
+                max_iterations=self.max_iterations,
+                num_swap_trials=self.swap_trials or 1,
+                num_random_trials=self.layout_trials,
+                seed=self.seed,
+                partial_layouts=starting_layouts,
+                skip_routing=self.skip_routing,
+            )
         sabre_stop = time.perf_counter()
         logger.debug(
             "Sabre layout algorithm execution for all components complete in: %s sec.",
@@ -327,6 +344,40 @@ class SabreLayout(TransformationPass):
             )
         return out_dag
 
+    def _run_within_time_budget(self, dag, heuristic, starting_layouts, stop):
+        """Run the layout trials in batches that run in parallel, until either all the trials
+        have run, or the next batch would likely end after ``stop``, and return the result with
+        the fewest swaps."""
+        batch_size = max(1, min(self.layout_trials, default_num_processes()))
+        best, best_swaps = None, None
+        trials = 0
+        batch = 0
+        while True:
+            batch_start = time.perf_counter()
+            result = sabre_layout_and_routing(
+                dag,
+                self.target,
+                heuristic,
+                max_iterations=self.max_iterations,
+                num_swap_trials=self.swap_trials or 1,
+                num_random_trials=min(batch_size, self.layout_trials - trials),
+                seed=None if self.seed is None else self.seed + batch,
+                partial_layouts=starting_layouts if batch == 0 else [],
+                skip_routing=False,
+            )
+            batch_stop = time.perf_counter()
+            trials += min(batch_size, self.layout_trials - trials)
+            batch += 1
+            swaps = result[0].count_ops().get("swap", 0)
+            if best is None or swaps < best_swaps:
+                best, best_swaps = result, swaps
+            if trials >= self.layout_trials or batch_stop + (batch_stop - batch_start) > stop:
+                break
+        record_time_budget_metric(self.property_set, "sabre_layout_trials", trials)
+        if trials < self.layout_trials:
+            record_time_budget_metric(self.property_set, "deadline_reached", True)
+        return best
+
     def _layout_and_route_passmanager(self, initial_layout):
         """Return a passmanager for a full layout and routing.
 
@@ -19,8 +19,12 @@ from qiskit.transpiler.layout import Layout
 from qiskit.transpiler.basepasses import AnalysisPass
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.transpiler.passes.layout import vf2_utils
+from qiskit.transpiler.passes.utils.time_budget import limit_time
 from qiskit._accelerate.vf2_layout import vf2_layout_pass, MultiQEncountered, VF2PassConfiguration
 
+# The share of the remaining time budget, if there is one, that the search may use.
+_TIME_BUDGET_SHARE = 0.25
+
 
 class VF2LayoutStopReason(Enum):
     """Stop reasons for VF2Layout pass."""
@@ -132,7 +136,9 @@ class VF2Layout(AnalysisPass):
         self.avg_error_map = self.property_set["vf2_avg_error_map"]
         config = VF2PassConfiguration.from_legacy_api(
             call_limit=self.call_limit,
-            time_limit=self.time_limit,
+            time_limit=limit_time(
+                self.property_set, self.time_limit, _TIME_BUDGET_SHARE, "vf2_layout_time_limit"
+            ),
             max_trials=self.max_trials,
             shuffle_seed=self.seed,
         )
@@ -24,10 +24,14 @@ from qiskit.transpiler.layout import Layout
 from qiskit.transpiler.basepasses import AnalysisPass
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.transpiler.passes.layout import vf2_utils
+from qiskit.transpiler.passes.utils.time_budget import limit_time
 
 
 logger = logging.getLogger(__name__)
 
+# The share of the remaining time budget, if there is one, that the search may use.
+_TIME_BUDGET_SHARE = 0.25
+
 
 class VF2PostLayoutStopReason(Enum):
     """Stop reasons for VF2PostLayout pass."""
@@ -284,6 +288,9 @@ class VF2PostLayout(AnalysisPass):
 
         logger.debug("Initial layout has score %s", chosen_layout_score)
 
+        time_limit = limit_time(
+            self.property_set, self.time_limit, _TIME_BUDGET_SHARE, "vf2_post_layout_time_limit"
+        )
         start_time = time.time()
         trials = 0
         for mapping in mappings:
@@ -329,11 +336,11 @@ class VF2PostLayout(AnalysisPass):
                 break
 
             elapsed_time = time.time() - start_time
-            if self.time_limit is not None and elapsed_time >= self.time_limit:
+            if time_limit is not None and elapsed_time >= time_limit:
                 logger.debug(
                     "VFPostLayout has taken %s which exceeds configured max time: %s",
                     elapsed_time,
-                    self.time_limit,
+                    time_limit,
                 )
                 break
         if stop_reason == VF2PostLayoutStopReason.SOLUTION_FOUND:
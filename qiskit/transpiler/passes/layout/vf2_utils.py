@@ -181,21 +181,12 @@ def build_average_error_map(target, coupling_map):
         avg_map = ErrorMap(0)
     built = False
     if target is not None and target.qargs is not None:
-        for qargs in target.qargs:
-            if qargs is None:
-                continue
-            qarg_error = 0.0
-            count = 0
-            for op in target.operation_names_for_qargs(qargs):
-                inst_props = target[op].get(qargs, None)
-                if inst_props is not None and inst_props.error is not None:
-                    count += 1
-                    qarg_error += inst_props.error
-            if count > 0:
-                if len(qargs) == 1:
-                    qargs = (qargs[0], qargs[0])
-                avg_map.add_error(qargs, qarg_error / count)
-                built = True
+        # The average errors are cached by the target, and shared by every pass that uses them.
+        for qargs, error in target._average_errors().items():
+            if len(qargs) == 1:
+                qargs = (qargs[0], qargs[0])
+            avg_map.add_error(qargs, error)
+            built = True
     # if there are no error rates in the target we should fallback to using the degree heuristic
     # used for a coupling map. To do this we can build the coupling map from the target before
     # running the fallback heuristic
@@ -18,6 +18,8 @@ from qiskit.transpiler.basepasses import AnalysisPass
 class Collect1qRuns(AnalysisPass):
     """Collect one-qubit subcircuits."""
 
+    depends_only_on_dag = True
+
     def run(self, dag):
         """Run the Collect1qBlocks pass on `dag`.
 
@@ -20,6 +20,8 @@ from qiskit.transpiler.basepasses import AnalysisPass
 class Collect2qBlocks(AnalysisPass):
     """Collect two-qubit subcircuits."""
 
+    depends_only_on_dag = True
+
     def run(self, dag):
         """Run the Collect2qBlocks pass on `dag`.
 
@@ -25,6 +25,8 @@ class CommutationAnalysis(AnalysisPass):
     are grouped into a set of gates that commute.
     """
 
+    depends_only_on_dag = True
+
     def __init__(self, *, _commutation_checker=None):
         super().__init__()
         # allow setting a private commutation checker, this allows better performance if we
@@ -28,6 +28,7 @@ from .unroll_forloops import UnrollForLoops
 from .minimum_point import MinimumPoint
 from .filter_op_nodes import FilterOpNodes
 from .wrap_angles import WrapAngles
+from .time_budget import SetTimeBudget, CheckTimeBudget
 
 # Utility functions
 from . import control_flow
@@ -19,6 +19,7 @@ from typing import Tuple
 
 from qiskit.dagcircuit.dagcircuit import DAGCircuit
 from qiskit.transpiler.basepasses import TransformationPass
+from qiskit.transpiler.passes.utils.time_budget import time_budget_exhausted
 
 
 class MinimumPoint(TransformationPass):
@@ -48,6 +49,10 @@ class MinimumPoint(TransformationPass):
     * ``{prefix}_minimum_point`` - This value gets set to ``True`` when either a fixed point
         is reached over the ``backtrack_depth`` executions, or ``backtrack_depth`` was exceeded
         and an earlier minimum is restored.
+
+    If a time budget was set by :class:`.SetTimeBudget` and its deadline has passed, the pass
+    sets ``{prefix}_minimum_point`` to ``True`` and outputs the better of the current DAG and the
+    earlier minimum.
     """
 
     def __init__(self, property_set_list, prefix, backtrack_depth=5):
@@ -77,6 +82,11 @@ class MinimumPoint(TransformationPass):
         score = tuple(self.property_set[x] for x in self.property_set_list)
         state = self.property_set[self.backtrack_name]
 
+        if time_budget_exhausted(self.property_set):
+            self.property_set[self.minimum_reached] = True
+            if state is not None and state.dag is not None and state.score < score:
+                return state.dag
+            return dag
         # The pass starts at None and the first iteration doesn't set a real
         # score so the overall loop is treated as a do-while to ensure we have
         # at least 2 iterations.
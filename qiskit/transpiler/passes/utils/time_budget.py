@@ -0,0 +1,138 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Track a wall-clock time budget over a pass manager run."""
+
+from __future__ import annotations
+
+import time
+
+from qiskit.passmanager.compilation_status import PropertySet
+from qiskit.transpiler.basepasses import AnalysisPass
+
+
+class SetTimeBudget(AnalysisPass):
+    """Start a wall-clock time budget for the rest of the pass manager run.
+
+    The budget is tracked in the property set by the following fields:
+
+    * ``time_budget_deadline`` - The value of :func:`time.perf_counter` at which the budget is
+      used up.
+    * ``time_budget_metrics`` - A dictionary of metrics of the run under the budget.  It starts
+      with the ``"time_budget"`` in seconds, and ``"deadline_reached"`` set to ``False``.  The
+      passes that reduce their effort to fit the budget record what they did in it, and
+      :class:`.CheckTimeBudget` records the final metrics.
+
+    Passes that support a time budget reduce their effort while the deadline is set, and always
+    return the best valid result they found.  :class:`.SabreLayout` runs its layout trials in
+    batches until its share of the remaining time is used, :class:`.VF2Layout` and
+    :class:`.VF2PostLayout` limit their search time to a share of the remaining time, and
+    :class:`.MinimumPoint` ends the search for a minimum, and restores the best DAG seen so far,
+    when the deadline is reached.  The optimization loops of the preset pass managers stop when
+    the deadline is reached.
+
+    The budget is a target rather than a hard limit: passes that do not support it run as usual,
+    and passes that do support it always do at least some work.
+    """
+
+    def __init__(self, time_budget: float):
+        """
+        Args:
+            time_budget: The wall-clock time budget in seconds.
+
+        Raises:
+            ValueError: If ``time_budget`` is not positive.
+        """
+        super().__init__()
+        if time_budget <= 0:
+            raise ValueError(f"time_budget must be positive, not {time_budget}")
+        self.time_budget = time_budget
+
+    def run(self, dag):
+        """Run the SetTimeBudget pass on `dag`."""
+        self.property_set["time_budget_deadline"] = time.perf_counter() + self.time_budget
+        self.property_set["time_budget_metrics"] = {
+            "time_budget": self.time_budget,
+            "deadline_reached": False,
+        }
+
+
+class CheckTimeBudget(AnalysisPass):
+    """Record the final metrics of a run under a time budget set by :class:`.SetTimeBudget`.
+
+    This adds the ``"elapsed"`` wall-clock time since the budget was set, and the ``"size"`` and
+    ``"depth"`` of the DAG, to ``property_set["time_budget_metrics"]``, and sets its
+    ``"deadline_reached"`` field if the deadline has passed.  It does nothing if no time budget
+    was set.
+    """
+
+    def run(self, dag):
+        """Run the CheckTimeBudget pass on `dag`."""
+        deadline = self.property_set["time_budget_deadline"]
+        if deadline is None:
+            return
+        metrics = self.property_set["time_budget_metrics"]
+        now = time.perf_counter()
+        metrics["elapsed"] = now - (deadline - metrics["time_budget"])
+        metrics["size"] = dag.size()
+        metrics["depth"] = dag.depth()
+        if now >= deadline:
+            metrics["deadline_reached"] = True
+
+
+def remaining_time(property_set: PropertySet) -> float | None:
+    """Return the remaining time of the time budget in seconds, or ``None`` if there is none."""
+    deadline = property_set["time_budget_deadline"]
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.perf_counter())
+
+
+def time_budget_exhausted(property_set: PropertySet) -> bool:
+    """Return whether a time budget is set and its deadline has passed."""
+    remaining = remaining_time(property_set)
+    if remaining is None or remaining > 0.0:
+        return False
+    property_set["time_budget_metrics"]["deadline_reached"] = True
+    return True
+
+
+def limit_time(
+    property_set: PropertySet, time_limit: float | None, share: float, name: str
+) -> float | None:
+    """Return the time limit for a search that may use a share of the remaining time budget.
+
+    Args:
+        property_set: The property set of the pass manager run.
+        time_limit: The time limit of the search without a time budget, if any.
+        share: The fraction of the remaining time that the search may use.
+        name: The name under which the limit is recorded in the time budget metrics.
+
+    Returns:
+        The smaller of ``time_limit`` and the share of the remaining time, or ``time_limit`` if
+        no time budget is set.
+    """
+    remaining = remaining_time(property_set)
+    if remaining is None:
+        return time_limit
+    limit = share * remaining
+    if time_limit is not None and time_limit <= limit:
+        limit = time_limit
+    property_set["time_budget_metrics"][name] = limit
+    return limit
+
+
+def record_time_budget_metric(property_set: PropertySet, name: str, value) -> None:
+    """Record a metric of the run under a time budget, if there is one."""
+    metrics = property_set["time_budget_metrics"]
+    if metrics is not None:
+        metrics[name] = value
@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import inspect
 import io
+import pickle
 import re
 from collections.abc import Iterator, Iterable, Callable
 from functools import wraps
@@ -22,8 +23,10 @@ from typing import Union, List, Any, TypeVar
 
 from qiskit.circuit import QuantumCircuit
 from qiskit.converters import circuit_to_dag, dag_to_circuit
-from qiskit.dagcircuit import DAGCircuit
+from qiskit.dagcircuit import DAGCircuit, DAGCircuitError
 from qiskit.passmanager.passmanager import BasePassManager
+from qiskit.passmanager.profiling import PassManagerProfiler
+from qiskit.passmanager.worker_pool import WorkerPool
 from qiskit.passmanager.base_tasks import Task
 from qiskit.passmanager.flow_controllers import FlowControllerLinear
 from qiskit.passmanager.exceptions import PassManagerError
@@ -96,6 +99,49 @@ class PassManager(BasePassManager):
 
         return out_program
 
+    def _serialize_program(self, program: QuantumCircuit) -> bytes:
+        # pylint: disable=cyclic-import
+        from qiskit import qpy
+
+        buffer = io.BytesIO()
+        try:
+            qpy.dump(program, buffer)
+        except Exception:  # pylint: disable=broad-except
+            # QPY cannot represent everything, such as metadata that is not JSON serializable.
+            return pickle.dumps((None, program))
+        # Scheduling information that QPY does not store.
+        extras = {
+            name: getattr(program, name, None)
+            for name in ("_op_start_times", "_clbit_write_latency", "_conditional_latency")
+        }
+        return pickle.dumps((buffer.getvalue(), extras))
+
+    def _deserialize_program(
+        self, data: bytes, in_program: QuantumCircuit | None = None
+    ) -> QuantumCircuit:
+        # pylint: disable=cyclic-import
+        from qiskit import qpy
+
+        qpy_data, extras = pickle.loads(data)
+        if qpy_data is None:
+            return extras
+        program = qpy.load(io.BytesIO(qpy_data))[0]
+        for name, value in extras.items():
+            if value is not None:
+                setattr(program, name, value)
+        if in_program is not None and program.layout is not None:
+            # QPY does not keep the identity of anonymous qubits.
+            program._layout = program.layout._with_input_circuit(in_program)
+        return program
+
+    def _passmanager_ir_metrics(self, passmanager_ir: DAGCircuit) -> dict[str, int | None]:
+        try:
+            depth = passmanager_ir.depth()
+        except DAGCircuitError:
+            # The depth is not defined for some control-flow operations.
+            depth = None
+        return {"size": passmanager_ir.size(), "depth": depth}
+
     def append(  # pylint:disable=arguments-renamed
         self,
         passes: Task | list[Task],
@@ -132,6 +178,9 @@ class PassManager(BasePassManager):
         num_processes: int = None,
         *,
         property_set: dict[str, object] | None = None,
+        profiler: PassManagerProfiler | None = None,
+        pool: WorkerPool | None = None,
+        num_threads: int | None = None,
     ) -> _CircuitsT:
         """Run all the passes on the specified ``circuits``.
 
@@ -187,6 +236,19 @@ class PassManager(BasePassManager):
                 another, in cases where you know the analysis is safe to share.  Beware that some
                 analysis will be specific to the input circuit and the particular :class:`.Target`,
                 so you should take a lot of care when using this argument.
+            profiler: If given, a :class:`.PassManagerProfiler` that records the profile of every
+                pass and flow controller run for each circuit, including the size and depth of the
+                :class:`.DAGCircuit` before and after each of them.
+            pool: If given, a :class:`.WorkerPool` to transpile the circuits in, when there is more
+                than one.  The circuits are sent to its worker processes in the :mod:`.qpy` format.
+                The ``num_processes`` argument and the parallelism settings are then ignored.
+            num_threads: If greater than one, transpile the circuits in up to this many threads of
+                this process, each with its own copy of the pass manager, rather than in other
+                processes.  The circuits are not serialized, but the threads only run in parallel
+                while the passes release the GIL, so this is mostly useful for pass managers whose
+                passes spend their time in such native code.  The ``callback`` is called from the
+                worker threads.  The ``num_processes`` argument and the parallelism settings are
+                then ignored.
 
         Returns:
             The transformed circuit(s).
@@ -200,6 +262,82 @@ class PassManager(BasePassManager):
             output_name=output_name,
             num_processes=num_processes,
             property_set=property_set,
+            profiler=profiler,
+            pool=pool,
+            num_threads=num_threads,
+        )
+
+    # pylint: disable=arguments-differ
+    def imap(  # pylint:disable=arguments-renamed
+        self,
+        circuits: Iterable[QuantumCircuit],
+        callback: Callable = None,
+        num_processes: int = None,
+        *,
+        ordered: bool = True,
+        max_in_flight: int | None = None,
+        property_set: dict[str, object] | None = None,
+        profiler: PassManagerProfiler | None = None,
+        pool: WorkerPool | None = None,
+        num_threads: int | None = None,
+    ) -> Iterator[QuantumCircuit] | Iterator[tuple[int, QuantumCircuit]]:
+        """Run all the passes on each of the ``circuits``, and yield the transformed circuits as
+        they are completed.
+
+        Unlike :meth:`run`, this reads the circuits lazily and does not build the list of all the
+        output circuits, so a large batch can be streamed into further processing, such as
+        :func:`.qpy.dump` or submission to a backend, with bounded memory, and the first circuits
+        can be processed before the last ones are transpiled.  For example:
+
+        .. code-block:: python
+
+            from qiskit.circuit.library import quantum_volume
+            from qiskit.providers.fake_provider import GenericBackendV2
+            from qiskit.transpiler import generate_preset_pass_manager
+
+            pm = generate_preset_pass_manager(2, GenericBackendV2(10))
+            circuits = (quantum_volume(8, seed=seed) for seed in range(1000))
+            for index, isa in pm.imap(circuits, ordered=False, max_in_flight=16):
+                ...
+
+        Args:
+            circuits: An iterable of the circuits to transform.  It is consumed lazily.
+            callback: A callback function that will be called after each pass execution, as in
+                :meth:`run`.
+            num_processes: The maximum number of parallel processes to launch if parallel
+                execution is enabled, as in :meth:`run`.
+            ordered: If ``True``, yield the output circuits in the order of the input circuits.
+                If ``False``, yield them in the order they are completed, as tuples of the index
+                of the input circuit and the output circuit.
+            max_in_flight: The maximum number of circuits that are being transpiled or are
+                transpiled but not yielded yet.  If ``None``, it is twice the number of parallel
+                workers.  This has no effect when the circuits are transpiled serially.
+            property_set: If given, the initial value to use as the :class:`.PropertySet` for the
+                pass manager pipeline of each circuit, as in :meth:`run`.
+            profiler: If given, a :class:`.PassManagerProfiler` that records the profile of every
+                pass and flow controller run for each circuit.  The circuits are numbered in the
+                order they are yielded.
+            pool: If given, a :class:`.WorkerPool` to transpile the circuits in.
+            num_threads: If greater than one, transpile the circuits in up to this many threads of
+                this process, as in :meth:`run`.
+
+        Returns:
+            An iterator over the output circuits, or over tuples of the index of the input circuit
+            and the output circuit if ``ordered`` is ``False``.
+        """
+        if callback is not None:
+            callback = _legacy_style_callback(callback)
+
+        return super().imap(
+            circuits,
+            callback=callback,
+            num_processes=num_processes,
+            ordered=ordered,
+            max_in_flight=max_in_flight,
+            property_set=property_set,
+            profiler=profiler,
+            pool=pool,
+            num_threads=num_threads,
         )
 
     def draw(self, filename=None, style=None, raw=False):
@@ -410,9 +548,47 @@ class StagedPassManager(PassManager):
         num_processes: int = None,
         *,
         property_set: dict[str, object] | None = None,
+        profiler: PassManagerProfiler | None = None,
+        pool: WorkerPool | None = None,
+        num_threads: int | None = None,
     ) -> _CircuitsT:
         self._update_passmanager()
-        return super().run(circuits, output_name, callback, num_processes=num_processes)
+        return super().run(
+            circuits,
+            output_name,
+            callback,
+            num_processes=num_processes,
+            property_set=property_set,
+            profiler=profiler,
+            pool=pool,
+            num_threads=num_threads,
+        )
+
+    def imap(
+        self,
+        circuits: Iterable[QuantumCircuit],
+        callback: Callable | None = None,
+        num_processes: int = None,
+        *,
+        ordered: bool = True,
+        max_in_flight: int | None = None,
+        property_set: dict[str, object] | None = None,
+        profiler: PassManagerProfiler | None = None,
+        pool: WorkerPool | None = None,
+        num_threads: int | None = None,
+    ) -> Iterator[QuantumCircuit] | Iterator[tuple[int, QuantumCircuit]]:
+        self._update_passmanager()
+        return super().imap(
+            circuits,
+            callback,
+            num_processes,
+            ordered=ordered,
+            max_in_flight=max_in_flight,
+            property_set=property_set,
+            profiler=profiler,
+            pool=pool,
+            num_threads=num_threads,
+        )
 
     def to_flow_controller(self) -> FlowControllerLinear:
         self._update_passmanager()
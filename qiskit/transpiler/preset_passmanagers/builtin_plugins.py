@@ -49,6 +49,7 @@ from qiskit.transpiler.passes.optimization import (
 )
 from qiskit.transpiler.passes import Depth, Size, FixedPoint, MinimumPoint
 from qiskit.transpiler.passes.utils.gates_basis import GatesInBasis
+from qiskit.transpiler.passes.utils.time_budget import time_budget_exhausted
 from qiskit.transpiler.passes.synthesis.unitary_synthesis import UnitarySynthesis
 from qiskit.passmanager.flow_controllers import ConditionalController, DoWhileController
 from qiskit.transpiler.timing_constraints import TimingConstraints
@@ -490,6 +491,8 @@ class OptimizationPassManager(PassManagerStagePlugin):
             ]
 
             def _opt_control(property_set):
+                if time_budget_exhausted(property_set):
+                    return False
                 return (not property_set["depth_fixed_point"]) or (
                     not property_set["size_fixed_point"]
                 )
@@ -1007,6 +1010,8 @@ class CliffordTOptimizationPassManager(PassManagerStagePlugin):
             _size_check = [Size(recurse=True), FixedPoint("size")]
 
             def _opt_control(property_set):
+                if time_budget_exhausted(property_set):
+                    return False
                 return (not property_set["depth_fixed_point"]) or (
                     not property_set["size_fixed_point"]
                 )
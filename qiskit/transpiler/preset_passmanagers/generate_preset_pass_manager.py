@@ -24,6 +24,8 @@ from qiskit.transpiler.coupling import CouplingMap
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.transpiler.instruction_durations import InstructionDurations
 from qiskit.transpiler.layout import Layout
+from qiskit.transpiler.passes.utils.time_budget import SetTimeBudget, CheckTimeBudget
+from qiskit.transpiler.passmanager import PassManager
 from qiskit.transpiler.passmanager_config import PassManagerConfig
 from qiskit.transpiler.preset_passmanagers.common import is_clifford_t_basis
 from qiskit.transpiler.target import Target, _FakeTarget
@@ -57,6 +59,7 @@ def generate_preset_pass_manager(
     optimization_method=None,
     dt=None,
     qubits_initially_zero=True,
+    time_budget=None,
     *,
     _skip_target=False,
 ):
@@ -179,6 +182,16 @@ def generate_preset_pass_manager(
             ``stage_name`` argument.
         qubits_initially_zero (bool): Indicates whether the input circuit is
                 zero-initialized.
+        time_budget (float): A wall-clock time budget in seconds for each run of the pass
+            manager.  If set, the stochastic stages reduce their effort to fit the budget:
+            :class:`.SabreLayout` runs its layout trials in batches until its share of the
+            remaining time is used, :class:`.VF2Layout` and :class:`.VF2PostLayout` limit their
+            search time, and the optimization loops stop when the deadline is reached.  These
+            stages always keep the best valid circuit found so far, so the output is valid
+            whatever the budget.  The budget is a target rather than a hard limit, since the
+            other passes run as usual.  The metrics of the run, such as the elapsed time, the
+            number of layout trials and whether the deadline was reached, are recorded in the
+            ``time_budget_metrics`` field of the property set.  See :class:`.SetTimeBudget`.
 
     Returns:
         StagedPassManager: The preset pass manager for the given options
@@ -317,6 +330,15 @@ def generate_preset_pass_manager(
         pm = level_3_pass_manager(pm_config)
     else:
         raise ValueError(f"Invalid optimization level {optimization_level}")
+    if time_budget is not None:
+        set_time_budget = PassManager([SetTimeBudget(time_budget)])
+        pm.pre_init = set_time_budget if pm.pre_init is None else set_time_budget + pm.pre_init
+        check_time_budget = PassManager([CheckTimeBudget()])
+        pm.post_scheduling = (
+            check_time_budget
+            if pm.post_scheduling is None
+            else pm.post_scheduling + check_time_budget
+        )
     return pm
 
 
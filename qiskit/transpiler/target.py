@@ -23,11 +23,14 @@ import itertools
 
 from typing import Optional, List, Any
 from collections.abc import Mapping
+import hashlib
 import io
 import copy
 import logging
 import inspect
+import math
 
+import numpy as np
 import rustworkx as rx
 
 # import target class from the rust side
@@ -244,6 +247,8 @@ class Target(BaseTarget):
         "_instruction_schedule_map",
         "_non_global_basis_strict",
         "_non_global_basis",
+        "_instructions_fingerprint",
+        "_derived",
     )
 
     def __new__(
@@ -324,6 +329,8 @@ class Target(BaseTarget):
         out._instruction_schedule_map = None
         out._non_global_basis = None
         out._non_global_basis_strict = None
+        out._instructions_fingerprint = None
+        out._derived = {}
         return out
 
     def get_non_global_operation_names(self, strict_direction=False):
@@ -467,6 +474,7 @@ class Target(BaseTarget):
         self._instruction_schedule_map = None
         self._non_global_basis_strict = None
         self._non_global_basis = None
+        self._invalidate_derived()
 
     def update_instruction_properties(self, instruction, qargs, properties):
         """Update the property object for an instruction qarg pair already in the Target.
@@ -486,8 +494,188 @@ class Target(BaseTarget):
         """
         super().update_instruction_properties(instruction, qargs, properties)
         self._gate_map[instruction][qargs] = properties
+        # The edges of the coupling graph hold the instruction properties.
+        self._coupling_graph = None
         self._instruction_durations = None
         self._instruction_schedule_map = None
+        self._invalidate_derived()
+
+    def fingerprint(self) -> str:
+        """Return a fingerprint of the contents of this target.
+
+        The fingerprint is a hash of the properties of the target that the transpiler uses: the
+        number of qubits, the timing constraints, the qubit properties, the concurrent
+        measurements, and the supported instructions with their qubits, durations, errors and
+        angle bounds.
+        Targets with the same contents have the same fingerprint, also across processes and
+        sessions of the same Qiskit version, so it can be used as a key to cache the results of
+        compiling for a target.
+
+        The hash of the instructions is cached, and is invalidated by :meth:`add_instruction` and
+        :meth:`update_instruction_properties`, so the fingerprint does not reflect changes that
+        bypass these methods, such as modifying an :class:`.InstructionProperties` in place.
+
+        Returns:
+            str: The fingerprint, as a hexadecimal string.
+        """
+        if self._instructions_fingerprint is None:
+            self._instructions_fingerprint = self._hash_instructions()
+        hasher = hashlib.sha256(self._instructions_fingerprint.encode())
+        hasher.update(
+            repr(
+                (
+                    self.num_qubits,
+                    self.dt,
+                    self.granularity,
+                    self.min_length,
+                    self.pulse_alignment,
+                    self.acquire_alignment,
+                    self.concurrent_measurements,
+                )
+            ).encode()
+        )
+        for properties in self.qubit_properties or ():
+            hasher.update(
+                repr(
+                    None
+                    if properties is None
+                    else (properties.t1, properties.t2, properties.frequency)
+                ).encode()
+            )
+        return hasher.hexdigest()
+
+    def _hash_instructions(self) -> str:
+        hasher = hashlib.sha256()
+        for name, qarg_properties in self._gate_map.items():
+            operation = self.operation_from_name(name)
+            if isinstance(operation, type):
+                description = (name, operation.__qualname__)
+            else:
+                description = (
+                    name,
+                    type(operation).__qualname__,
+                    operation.num_qubits,
+                    tuple(str(param) for param in operation.params),
+                )
+            hasher.update(repr(description).encode())
+            for qargs, properties in qarg_properties.items():
+                hasher.update(
+                    repr(
+                        (
+                            qargs,
+                            getattr(properties, "duration", None),
+                            getattr(properties, "error", None),
+                        )
+                    ).encode()
+                )
+        if self.has_angle_bounds():
+            # The bounds are only exposed through the state of the base target.
+            angle_bounds = super().__getstate__()["angle_bounds"]
+            hasher.update(repr(sorted(angle_bounds.items())).encode())
+        return hasher.hexdigest()
+
+    def _invalidate_derived(self):
+        self._instructions_fingerprint = None
+        self._derived.clear()
+
+    def _get_derived(self, name: str, build):
+        """Return the structure ``name`` derived from the instructions of this target.
+
+        The structure is built by calling ``build()`` the first time it is requested, and is then
+        shared by every user of this target, such as all the passes of a transpilation, until
+        :meth:`add_instruction` or :meth:`update_instruction_properties` is called.  The callers
+        must not modify the returned object.
+        """
+        try:
+            return self._derived[name]
+        except KeyError:
+            pass
+        out = build()
+        self._derived[name] = out
+        return out
+
+    def _distance_matrix(self) -> np.ndarray | None:
+        """Return the read-only undirected distance matrix of the coupling graph, with ``inf``
+        between disconnected qubits, or ``None`` if there are no connectivity constraints."""
+
+        def build():
+            coupling_map = self.build_coupling_map()
+            if coupling_map is None:
+                return None
+            out = rx.digraph_distance_matrix(
+                coupling_map.graph, as_undirected=True, null_value=math.inf
+            )
+            out.setflags(write=False)
+            return out
+
+        return self._get_derived("distance_matrix", build)
+
+    def _undirected_adjacency(self) -> tuple[tuple[int, ...], ...] | None:
+        """Return the sorted neighbors of each qubit in the undirected coupling graph, or
+        ``None`` if there are no connectivity constraints."""
+
+        def build():
+            coupling_map = self.build_coupling_map()
+            if coupling_map is None:
+                return None
+            graph = coupling_map.graph
+            return tuple(
+                tuple(sorted(graph.neighbors_undirected(node))) for node in graph.node_indices()
+            )
+
+        return self._get_derived("undirected_adjacency", build)
+
+    def _two_qubit_operation_names(self) -> frozenset[str]:
+        """Return the names of the two-qubit operations of this target."""
+
+        def build():
+            return frozenset(
+                name
+                for name in self._gate_map
+                if not isinstance(self.operation_from_name(name), type)
+                and self.operation_from_name(name).num_qubits == 2
+            )
+
+        return self._get_derived("two_qubit_operation_names", build)
+
+    def _average_errors(self) -> dict[tuple[int, ...], float]:
+        """Return the average error of the operations on each qargs, for the qargs with at least
+        one operation with an error."""
+
+        def build():
+            return {
+                qargs: sum(errors) / len(errors)
+                for qargs, errors in self._errors_by_qargs().items()
+                if errors
+            }
+
+        return self._get_derived("average_errors", build)
+
+    def _max_errors(self) -> dict[tuple[int, ...], float]:
+        """Return the largest error of the operations on each qargs, which is ``0.0`` for the
+        qargs with no operation with an error."""
+
+        def build():
+            return {
+                qargs: max(errors, default=0.0) for qargs, errors in self._errors_by_qargs().items()
+            }
+
+        return self._get_derived("max_errors", build)
+
+    def _errors_by_qargs(self) -> dict[tuple[int, ...], list[float]]:
+        def build():
+            out = {}
+            for qarg_properties in self._gate_map.values():
+                for qargs, properties in qarg_properties.items():
+                    if qargs is None:
+                        continue
+                    errors = out.setdefault(qargs, [])
+                    error = getattr(properties, "error", None)
+                    if error is not None:
+                        errors.append(error)
+            return out
+
+        return self._get_derived("errors_by_qargs", build)
 
     def qargs_for_operation_name(self, operation):
         """Get the qargs for a given operation name
@@ -684,6 +872,9 @@ class Target(BaseTarget):
                 cmap.graph = self._filter_coupling_graph()
             else:
                 cmap.graph = self._coupling_graph.copy()
+                # Share the distance matrix between all the coupling maps of this target.  It is
+                # read-only, and the coupling map drops it if its graph is modified.
+                cmap._dist_matrix = self._derived.get("distance_matrix")
             return cmap
         else:
             return None
@@ -1020,6 +1211,14 @@ class _FakeTarget(Target):
     def build_coupling_map(self, *args, **kwargs):  # pylint: disable=unused-argument
         return copy.deepcopy(self._coupling_map)
 
+    def _hash_instructions(self) -> str:
+        hasher = hashlib.sha256(super()._hash_instructions().encode())
+        if self._coupling_map is not None:
+            hasher.update(
+                repr((self._coupling_map.size(), sorted(self._coupling_map.get_edges()))).encode()
+            )
+        return hasher.hexdigest()
+
     def instruction_supported(self, *args, **kwargs):
         """Checks whether an instruction is supported by the
         Target based on instruction name and qargs. Note that if there are no
@@ -49,6 +49,14 @@ A helper function for calling a custom function with Python
 
 .. autofunction:: parallel_map
 
+Local jobs, such as those of the reference primitives and of :class:`.BasicSimulator`, can be run
+on a shared executor with a concurrency limit and a bounded queue.
+
+.. autoclass:: JobExecutor
+.. autoclass:: JobExecutorStatistics
+.. autofunction:: get_job_executor
+.. autofunction:: set_job_executor
+
 Optional Dependency Checkers
 ============================
 
@@ -73,8 +81,11 @@ from .parallel import (
     is_main_process,
     default_num_processes,
 )
+from .job_executor import JobExecutor, JobExecutorStatistics, get_job_executor, set_job_executor
 
 __all__ = [
+    "JobExecutor",
+    "JobExecutorStatistics",
     "LazyDependencyManager",
     "LazyImportTester",
     "LazySubprocessTester",
@@ -83,8 +94,10 @@ __all__ = [
     "default_num_processes",
     "deprecate_arg",
     "deprecate_func",
+    "get_job_executor",
     "is_main_process",
     "local_hardware_info",
     "parallel_map",
+    "set_job_executor",
     "should_run_in_parallel",
 ]
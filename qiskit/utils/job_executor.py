@@ -0,0 +1,248 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+A shared, bounded executor for running local jobs in background threads.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+from qiskit.exceptions import QiskitError
+
+
+@dataclass(frozen=True)
+class JobExecutorStatistics:
+    """A snapshot of the statistics of a :class:`.JobExecutor`.
+
+    All times are in seconds.
+    """
+
+    submitted: int
+    """The number of tasks accepted by the executor."""
+    rejected: int
+    """The number of tasks rejected because the queue was full."""
+    completed: int
+    """The number of tasks that finished running, successfully or not."""
+    running: int
+    """The number of tasks currently running."""
+    queue_depth: int
+    """The number of accepted tasks that are waiting for a worker."""
+    max_queue_depth: int
+    """The largest value of :attr:`queue_depth` seen so far."""
+    mean_queue_latency: float
+    """The mean time that started tasks waited for a worker."""
+    max_queue_latency: float
+    """The longest time that a started task waited for a worker."""
+    mean_run_time: float
+    """The mean running time of completed tasks."""
+
+
+class JobExecutor(Executor):
+    """A thread-based executor with a concurrency limit and a bounded queue.
+
+    At most ``max_workers`` tasks run at the same time, and at most ``max_queue_size`` further
+    tasks wait for a worker.  When the queue is full, :meth:`submit` applies backpressure: it
+    blocks until a slot is free, or raises a :class:`.QiskitError` if ``block`` is ``False`` or
+    if no slot is freed within ``timeout`` seconds.
+
+    An executor can be installed as the shared job executor with :func:`set_job_executor`, in which
+    case the jobs of the reference primitives (:class:`.PrimitiveJob`) and of the
+    :class:`.BasicSimulator` (:class:`.BasicProviderJob`) are run on it, rather than on a new
+    thread per job.
+
+    Example:
+
+        .. code-block:: python
+
+            from qiskit.utils import JobExecutor, set_job_executor
+
+            set_job_executor(JobExecutor(max_workers=4, max_queue_size=100))
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_queue_size: int | None = None,
+        *,
+        block: bool = True,
+        timeout: float | None = None,
+    ):
+        """
+        Args:
+            max_workers: The maximum number of tasks running at the same time.  If ``None``, the
+                default of :class:`~concurrent.futures.ThreadPoolExecutor` is used.
+            max_queue_size: The maximum number of tasks waiting for a worker.  If ``None``, the
+                queue is unbounded.
+            block: Whether :meth:`submit` waits for a free slot when the queue is full.
+            timeout: The maximum time, in seconds, that :meth:`submit` waits for a free slot.
+                If ``None``, wait indefinitely.
+
+        Raises:
+            ValueError: If ``max_workers`` is not positive or ``max_queue_size`` is negative.
+        """
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be positive, not {max_workers}")
+        if max_queue_size is not None and max_queue_size < 0:
+            raise ValueError(f"max_queue_size must not be negative, not {max_queue_size}")
+        self._max_workers = max_workers
+        self._max_queue_size = max_queue_size
+        self._block = block
+        self._timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="qiskit-job"
+        )
+        self._slots = (
+            None
+            if max_queue_size is None
+            else threading.BoundedSemaphore(max_workers + max_queue_size)
+        )
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._rejected = 0
+        self._completed = 0
+        self._running = 0
+        self._queue_depth = 0
+        self._max_queue_depth = 0
+        self._num_started = 0
+        self._total_queue_latency = 0.0
+        self._max_queue_latency = 0.0
+        self._total_run_time = 0.0
+
+    @property
+    def max_workers(self) -> int:
+        """The maximum number of tasks running at the same time."""
+        return self._max_workers
+
+    @property
+    def max_queue_size(self) -> int | None:
+        """The maximum number of tasks waiting for a worker, or ``None`` if unbounded."""
+        return self._max_queue_size
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        """Submit a callable to be run as ``fn(*args, **kwargs)``.
+
+        Returns:
+            A future representing the execution of the callable.
+
+        Raises:
+            QiskitError: If the queue is full and no slot became free in time.
+            RuntimeError: If the executor was shut down.
+        """
+        if not self._acquire_slot():
+            with self._lock:
+                self._rejected += 1
+            raise QiskitError(
+                f"The job queue is full ({self._max_queue_size} waiting and "
+                f"{self._max_workers} running tasks)."
+            )
+        submit_time = time.perf_counter()
+        with self._lock:
+            self._submitted += 1
+            self._queue_depth += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queue_depth)
+        started = threading.Event()
+        try:
+            future = self._executor.submit(self._call, started, submit_time, fn, args, kwargs)
+        except RuntimeError:
+            self._discard(started)
+            raise
+        future.add_done_callback(lambda _: self._discard(started))
+        return future
+
+    def _acquire_slot(self) -> bool:
+        if self._slots is None:
+            return True
+        # The slot is released by `_discard` once the task is done, so it is not held in a `with`
+        # block.
+        slots, timeout = self._slots, self._timeout if self._block else None
+        return slots.acquire(self._block, timeout)  # pylint: disable=consider-using-with
+
+    def _call(self, started, submit_time, fn, args, kwargs):
+        start_time = time.perf_counter()
+        with self._lock:
+            started.set()
+            self._queue_depth -= 1
+            self._running += 1
+            self._num_started += 1
+            latency = start_time - submit_time
+            self._total_queue_latency += latency
+            self._max_queue_latency = max(self._max_queue_latency, latency)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            run_time = time.perf_counter() - start_time
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+                self._total_run_time += run_time
+
+    def _discard(self, started):
+        # Called once a task is done, including when it was cancelled before starting.
+        with self._lock:
+            if not started.is_set():
+                self._queue_depth -= 1
+        if self._slots is not None:
+            self._slots.release()
+
+    def statistics(self) -> JobExecutorStatistics:
+        """Return a snapshot of the queue and latency statistics of this executor."""
+        with self._lock:
+            return JobExecutorStatistics(
+                submitted=self._submitted,
+                rejected=self._rejected,
+                completed=self._completed,
+                running=self._running,
+                queue_depth=self._queue_depth,
+                max_queue_depth=self._max_queue_depth,
+                mean_queue_latency=(
+                    self._total_queue_latency / self._num_started if self._num_started else 0.0
+                ),
+                max_queue_latency=self._max_queue_latency,
+                mean_run_time=self._total_run_time / self._completed if self._completed else 0.0,
+            )
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+_JOB_EXECUTOR: JobExecutor | None = None
+
+
+def get_job_executor() -> JobExecutor | None:
+    """Return the shared job executor set by :func:`set_job_executor`, if any."""
+    return _JOB_EXECUTOR
+
+
+def set_job_executor(executor: JobExecutor | None) -> JobExecutor | None:
+    """Set the shared executor that local jobs are run on.
+
+    When no shared executor is set, which is the default, each :class:`.PrimitiveJob` runs in its
+    own new thread and :class:`.BasicSimulator` runs jobs synchronously.
+
+    Args:
+        executor: The executor to use, or ``None`` to restore the default behavior.
+
+    Returns:
+        The previously set executor.  It is not shut down.
+    """
+    global _JOB_EXECUTOR  # pylint: disable=global-statement
+
+    previous, _JOB_EXECUTOR = _JOB_EXECUTOR, executor
+    return previous
@@ -60,6 +60,7 @@ import multiprocessing
 import os
 import platform
 import sys
+import threading
 import warnings
 from concurrent.futures import ProcessPoolExecutor
 
@@ -166,6 +167,9 @@ _PARALLEL_OVERRIDE = None
 _PARALLEL_IGNORE_USER_SETTINGS = False
 _IN_PARALLEL_ALLOW_PARALLELISM = "FALSE"
 _IN_PARALLEL_FORBID_PARALLELISM = "TRUE"
+_IN_PARALLEL_LOCK = threading.Lock()
+_IN_PARALLEL_DEPTH = 0
+_IN_PARALLEL_PREVIOUS = None
 
 
 @functools.cache
@@ -265,6 +269,35 @@ should_run_in_parallel.ignore_user_settings = _parallel_ignore_user_settings
 should_run_in_parallel.override = _parallel_override
 
 
+@contextlib.contextmanager
+def _forbid_nested_parallelism():
+    """A context manager within which the ``QISKIT_IN_PARALLEL`` environment variable tells
+    nested parallel regions, including those of child processes and of the multithreaded native
+    code, that they are already running in parallel.
+
+    The environment is shared by all the threads of the process, so the contexts entered from
+    several threads are counted, and only the last one to exit restores the previous value."""
+    global _IN_PARALLEL_DEPTH, _IN_PARALLEL_PREVIOUS  # pylint: disable=global-statement
+
+    with _IN_PARALLEL_LOCK:
+        if _IN_PARALLEL_DEPTH == 0:
+            _IN_PARALLEL_PREVIOUS = os.environ.get("QISKIT_IN_PARALLEL")
+            os.environ["QISKIT_IN_PARALLEL"] = _IN_PARALLEL_FORBID_PARALLELISM
+            should_run_in_parallel.cache_clear()
+        _IN_PARALLEL_DEPTH += 1
+    try:
+        yield
+    finally:
+        with _IN_PARALLEL_LOCK:
+            _IN_PARALLEL_DEPTH -= 1
+            if _IN_PARALLEL_DEPTH == 0:
+                if _IN_PARALLEL_PREVIOUS is None:
+                    os.environ.pop("QISKIT_IN_PARALLEL", None)
+                else:
+                    os.environ["QISKIT_IN_PARALLEL"] = _IN_PARALLEL_PREVIOUS
+                should_run_in_parallel.cache_clear()
+
+
 def parallel_map(task, values, task_args=(), task_kwargs=None, num_processes=None):
     """
     Parallel execution of a mapping of `values` to the function `task`. This
@@ -309,10 +342,6 @@ def parallel_map(task, values, task_args=(), task_kwargs=None, num_processes=Non
     work_items = ((task, value, task_args, task_kwargs) for value in values)
 
     # This isn't a user-set variable; we set this to talk to our own child processes.
-    previous_in_parallel = os.getenv("QISKIT_IN_PARALLEL", _IN_PARALLEL_ALLOW_PARALLELISM)
-    os.environ["QISKIT_IN_PARALLEL"] = _IN_PARALLEL_FORBID_PARALLELISM
-    try:
+    with _forbid_nested_parallelism():
         with ProcessPoolExecutor(max_workers=num_processes) as executor:
             return list(executor.map(_task_wrapper, work_items))
-    finally:
-        os.environ["QISKIT_IN_PARALLEL"] = previous_in_parallel
@@ -0,0 +1,42 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,no-member
+# pylint: disable=attribute-defined-outside-init
+
+from qiskit import transpile
+from qiskit.circuit.library import QFTGate, quantum_volume
+from qiskit.circuit import QuantumCircuit
+from qiskit.providers.basic_provider import BasicSimulator
+
+
+class BasicSimulatorFusionBench:
+    params = (
+        [10, 14, 18],
+        ["quantum_volume", "qft"],
+        [None, 2, 3, 4, 5],
+    )
+    param_names = ["num_qubits", "circuit", "fusion_max_qubits"]
+    timeout = 600
+
+    def setup(self, num_qubits, circuit, fusion_max_qubits):
+        self.backend = BasicSimulator(fusion_max_qubits=fusion_max_qubits)
+        if circuit == "quantum_volume":
+            qc = quantum_volume(num_qubits, seed=2025)
+        else:
+            qc = QuantumCircuit(num_qubits)
+            qc.append(QFTGate(num_qubits), qc.qubits)
+        qc.measure_all()
+        self.circuit = transpile(qc, self.backend, seed_transpiler=2025)
+
+    def time_run(self, *_):
+        self.backend.run(self.circuit, shots=1000, seed_simulator=2025).result()
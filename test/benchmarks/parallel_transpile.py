@@ -0,0 +1,50 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,no-member
+# pylint: disable=attribute-defined-outside-init
+
+from qiskit.circuit.library import quantum_volume
+from qiskit.passmanager import WorkerPool
+from qiskit.providers.fake_provider import GenericBackendV2
+from qiskit.transpiler import generate_preset_pass_manager
+from qiskit.utils import should_run_in_parallel
+
+
+class ParallelPassManagerRunBench:
+    params = (["serial", "threads", "processes", "pool"], [4])
+    param_names = ["mode", "workers"]
+    timeout = 600
+
+    def setup(self, mode, workers):
+        backend = GenericBackendV2(27, seed=2025)
+        self.pass_manager = generate_preset_pass_manager(2, backend, seed_transpiler=2025)
+        self.circuits = [quantum_volume(10, seed=2025 + i) for i in range(32)]
+        self.pool = WorkerPool(num_processes=workers) if mode == "pool" else None
+        if self.pool is not None:
+            # Start the workers, and load the pass manager in them.
+            self.pass_manager.run(self.circuits[: 2 * workers], pool=self.pool)
+
+    def teardown(self, *_):
+        if self.pool is not None:
+            self.pool.shutdown()
+
+    def time_run(self, mode, workers):
+        if mode == "serial":
+            self.pass_manager.run(self.circuits, num_processes=1)
+        elif mode == "threads":
+            self.pass_manager.run(self.circuits, num_threads=workers)
+        elif mode == "processes":
+            with should_run_in_parallel.override(True):
+                self.pass_manager.run(self.circuits, num_processes=workers)
+        else:
+            self.pass_manager.run(self.circuits, pool=self.pool)
@@ -0,0 +1,46 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,no-member
+# pylint: disable=attribute-defined-outside-init
+
+import numpy as np
+
+from qiskit.circuit.library import real_amplitudes
+from qiskit.primitives import StatevectorEstimator
+from qiskit.quantum_info import SparsePauliOp
+
+
+class StatevectorEstimatorBench:
+    params = (
+        [4, 8],
+        ["100,1", "1000,1", "100,10", "1,100"],
+        [False, True],
+    )
+    param_names = ["num_qubits", "num_bindings,num_observables", "batched"]
+    timeout = 300
+
+    def setup(self, num_qubits, shape, batched):
+        num_bindings, num_observables = map(int, shape.split(","))
+        rng = np.random.default_rng(2025)
+        self.circuit = real_amplitudes(num_qubits, reps=2)
+        params = rng.uniform(-np.pi, np.pi, (num_bindings, self.circuit.num_parameters))
+        labels = ["".join(rng.choice(list("IXYZ"), num_qubits)) for _ in range(4 * num_observables)]
+        observables = [
+            [SparsePauliOp(labels[4 * i : 4 * (i + 1)], rng.uniform(-1, 1, 4))]
+            for i in range(num_observables)
+        ]
+        self.pub = (self.circuit, observables, params)
+        self.estimator = StatevectorEstimator(batched=batched)
+
+    def time_run(self, *_):
+        self.estimator.run([self.pub]).result()
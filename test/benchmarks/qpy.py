@@ -0,0 +1,91 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=no-member,invalid-name,missing-docstring,no-name-in-module
+# pylint: disable=attribute-defined-outside-init,unsubscriptable-object
+
+import io
+from unittest import mock
+
+from qiskit import QuantumCircuit, qpy
+from qiskit.circuit import ParameterVector
+from qiskit.qpy.binary_io import circuits
+
+from .utils import random_circuit
+
+
+def _read_instructions_one_by_one(
+    file_obj,
+    circuit,
+    num_instructions,
+    registers,
+    custom_operations,
+    version,
+    vectors,
+    use_symengine,
+    standalone_vars,
+    annotation_state,
+):
+    # The loader before instructions of standard gates were read in bulk.
+    for _ in range(num_instructions):
+        circuits._read_instruction(
+            file_obj,
+            circuit,
+            registers,
+            custom_operations,
+            version,
+            vectors,
+            use_symengine,
+            standalone_vars,
+            annotation_state,
+        )
+
+
+def _layered_circuit(num_qubits, num_layers):
+    theta = ParameterVector("θ", num_qubits)
+    qc = QuantumCircuit(num_qubits)
+    for layer in range(num_layers):
+        for qubit in range(num_qubits):
+            qc.sx(qubit)
+            qc.rz(theta[qubit] if layer % 2 else 0.25 * layer, qubit)
+        for qubit in range(layer % 2, num_qubits - 1, 2):
+            qc.cx(qubit, qubit + 1)
+    qc.measure_all()
+    return qc
+
+
+class QpyLoadBenchmarks:
+    params = (["layered", "random"], [1_000, 10_000], ["bulk", "one_by_one"])
+    param_names = ["circuit", "depth", "loader"]
+    timeout = 600
+
+    def setup(self, circuit, depth, loader):
+        if circuit == "layered":
+            qc = _layered_circuit(50, depth)
+        else:
+            qc = random_circuit(20, depth // 10, measure=True, conditional=True, seed=42)
+        self.buffer = io.BytesIO()
+        qpy.dump(qc, self.buffer)
+        self.patch = None
+        if loader == "one_by_one":
+            self.patch = mock.patch.object(
+                circuits, "_read_instructions", _read_instructions_one_by_one
+            )
+            self.patch.start()
+
+    def teardown(self, *_):
+        if self.patch is not None:
+            self.patch.stop()
+
+    def time_load(self, *_):
+        self.buffer.seek(0)
+        qpy.load(self.buffer)
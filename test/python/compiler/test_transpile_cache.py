@@ -0,0 +1,366 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the transpilation cache."""
+
+import copy
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from ddt import ddt, data, unpack
+import numpy as np
+
+from qiskit import QuantumCircuit, transpile
+from qiskit.circuit import Parameter, Qubit
+from qiskit.circuit.library import RZGate, RZZGate, SXGate, efficient_su2
+from qiskit.compiler import (
+    TranspileCache,
+    clear_pass_manager_cache,
+    set_pass_manager_cache_size,
+)
+from qiskit.compiler import transpile_cache
+from qiskit.dagcircuit import DAGCircuit
+from qiskit.providers.fake_provider import GenericBackendV2
+from qiskit.transpiler import (
+    InstructionProperties,
+    Layout,
+    Target,
+    WrapAngleRegistry,
+    generate_preset_pass_manager,
+)
+from test import QiskitTestCase  # pylint: disable=wrong-import-order
+
+
+def _wrap_rzz(angles, _qubits):
+    """Split an ``rzz`` gate with a positive angle into gates with angles of at most pi / 2."""
+    angle = angles[0]
+    dag = DAGCircuit()
+    dag.add_qubits([Qubit(), Qubit()])
+    while angle > np.pi / 2:
+        dag.apply_operation_back(RZZGate(np.pi / 2), dag.qubits)
+        angle -= np.pi / 2
+    dag.apply_operation_back(RZZGate(angle), dag.qubits)
+    return dag
+
+
+@ddt
+class TestTranspileCache(QiskitTestCase):
+    """Tests for TranspileCache."""
+
+    def setUp(self):
+        super().setUp()
+        self.backend = GenericBackendV2(7, seed=42)
+
+    def test_hit_rebinds_parameters(self):
+        """Test that a circuit with different parameters hits, and gets its own parameters."""
+        cache = TranspileCache()
+        first = efficient_su2(5, reps=2)
+        transpile(first, self.backend, seed_transpiler=7, cache=cache)
+        second = efficient_su2(5, reps=2, parameter_prefix="x")
+        second.metadata = {"job": 2}
+        with patch("qiskit.compiler.transpiler.generate_preset_pass_manager") as generate:
+            out = transpile(second, self.backend, seed_transpiler=7, cache=cache)
+        generate.assert_not_called()
+        expected = transpile(second, self.backend, seed_transpiler=7)
+        self.assertEqual(out, expected)
+        self.assertEqual(out.layout, expected.layout)
+        self.assertEqual(out.parameters, second.parameters)
+        self.assertEqual(out.name, second.name)
+        self.assertEqual(out.metadata, {"job": 2})
+        stats = cache.statistics()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (1, 1, 1))
+        self.assertEqual(stats.hit_rate, 0.5)
+
+    def test_hit_rebinds_values(self):
+        """Test that a circuit with different bound values hits, and gets its own values."""
+        cache = TranspileCache()
+        circuit = efficient_su2(4, reps=1)
+        first = circuit.assign_parameters([0.1 * i for i in range(circuit.num_parameters)])
+        values = [0.3 * i - 1.0 for i in range(circuit.num_parameters)]
+        second = circuit.assign_parameters(values)
+        transpile(first, self.backend, seed_transpiler=7, cache=cache)
+        with patch("qiskit.compiler.transpiler.generate_preset_pass_manager") as generate:
+            out = transpile(second, self.backend, seed_transpiler=7, cache=cache)
+        generate.assert_not_called()
+        self.assertEqual(out.num_parameters, 0)
+        expected = transpile(circuit, self.backend, seed_transpiler=7)
+        self.assertEqual(out, expected.assign_parameters(dict(zip(circuit.parameters, values))))
+        stats = cache.statistics()
+        self.assertEqual((stats.hits, stats.misses), (1, 1))
+
+    def test_key(self):
+        """Test that the key depends on the structure, target and options, but not on values."""
+        cache = TranspileCache()
+        theta = Parameter("θ")
+        qc = QuantumCircuit(2)
+        qc.rx(theta, 0)
+        qc.cx(0, 1)
+        bound = qc.assign_parameters([0.5])
+        transpile([qc, bound], self.backend, seed_transpiler=1, cache=cache)
+        transpile(qc.assign_parameters([0.25]), self.backend, seed_transpiler=1, cache=cache)
+        transpile(qc, self.backend, seed_transpiler=2, cache=cache)
+        transpile(qc, self.backend, optimization_level=1, seed_transpiler=1, cache=cache)
+        target = copy.deepcopy(self.backend.target)
+        target.update_instruction_properties("cx", (0, 1), InstructionProperties(error=0.5))
+        transpile(qc, target=target, seed_transpiler=1, cache=cache)
+        self.assertEqual(cache.statistics().misses, 5)
+        self.assertEqual(cache.statistics().hits, 1)
+        transpile([bound, qc], self.backend, seed_transpiler=1, cache=cache)
+        self.assertEqual(cache.statistics().hits, 3)
+
+    def test_key_fixed_parameters(self):
+        """Test that bound values are part of the key for targets with fixed-angle instructions."""
+        cache = TranspileCache()
+        target = copy.deepcopy(self.backend.target)
+        target.add_instruction(RZGate(np.pi / 4), {(0,): None}, name="rz_pi4")
+        qc = QuantumCircuit(2)
+        qc.rz(0.5, 0)
+        qc.cx(0, 1)
+        other = QuantumCircuit(2)
+        other.rz(0.25, 0)
+        other.cx(0, 1)
+        for circuit in (qc, other, qc):
+            out = transpile(circuit, target=target, seed_transpiler=1, cache=cache)
+            self.assertEqual(out, transpile(circuit, target=target, seed_transpiler=1))
+        stats = cache.statistics()
+        self.assertEqual((stats.hits, stats.misses), (1, 2))
+
+    def test_key_angle_bounds(self):
+        """Test that bound values are part of the key for targets with angle bounds."""
+        registry = WrapAngleRegistry()
+        registry.add_wrapper("rzz", _wrap_rzz)
+        self.enterContext(
+            patch("qiskit.transpiler.passes.utils.wrap_angles.WRAP_ANGLE_REGISTRY", registry)
+        )
+        cache = TranspileCache()
+        target = Target(num_qubits=2)
+        target.add_instruction(RZZGate(Parameter("t")), angle_bounds=[(0, np.pi / 2)])
+        target.add_instruction(RZGate(Parameter("t")))
+        target.add_instruction(SXGate())
+        qc = QuantumCircuit(2)
+        qc.rzz(3.0, 0, 1)
+        other = QuantumCircuit(2)
+        other.rzz(1.0, 0, 1)
+        for circuit in (qc, other, qc):
+            out = transpile(circuit, target=target, optimization_level=1, cache=cache)
+            self.assertEqual(out, transpile(circuit, target=target, optimization_level=1))
+            for instruction in out.data:
+                if instruction.name == "rzz":
+                    self.assertTrue(0 <= float(instruction.params[0]) <= np.pi / 2)
+        stats = cache.statistics()
+        self.assertEqual((stats.hits, stats.misses), (1, 2))
+
+    def test_partial_hit(self):
+        """Test that only the missed circuits of a list are transpiled."""
+        cache = TranspileCache()
+        circuits = [efficient_su2(3, reps=reps) for reps in (1, 2, 3)]
+        transpile(circuits[1], self.backend, seed_transpiler=5, cache=cache)
+        out = transpile(
+            circuits, self.backend, seed_transpiler=5, output_name=["a", "b", "c"], cache=cache
+        )
+        self.assertEqual(out, transpile(circuits, self.backend, seed_transpiler=5))
+        self.assertEqual([circuit.name for circuit in out], ["a", "b", "c"])
+        stats = cache.statistics()
+        self.assertEqual((stats.hits, stats.misses), (1, 3))
+
+    def test_bypass(self):
+        """Test that calls with a callback are not cached."""
+        cache = TranspileCache()
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.cx(0, 1)
+        for _ in range(2):
+            transpile(qc, self.backend, callback=lambda **_: None, cache=cache)
+        stats = cache.statistics()
+        self.assertEqual((stats.hits, stats.misses, stats.bypassed), (0, 0, 2))
+
+    @data(
+        ("lru", [0, 1, 0], 0),
+        ("lru", [0, 0, 1], 1),
+        ("lfu", [0, 1, 0], 0),
+        ("lfu", [0, 0, 1], 0),
+        ("fifo", [0, 1, 0], 1),
+        ("fifo", [0, 0, 1], 1),
+    )
+    @unpack
+    def test_eviction(self, policy, uses, kept):
+        """Test which entry the eviction policies keep."""
+        cache = TranspileCache(max_size=2, policy=policy)
+        circuits = [QuantumCircuit(1) for _ in range(3)]
+        for i, circuit in enumerate(circuits):
+            for _ in range(i + 1):
+                circuit.rx(0.1, 0)
+        for index in uses + [2]:
+            transpile(circuits[index], self.backend, seed_transpiler=1, cache=cache)
+        self.assertEqual(cache.statistics().evictions, 1)
+        hits = cache.statistics().hits
+        transpile(circuits[kept], self.backend, seed_transpiler=1, cache=cache)
+        self.assertEqual(cache.statistics().hits, hits + 1)
+
+    def test_disk(self):
+        """Test the on-disk store."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        circuits = [efficient_su2(3, reps=reps) for reps in (1, 2, 3)]
+        writer = TranspileCache(directory=directory, max_disk_size=2)
+        expected = transpile(circuits, self.backend, seed_transpiler=3, cache=writer)
+        self.assertEqual(len(os.listdir(directory)), 2)
+        self.assertEqual(writer.statistics().evictions, 1)
+
+        reader = TranspileCache(directory=directory)
+        out = transpile(circuits, self.backend, seed_transpiler=3, cache=reader)
+        self.assertEqual(out, expected)
+        stats = reader.statistics()
+        self.assertEqual((stats.hits, stats.disk_hits, stats.misses), (2, 2, 1))
+
+        reader.clear(disk=True)
+        self.assertEqual(os.listdir(directory), [])
+        self.assertEqual(len(reader), 0)
+
+    def test_invalid_arguments(self):
+        """Test invalid constructor arguments."""
+        with self.assertRaises(ValueError):
+            TranspileCache(policy="random")
+        with self.assertRaises(ValueError):
+            TranspileCache(max_size=0)
+
+
+class TestPassManagerCache(QiskitTestCase):
+    """Tests for the reuse of preset pass managers by transpile."""
+
+    def setUp(self):
+        super().setUp()
+        self.backend = GenericBackendV2(5, seed=42)
+        self.circuit = efficient_su2(4, reps=1)
+        clear_pass_manager_cache()
+        self.addCleanup(clear_pass_manager_cache)
+
+    def test_reuse(self):
+        """Test that the pass manager is built once for calls with the same options."""
+        expected = transpile(self.circuit, self.backend, seed_transpiler=3)
+        with patch("qiskit.compiler.transpiler.generate_preset_pass_manager") as generate:
+            out = transpile(self.circuit, self.backend, seed_transpiler=3)
+        generate.assert_not_called()
+        self.assertEqual(out, expected)
+        self.assertEqual(len(transpile_cache._PASS_MANAGER_CACHE), 1)
+
+        transpile(self.circuit, self.backend, seed_transpiler=4)
+        transpile(self.circuit, self.backend, optimization_level=1, seed_transpiler=3)
+        transpile(self.circuit, GenericBackendV2(5, seed=43), seed_transpiler=3)
+        self.assertEqual(len(transpile_cache._PASS_MANAGER_CACHE), 4)
+
+    def test_target_modified_in_place(self):
+        """Test that a pass manager is not reused after its target is modified in place."""
+        target = copy.deepcopy(self.backend.target)
+        equal_target = copy.deepcopy(target)
+        transpile(self.circuit, target=target, seed_transpiler=3)
+        target.update_instruction_properties("cx", (0, 1), InstructionProperties(error=0.5))
+        out = transpile(self.circuit, target=equal_target, seed_transpiler=3)
+        clear_pass_manager_cache()
+        self.assertEqual(out, transpile(self.circuit, target=equal_target, seed_transpiler=3))
+
+    def test_other_target_object(self):
+        """Test that a pass manager is only reused for the target object it was built for."""
+        target = copy.deepcopy(self.backend.target)
+        transpile(self.circuit, target=target, seed_transpiler=3)
+        with patch(
+            "qiskit.compiler.transpiler.generate_preset_pass_manager",
+            wraps=generate_preset_pass_manager,
+        ) as generate:
+            transpile(self.circuit, target=copy.deepcopy(target), seed_transpiler=3)
+            transpile(self.circuit, target=target, seed_transpiler=3)
+        self.assertEqual(generate.call_count, 1)
+
+        # State that is not part of the fingerprint must not leak between targets either.
+        registry = WrapAngleRegistry()
+        registry.add_wrapper("rzz", _wrap_rzz)
+        self.enterContext(
+            patch("qiskit.transpiler.passes.utils.wrap_angles.WRAP_ANGLE_REGISTRY", registry)
+        )
+        unbounded = Target(num_qubits=2)
+        unbounded.add_instruction(RZZGate(Parameter("t")))
+        bounded = Target(num_qubits=2)
+        bounded.add_instruction(RZZGate(Parameter("t")), angle_bounds=[(0, np.pi / 2)])
+        qc = QuantumCircuit(2)
+        qc.rzz(3.0, 0, 1)
+        transpile(qc, target=unbounded, optimization_level=1)
+        out = transpile(qc, target=bounded, optimization_level=1)
+        self.assertEqual([float(inst.params[0]) for inst in out.data], [np.pi / 2, 3.0 - np.pi / 2])
+
+    def test_not_cached(self):
+        """Test that calls with options that have no stable key do not cache the pass manager."""
+        transpile(
+            self.circuit,
+            self.backend,
+            initial_layout=Layout.from_intlist([0, 1, 2, 3], *self.circuit.qregs),
+        )
+        self.assertEqual(len(transpile_cache._PASS_MANAGER_CACHE), 0)
+
+    def test_size(self):
+        """Test that the number of pass managers can be limited, and the reuse turned off."""
+        self.addCleanup(set_pass_manager_cache_size, 16)
+        for seed in range(3):
+            transpile(self.circuit, self.backend, seed_transpiler=seed)
+        set_pass_manager_cache_size(1)
+        self.assertEqual(len(transpile_cache._PASS_MANAGER_CACHE), 1)
+
+        set_pass_manager_cache_size(0)
+        self.assertEqual(len(transpile_cache._PASS_MANAGER_CACHE), 0)
+        with patch(
+            "qiskit.compiler.transpiler.generate_preset_pass_manager",
+            wraps=generate_preset_pass_manager,
+        ) as generate:
+            transpile(self.circuit, self.backend, seed_transpiler=3)
+            transpile(self.circuit, self.backend, seed_transpiler=3)
+        self.assertEqual(generate.call_count, 2)
+        self.assertEqual(len(transpile_cache._PASS_MANAGER_CACHE), 0)
+
+        with self.assertRaises(ValueError):
+            set_pass_manager_cache_size(-1)
+
+    def test_mutable_options_copied(self):
+        """Test that a cached pass manager does not share the mutable options of the caller."""
+        config = {"min_qubits": 3}
+        initial_layout = [0, 1, 2, 3]
+        with patch(
+            "qiskit.compiler.transpiler.generate_preset_pass_manager",
+            wraps=generate_preset_pass_manager,
+        ) as generate:
+            transpile(
+                self.circuit,
+                self.backend,
+                initial_layout=initial_layout,
+                unitary_synthesis_plugin_config=config,
+            )
+        kwargs = generate.call_args.kwargs
+        self.assertEqual(kwargs["unitary_synthesis_plugin_config"], config)
+        self.assertIsNot(kwargs["unitary_synthesis_plugin_config"], config)
+        self.assertEqual(kwargs["initial_layout"], initial_layout)
+        self.assertIsNot(kwargs["initial_layout"], initial_layout)
+
+        # The modified options are a new key, rather than a hit on the pass manager built for the
+        # old ones.
+        config["min_qubits"] = 1
+        with patch(
+            "qiskit.compiler.transpiler.generate_preset_pass_manager",
+            wraps=generate_preset_pass_manager,
+        ) as generate:
+            transpile(
+                self.circuit,
+                self.backend,
+                initial_layout=initial_layout,
+                unitary_synthesis_plugin_config=config,
+            )
+        generate.assert_called_once()
+        self.assertEqual(len(transpile_cache._PASS_MANAGER_CACHE), 2)
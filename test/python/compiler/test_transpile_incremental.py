@@ -0,0 +1,130 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for incremental transpilation."""
+
+from ddt import ddt, data
+
+from qiskit import QuantumCircuit, transpile
+from qiskit.circuit.library import quantum_volume
+from qiskit.compiler import transpile_incremental
+from qiskit.providers.fake_provider import GenericBackendV2
+from qiskit.quantum_info import Operator
+from qiskit.transpiler import CouplingMap, PassManager, TranspilerError
+from qiskit.transpiler.passes import CheckMap, GatesInBasis
+from test import QiskitTestCase  # pylint: disable=wrong-import-order
+
+
+@ddt
+class TestTranspileIncremental(QiskitTestCase):
+    """Tests for transpile_incremental."""
+
+    def setUp(self):
+        super().setUp()
+        self.backend = GenericBackendV2(5, coupling_map=CouplingMap.from_line(5), seed=42)
+
+    def assertValid(self, out, expected):
+        """Assert that ``out`` is an ISA circuit equivalent to ``expected``."""
+        check = PassManager(
+            [CheckMap(self.backend.target), GatesInBasis(target=self.backend.target)]
+        )
+        check.run(out)
+        self.assertTrue(check.property_set["is_swap_mapped"])
+        self.assertTrue(check.property_set["all_gates_in_basis"])
+        self.assertTrue(Operator.from_circuit(out).equiv(Operator(expected)))
+
+    @data(0, 1, 2, 3)
+    def test_segments(self, optimization_level):
+        """Test that appending segments one at a time is equivalent to the whole circuit."""
+        full = QuantumCircuit(5)
+        out = None
+        for seed in range(4):
+            segment = quantum_volume(5, seed=seed)
+            full.compose(segment, inplace=True)
+            if out is None:
+                out = transpile(
+                    segment,
+                    self.backend,
+                    optimization_level=optimization_level,
+                    seed_transpiler=1,
+                )
+            else:
+                out = transpile_incremental(
+                    out,
+                    segment,
+                    self.backend,
+                    optimization_level=optimization_level,
+                    seed_transpiler=1,
+                )
+            self.assertValid(out, full)
+
+    def test_starts_from_final_layout(self):
+        """Test that the segment starts where the qubits are at the end of the circuit."""
+        circuit = QuantumCircuit(5)
+        circuit.cx(0, 4)
+        circuit.cx(1, 3)
+        out = transpile(circuit, self.backend, initial_layout=range(5), seed_transpiler=1)
+        positions = out.layout.final_index_layout()
+        segment = QuantumCircuit(5)
+        segment.x(0)
+        appended = transpile_incremental(out, segment, self.backend, seed_transpiler=1)
+        self.assertEqual(appended.size() - out.size(), 1)
+        last = appended.data[-1]
+        self.assertEqual(last.operation.name, "x")
+        self.assertEqual(appended.find_bit(last.qubits[0]).index, positions[0])
+        self.assertEqual(appended.layout.final_index_layout(), positions)
+        self.assertEqual(appended.layout.initial_index_layout(), out.layout.initial_index_layout())
+        self.assertValid(appended, circuit.compose(segment))
+
+    def test_does_not_modify_input(self):
+        """Test that the input circuit is not modified."""
+        out = transpile(quantum_volume(5, seed=1), self.backend, seed_transpiler=1)
+        expected = out.copy()
+        transpile_incremental(out, quantum_volume(5, seed=2), self.backend, seed_transpiler=1)
+        self.assertEqual(out, expected)
+        self.assertEqual(out.layout, expected.layout)
+
+    def test_clbits(self):
+        """Test that the clbits of the segment are the clbits of the transpiled circuit."""
+        circuit = QuantumCircuit(5, 5)
+        circuit.h(0)
+        circuit.cx(0, 4)
+        out = transpile(circuit, self.backend, seed_transpiler=1)
+        segment = QuantumCircuit(5, 2)
+        segment.measure([4, 0], [0, 1])
+        appended = transpile_incremental(out, segment, self.backend, seed_transpiler=1)
+        measures = [inst for inst in appended.data if inst.operation.name == "measure"]
+        self.assertEqual([appended.find_bit(inst.clbits[0]).index for inst in measures], [0, 1])
+        positions = appended.layout.final_index_layout()
+        self.assertEqual(
+            [appended.find_bit(inst.qubits[0]).index for inst in measures],
+            [positions[4], positions[0]],
+        )
+
+    def test_without_layout(self):
+        """Test appending to a circuit that was transpiled without a coupling map."""
+        circuit = QuantumCircuit(3)
+        circuit.h(0)
+        out = transpile(circuit, basis_gates=["rz", "sx", "cx"])
+        self.assertIsNone(out.layout)
+        segment = QuantumCircuit(3)
+        segment.cx(0, 2)
+        appended = transpile_incremental(out, segment)
+        self.assertTrue(Operator(appended).equiv(Operator(circuit.compose(segment))))
+
+    def test_wrong_width(self):
+        """Test that the segment must have the qubits of the original circuit."""
+        out = transpile(quantum_volume(5, seed=1), self.backend, seed_transpiler=1)
+        with self.assertRaises(TranspilerError):
+            transpile_incremental(out, QuantumCircuit(4), self.backend)
+        with self.assertRaises(TranspilerError):
+            transpile_incremental(out, QuantumCircuit(5, 1), self.backend)
@@ -13,10 +13,24 @@
 
 """Pass manager test cases."""
 
-from test.python.passmanager import PassManagerTestCase
-
-from qiskit.passmanager import GenericPass, BasePassManager
+import io
+import json
+import os
+from unittest.mock import patch
+
+import ddt
+
+from test.python.passmanager import PassManagerTestCase  # pylint: disable=wrong-import-order
+
+from qiskit.passmanager import (
+    GenericPass,
+    BasePassManager,
+    PassManagerError,
+    PassManagerProfiler,
+    WorkerPool,
+)
 from qiskit.passmanager.flow_controllers import DoWhileController, ConditionalController
+from qiskit.utils import should_run_in_parallel
 
 
 class RemoveFive(GenericPass):
@@ -42,6 +56,7 @@ class ToyPassManager(BasePassManager):
         return int(passmanager_ir)
 
 
+@ddt.ddt
 class TestPassManager(PassManagerTestCase):
     def test_single_task(self):
         """Test case: Pass manager with a single task."""
@@ -167,3 +182,146 @@ class TestPassManager(PassManagerTestCase):
 
         pm = IntPassManager([ZeroPass()])
         self.assertEqual(pm.run(5), 0)
+
+    def test_profiler(self):
+        """Test that the profiler records nested tasks, and exports them."""
+
+        class DigitsPassManager(ToyPassManager):
+            def _passmanager_ir_metrics(self, passmanager_ir):
+                return {"size": len(passmanager_ir)}
+
+        def _condition(property_set):
+            return property_set["ndigits"] < 7
+
+        controller = DoWhileController([AddDigit(), CountDigits()], do_while=_condition)
+        pm = DigitsPassManager([RemoveFive(), controller])
+        profiler = PassManagerProfiler()
+        self.assertEqual(pm.run([12345, 67], profiler=profiler), [1234000, 6700000])
+
+        profiles = profiler.profiles
+        self.assertEqual(
+            [(p.name, p.kind, p.nesting, p.program) for p in profiles if p.program == 0],
+            [
+                ("RemoveFive", "pass", 1, 0),
+                ("AddDigit", "pass", 2, 0),
+                ("CountDigits", "pass", 2, 0),
+                ("AddDigit", "pass", 2, 0),
+                ("CountDigits", "pass", 2, 0),
+                ("AddDigit", "pass", 2, 0),
+                ("CountDigits", "pass", 2, 0),
+                ("DoWhileController", "controller", 1, 0),
+                ("FlowControllerLinear", "controller", 0, 0),
+            ],
+        )
+        self.assertEqual(profiles[0].ir_before, {"size": 5})
+        self.assertEqual(profiles[0].ir_after, {"size": 4})
+        self.assertEqual(profiles[-1].ir_after, {"size": 7})
+        for profile in profiles:
+            self.assertGreaterEqual(profile.wall_time, 0.0)
+            self.assertGreaterEqual(profile.cpu_time, 0.0)
+
+        trace = profiler.to_chrome_trace()
+        events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+        self.assertEqual(len(events), len(profiles))
+        self.assertEqual(events[0]["name"], "RemoveFive")
+        self.assertEqual(events[0]["args"]["size_before"], 5)
+        self.assertEqual({event["tid"] for event in events}, {0, 1})
+        buffer = io.StringIO()
+        profiler.write_chrome_trace(buffer)
+        self.assertEqual(json.loads(buffer.getvalue()), trace)
+
+        summary = profiler.summary().splitlines()
+        self.assertIn("Calls", summary[1])
+        self.assertEqual(
+            {line.split()[0] for line in summary[3:-1]}, {"RemoveFive", "AddDigit", "CountDigits"}
+        )
+
+    def test_profiler_parallel(self):
+        """Test that the profiles of parallel runs are collected."""
+        pm = ToyPassManager([RemoveFive(), AddDigit()])
+        profiler = PassManagerProfiler(ir_metrics=False)
+        with patch("qiskit.passmanager.passmanager.should_run_in_parallel", return_value=True):
+            out = pm.run([15, 25, 35], profiler=profiler, num_processes=2)
+        self.assertEqual(out, [10, 20, 30])
+        self.assertEqual(len(profiler.profiles), 9)
+        self.assertEqual({profile.program for profile in profiler.profiles}, {0, 1, 2})
+        self.assertTrue(all(profile.ir_before == {} for profile in profiler.profiles))
+
+    def test_threads(self):
+        """Test running programs in threads, with the callback and the profiler."""
+        pm = ToyPassManager([RemoveFive(), AddDigit()])
+        profiler = PassManagerProfiler(ir_metrics=False)
+        calls = []
+        out = pm.run(
+            [15, 25, 35],
+            callback=lambda **kwargs: calls.append(kwargs["passmanager_ir"]),
+            profiler=profiler,
+            num_threads=2,
+        )
+        self.assertEqual(out, [10, 20, 30])
+        self.assertEqual(len(calls), 6)
+        self.assertEqual(
+            [profile.program for profile in profiler.profiles], [0, 0, 0, 1, 1, 1, 2, 2, 2]
+        )
+        self.assertEqual(os.getenv("QISKIT_IN_PARALLEL", "FALSE"), "FALSE")
+
+    def test_imap(self):
+        """Test streaming programs through a pass manager serially."""
+        pm = ToyPassManager([RemoveFive(), AddDigit()])
+        read = []
+
+        def programs():
+            for program in (15, 25, 35):
+                read.append(program)
+                yield program
+
+        out = pm.imap(programs())
+        self.assertEqual(read, [])
+        self.assertEqual(next(out), 10)
+        self.assertEqual(read, [15])
+        self.assertEqual(list(out), [20, 30])
+        self.assertEqual(list(pm.imap([15, 25], ordered=False)), [(0, 10), (1, 20)])
+
+    @ddt.data("threads", "processes", "pool")
+    def test_imap_parallel(self, mode):
+        """Test streaming programs through a pass manager in parallel."""
+        pm = ToyPassManager([RemoveFive(), AddDigit()])
+        expected = pm.run(list(range(15, 100, 10)))
+        profiler = PassManagerProfiler(ir_metrics=False)
+        read = []
+
+        def programs():
+            for program in range(15, 100, 10):
+                read.append(program)
+                yield program
+
+        with WorkerPool(num_processes=2) as pool, should_run_in_parallel.override(True):
+            kwargs = {
+                "threads": {"num_threads": 2},
+                "processes": {"num_processes": 2},
+                "pool": {"pool": pool},
+            }[mode]
+            out = pm.imap(programs(), max_in_flight=3, profiler=profiler, **kwargs)
+            self.assertEqual(next(out), 10)
+            self.assertLessEqual(len(read), 4)
+            self.assertEqual(list(out), expected[1:])
+            unordered = pm.imap(range(15, 100, 10), ordered=False, **kwargs)
+            self.assertEqual(sorted(unordered), list(enumerate(expected)))
+        self.assertEqual(len(profiler.profiles), 27)
+        self.assertEqual({profile.program for profile in profiler.profiles}, set(range(9)))
+
+    def test_imap_invalid_max_in_flight(self):
+        """Test that a non-positive number of programs in flight is rejected."""
+        with self.assertRaises(ValueError):
+            ToyPassManager([RemoveFive()]).imap([1, 2], max_in_flight=0)
+
+    def test_worker_pool(self):
+        """Test that a worker pool runs programs, and collects their profiles."""
+        pm = ToyPassManager([RemoveFive(), AddDigit()])
+        profiler = PassManagerProfiler()
+        with WorkerPool(num_processes=2) as pool:
+            self.assertEqual(pm.run([15, 25, 35], pool=pool), [10, 20, 30])
+            self.assertEqual(pm.run([55, 45], pool=pool, profiler=profiler), [0, 40])
+        self.assertEqual({profile.program for profile in profiler.profiles}, {0, 1})
+        with self.assertRaises(PassManagerError):
+            pm.run([1, 2], pool=pool)
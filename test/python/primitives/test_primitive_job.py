@@ -12,6 +12,7 @@
 
 """Tests for PrimitiveJob."""
 
+import asyncio
 import pickle
 from test import QiskitTestCase
 
@@ -19,7 +20,8 @@ import numpy as np
 from ddt import data, ddt
 
 from qiskit import QuantumCircuit
-from qiskit.primitives import PrimitiveJob, StatevectorSampler
+from qiskit.primitives import PrimitiveJob, StatevectorEstimator, StatevectorSampler
+from qiskit.providers import JobStatus
 
 
 @ddt
@@ -49,3 +51,40 @@ class TestPrimitiveJob(QiskitTestCase):
             self.assertEqual(sampler_pub.metadata, sampler_pub.metadata)
             self.assertEqual(sampler_pub.data.keys(), sampler_pub.data.keys())
             np.testing.assert_allclose(sampler_pub.join_data().array, sampler_pub.join_data().array)
+
+    def test_result_async(self):
+        """Test awaiting the result of jobs."""
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.measure_all()
+        sampler = StatevectorSampler(seed=12)
+        target = sampler.run([qc]).result()
+
+        async def main():
+            jobs = [sampler.run([qc]) for _ in range(3)]
+            results = await asyncio.gather(jobs[0].result_async(), jobs[1], jobs[2])
+            return jobs, results
+
+        jobs, results = asyncio.run(main())
+        for job, result in zip(jobs, results):
+            self.assertEqual(job.status(), JobStatus.DONE)
+            self.assertEqual(result[0].data.meas, target[0].data.meas)
+
+    def test_run_async(self):
+        """Test the async run entry points of the reference primitives."""
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.cx(0, 1)
+        sampler_qc = qc.measure_all(inplace=False)
+
+        async def main():
+            return await asyncio.gather(
+                StatevectorEstimator().run_async([(qc, "ZZ"), (qc, "XI")]),
+                StatevectorSampler(seed=1).run_async([sampler_qc], shots=10),
+            )
+
+        estimator_result, sampler_result = asyncio.run(main())
+        np.testing.assert_allclose(estimator_result[0].data.evs, 1)
+        np.testing.assert_allclose(estimator_result[1].data.evs, 0, atol=1e-12)
+        self.assertEqual(sampler_result[0].data.meas.num_shots, 10)
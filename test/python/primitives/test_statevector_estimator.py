@@ -13,17 +13,19 @@
 """Tests for Estimator."""
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 from test import QiskitTestCase
 
 import numpy as np
 
 from qiskit.circuit import Parameter, QuantumCircuit
 from qiskit.circuit.library import real_amplitudes
-from qiskit.primitives import StatevectorEstimator
+from qiskit.primitives import StatevectorEstimator, statevector_estimator
 from qiskit.primitives.containers.bindings_array import BindingsArray
 from qiskit.primitives.containers.estimator_pub import EstimatorPub
 from qiskit.primitives.containers.observables_array import ObservablesArray
-from qiskit.quantum_info import SparsePauliOp
+from qiskit.quantum_info import SparsePauliOp, random_clifford, random_pauli_list
 
 
 class TestStatevectorEstimator(QiskitTestCase):
@@ -345,6 +347,146 @@ class TestStatevectorEstimator(QiskitTestCase):
             # expectation values should be reproducible due to seed
             np.testing.assert_allclose(result[0].data.evs, result2[0].data.evs)
 
+    def test_stabilizer_state(self):
+        """Test that Clifford circuits simulated as stabilizer states match dense simulation."""
+        circuit = random_clifford(4, seed=12).to_circuit()
+        observables = [
+            SparsePauliOp(random_pauli_list(4, 5, seed=seed, phase=False), np.arange(1, 6))
+            for seed in range(3)
+        ]
+        pub = (circuit, observables)
+        target = StatevectorEstimator(use_stabilizer_state=False).run([pub]).result()[0]
+        for batched in [False, True]:
+            with self.subTest(batched=batched):
+                estimator = StatevectorEstimator(batched=batched)
+                self.assertTrue(estimator.use_stabilizer_state)
+                result = estimator.run([pub]).result()[0]
+                np.testing.assert_allclose(result.data.evs, target.data.evs, atol=1e-12)
+
+        with self.subTest("many qubits"):
+            num_qubits = 120
+            circuit = QuantumCircuit(num_qubits)
+            circuit.h(0)
+            circuit.cx(0, range(1, num_qubits))
+            observables = ["Z" * num_qubits, "X" * num_qubits, "Z" + "I" * (num_qubits - 1)]
+            result = StatevectorEstimator().run([(circuit, observables)]).result()[0]
+            np.testing.assert_allclose(result.data.evs, [1, 1, 0])
+
+    def test_batched(self):
+        """Test that the batched mode agrees with the default mode."""
+        circuit = QuantumCircuit(3)
+        circuit.append(real_amplitudes(num_qubits=3, reps=2), [0, 1, 2])
+        circuit.sdg(1)
+        rng = np.random.default_rng(42)
+        observables = [
+            [SparsePauliOp.from_list([("XYZ", 0.5), ("IIZ", -1.0), ("YYI", 2.0)])],
+            [SparsePauliOp("XXX")],
+            [SparsePauliOp.from_list([("XYZ", 0.5), ("IIZ", -1.0), ("YYI", 2.0)])],
+            [SparsePauliOp.from_list([("III", 1.0), ("ZIY", 0.25)])],
+        ]
+        estimator = StatevectorEstimator()
+        batched_estimator = StatevectorEstimator(batched=True)
+        self.assertTrue(batched_estimator.batched)
+        for shape in [(), (5,), (4, 5), (1, 4, 5)]:
+            with self.subTest(shape=shape):
+                params = rng.uniform(-np.pi, np.pi, shape + (circuit.num_parameters,))
+                pub = (circuit, observables, params)
+                target = estimator.run([pub]).result()[0]
+                result = batched_estimator.run([pub]).result()[0]
+                self.assertEqual(result.data.evs.shape, target.data.evs.shape)
+                np.testing.assert_allclose(result.data.evs, target.data.evs, atol=1e-12)
+                np.testing.assert_array_equal(result.data.stds, target.data.stds)
+                self.assertEqual(result.metadata, target.metadata)
+
+    def test_batched_chunks(self):
+        """Test that the batched mode evaluates the bindings in chunks within the memory budget."""
+        circuit = real_amplitudes(num_qubits=3, reps=2)
+        observables = [[SparsePauliOp.from_list([("XYZ", 0.5), ("IIZ", -1.0)])], ["ZZI"]]
+        params = np.random.default_rng(42).uniform(-np.pi, np.pi, (2, 5, circuit.num_parameters))
+        target = StatevectorEstimator().run([(circuit, observables, params)]).result()[0]
+        # Evaluating a chunk of 3-qubit states takes 3 * 16 * 8 bytes per state.
+        for max_bytes, chunk_size in [(0, 1), (3 * 16 * 8 * 3, 3), (2**28, 10)]:
+            with self.subTest(max_bytes=max_bytes):
+                estimator = StatevectorEstimator(batched=True, max_state_cache_bytes=max_bytes)
+                with patch(
+                    "qiskit.primitives.statevector_estimator._pauli_expectation_values",
+                    wraps=statevector_estimator._pauli_expectation_values,
+                ) as evaluate:
+                    result = estimator.run([(circuit, observables, params)]).result()[0]
+                np.testing.assert_allclose(result.data.evs, target.data.evs, atol=1e-12)
+                sizes = [call.args[0].shape[0] for call in evaluate.call_args_list]
+                self.assertEqual(max(sizes), chunk_size)
+                self.assertEqual(sum(sizes), 10)
+
+    def test_batched_precision_seed(self):
+        """Test the batched mode with precision and seed."""
+        psi1 = self.psi[0]
+        hamiltonian1 = self.hamiltonian[0]
+        theta1 = self.theta[0]
+        estimator = StatevectorEstimator(default_precision=1.0, seed=1, batched=True)
+        result = estimator.run([(psi1, hamiltonian1, [theta1] * 3)]).result()
+        result2 = estimator.run([(psi1, hamiltonian1, [theta1] * 3)]).result()
+        np.testing.assert_allclose(result[0].data.evs, result2[0].data.evs)
+        result = estimator.run([(psi1, hamiltonian1, [theta1])], precision=0).result()
+        np.testing.assert_allclose(result[0].data.evs, [1.5555572817900956])
+
+    def test_state_cache(self):
+        """Test that each binding is simulated once and reused across observables."""
+        psi1 = self.psi[0]
+        observables = [[hamiltonian] for hamiltonian in self.hamiltonian] * 3
+        params = [self.theta[0], self.theta[2]]
+        estimator = StatevectorEstimator(max_state_cache_bytes=0)
+        target = estimator.run([(psi1, observables, params)]).result()
+        with patch.object(
+            statevector_estimator,
+            "_statevector_from_circuit",
+            wraps=statevector_estimator._statevector_from_circuit,
+        ) as mock:
+            result = StatevectorEstimator().run([(psi1, observables, params)]).result()
+        self.assertEqual(mock.call_count, len(params))
+        np.testing.assert_allclose(result[0].data.evs, target[0].data.evs)
+
+    def test_state_cache_eviction(self):
+        """Test that the state cache respects its memory budget."""
+        psi1 = self.psi[0]
+        observables = [[hamiltonian] for hamiltonian in self.hamiltonian]
+        params = [self.theta[0], self.theta[2], [0, 0, 0, 0, 0, 0]]
+        target = StatevectorEstimator(max_state_cache_bytes=0).run([(psi1, observables, params)])
+        # Enough room for exactly one two-qubit state.
+        estimator = StatevectorEstimator(max_state_cache_bytes=4 * 16)
+        result = estimator.run([(psi1, observables, params)]).result()
+        np.testing.assert_allclose(result[0].data.evs, target.result()[0].data.evs)
+
+    def test_executor(self):
+        """Test that distributing pubs across an executor matches serial execution."""
+        psi1, psi2 = self.psi
+        hamiltonian1, hamiltonian2, hamiltonian3 = self.hamiltonian
+        rng = np.random.default_rng(7)
+        params1 = rng.uniform(-np.pi, np.pi, (4, 1, psi1.num_parameters))
+        params2 = rng.uniform(-np.pi, np.pi, (5, psi2.num_parameters))
+        pubs = [
+            (psi1, [[hamiltonian1, hamiltonian2, hamiltonian3]], params1),
+            (psi2, [[hamiltonian1], [hamiltonian3]], params2),
+            (psi1, hamiltonian2, params1[0, 0], 0.1),
+        ]
+        target = StatevectorEstimator(seed=11).run(pubs).result()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            for executor in ["process", pool]:
+                for batched in [False, True]:
+                    with self.subTest(executor=executor, batched=batched):
+                        estimator = StatevectorEstimator(
+                            seed=11, batched=batched, executor=executor
+                        )
+                        result = estimator.run(pubs).result()
+                        for pub_result, pub_target in zip(result, target):
+                            self.assertEqual(pub_result.metadata, pub_target.metadata)
+                            np.testing.assert_allclose(
+                                pub_result.data.evs, pub_target.data.evs, atol=1e-12
+                            )
+                            np.testing.assert_array_equal(
+                                pub_result.data.stds, pub_target.data.stds
+                            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from numpy.typing import NDArray
@@ -28,6 +29,7 @@ from qiskit.primitives.containers.data_bin import DataBin
 from qiskit.primitives.containers.sampler_pub import SamplerPub
 from qiskit.primitives.statevector_sampler import StatevectorSampler
 from qiskit.providers import JobStatus
+from qiskit.quantum_info import Statevector, random_clifford
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
 
 
@@ -621,6 +623,39 @@ class TestStatevectorSampler(QiskitTestCase):
             self.assertTrue(hasattr(data, creg_name))
             self._assert_allclose(getattr(data, creg_name), np.array(creg))
 
+    def test_packed_samples_match_sample_memory(self):
+        """Test that the packed samples are the same as those of `Statevector.sample_memory`."""
+        a = ClassicalRegister(3, "a")
+        b = ClassicalRegister(10, "b")
+        qc = QuantumCircuit(QuantumRegister(5), a, b)
+        for qubit in range(5):
+            qc.ry(0.3 + 0.4 * qubit, qubit)
+        qc.cx(0, 3)
+        qc.crx(0.7, 4, 1)
+        # The measured qubits and clbits are not contiguous, and some clbits are not measured.
+        qc.measure(0, a[2])
+        qc.measure(2, a[0])
+        qc.measure(3, b[9])
+        qc.measure(4, b[1])
+        qc.measure(2, b[4])
+
+        sampler = StatevectorSampler(seed=self._seed)
+        data = sampler.run([qc], shots=100).result()[0].data
+
+        state = Statevector(qc.remove_final_measurements(inplace=False))
+        state.seed(self._seed)
+        qargs = [0, 2, 3, 4]
+        memory = state.sample_memory(100, qargs=qargs)
+        for creg, measured in [(a, {2: 0, 0: 2}), (b, {9: 3, 1: 4, 4: 2})]:
+            expected = [
+                "".join(
+                    (sample[-1 - qargs.index(measured[clbit])] if clbit in measured else "0")
+                    for clbit in reversed(range(creg.size))
+                )
+                for sample in memory
+            ]
+            self.assertEqual(getattr(data, creg.name).get_bitstrings(), expected)
+
     def test_no_cregs(self):
         """Test that the sampler works when there are no classical register in the circuit."""
         qc = QuantumCircuit(2)
@@ -661,6 +696,78 @@ class TestStatevectorSampler(QiskitTestCase):
         self.assertEqual(result[0].metadata, {"shots": 10, "circuit_metadata": qc.metadata})
         self.assertEqual(result[1].metadata, {"shots": 20, "circuit_metadata": qc2.metadata})
 
+    def test_stabilizer_state(self):
+        """Test that Clifford circuits sampled as stabilizer states match dense sampling."""
+        shots = 10000
+        for seed in range(3):
+            circuit = random_clifford(5, seed=seed).to_circuit()
+            circuit.add_register(ClassicalRegister(2, "a"))
+            circuit.add_register(ClassicalRegister(9, "b"))
+            circuit.measure([4, 1], [0, 1])
+            circuit.measure([0, 2, 3], [10, 2, 8])
+            with self.subTest(seed=seed):
+                sampler = StatevectorSampler(seed=self._seed, use_stabilizer_state=True)
+                result = sampler.run([circuit], shots=shots).result()
+                target = StatevectorSampler(seed=self._seed).run([circuit], shots=shots).result()
+                for name in ["a", "b"]:
+                    counts = result[0].data[name].get_counts()
+                    target_counts = target[0].data[name].get_counts()
+                    self.assertEqual(set(counts), set(target_counts))
+                    self.assertDictAlmostEqual(counts, target_counts, delta=0.03 * shots)
+
+    def test_stabilizer_state_many_qubits(self):
+        """Test sampling a Clifford circuit with too many qubits for a statevector."""
+        num_qubits = 120
+        circuit = QuantumCircuit(num_qubits)
+        circuit.h(0)
+        circuit.cx(0, range(1, num_qubits))
+        circuit.x(7)
+        circuit.measure_all()
+        self.assertFalse(StatevectorSampler().use_stabilizer_state)
+        sampler = StatevectorSampler(seed=self._seed, use_stabilizer_state=True)
+        counts = sampler.run([circuit], shots=1000).result()[0].data.meas.get_counts()
+        ghz = "1" * (num_qubits - 8) + "0" + "1" * 7
+        self.assertEqual(set(counts), {ghz, ghz.translate(str.maketrans("01", "10"))})
+        self.assertDictAlmostEqual(counts, {key: 500 for key in counts}, delta=60)
+
+    def test_executor(self):
+        """Test that distributing pubs across an executor matches serial execution."""
+        circuit = QuantumCircuit(3)
+        circuit.append(real_amplitudes(num_qubits=3, reps=1), [0, 1, 2])
+        circuit.add_register(ClassicalRegister(2, "a"))
+        circuit.add_register(ClassicalRegister(9, "b"))
+        circuit.measure([0, 2], [0, 1])
+        circuit.measure([1, 0], [10, 4])
+        params = np.random.default_rng(5).uniform(-np.pi, np.pi, (3, 4, circuit.num_parameters))
+        pubs = [(circuit, params), (circuit, params[0, 0], 7), self._cases[1][0]]
+        target = StatevectorSampler(seed=42).run(pubs, shots=100).result()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            for executor in ["process", pool]:
+                with self.subTest(executor=executor):
+                    result = StatevectorSampler(seed=42, executor=executor).run(pubs, shots=100)
+                    result = result.result()
+                    self.assertEqual(len(result), len(target))
+                    for pub_result, pub_target in zip(result, target):
+                        self.assertEqual(pub_result.metadata, pub_target.metadata)
+                        self.assertEqual(set(pub_result.data), set(pub_target.data))
+                        for name in pub_target.data:
+                            self.assertEqual(pub_result.data[name], pub_target.data[name])
+
+    def test_executor_generator_seed(self):
+        """Test that an executor gives deterministic results for a Generator seed."""
+        circuit = self._cases[2][0]
+        params = np.random.default_rng(5).uniform(-np.pi, np.pi, (6, circuit.num_parameters))
+        results = []
+        for _ in range(2):
+            sampler = StatevectorSampler(seed=np.random.default_rng(3), executor="process")
+            results.append(sampler.run([(circuit, params)], shots=50).result()[0])
+        self.assertEqual(results[0].data.meas, results[1].data.meas)
+
+    def test_invalid_executor(self):
+        """Test that an invalid executor raises."""
+        with self.assertRaises(TypeError):
+            StatevectorSampler(executor="threads").run([self._cases[1][0]]).result()
+
 
 if __name__ == "__main__":
     unittest.main()
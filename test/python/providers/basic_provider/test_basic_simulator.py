@@ -14,11 +14,12 @@
 
 import os
 import unittest
+import unittest.mock
 import numpy as np
 
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
 from qiskit.compiler import transpile
-from qiskit.providers.basic_provider import BasicSimulator
+from qiskit.providers.basic_provider import BasicProviderError, BasicSimulator
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
 
 
@@ -214,6 +215,96 @@ class TestBasicSimulator(QiskitTestCase, BasicProviderBackendTestMixin):
             counts = result.get_counts(0)
             self.assertEqual(counts, target_counts)
 
+    def test_fusion(self):
+        """Test that gate fusion gives the same results as applying gates one at a time."""
+        qr = QuantumRegister(4, "qr")
+        cr = ClassicalRegister(4, "cr")
+        circuit = QuantumCircuit(qr, cr, global_phase=0.3)
+        circuit.h(qr)
+        circuit.cx(qr[0], qr[2])
+        circuit.rzz(0.4, qr[1], qr[3])
+        circuit.ccx(qr[3], qr[0], qr[1])
+        circuit.unitary(np.array([[0, 1j], [1j, 0]]), [qr[2]])
+        circuit.cp(0.7, qr[2], qr[1])
+        circuit.measure(qr[0], cr[0])
+        circuit.reset(qr[0])
+        circuit.crx(1.1, qr[1], qr[0])
+        circuit.swap(qr[0], qr[3])
+        circuit.measure(qr, cr)
+        target = self.backend.run(circuit, shots=1000, seed_simulator=11).result()
+        for fusion_max_qubits in range(1, 5):
+            with self.subTest(fusion_max_qubits=fusion_max_qubits):
+                result = self.backend.run(
+                    circuit, shots=1000, seed_simulator=11, fusion_max_qubits=fusion_max_qubits
+                ).result()
+                self.assertEqual(result.get_counts(), target.get_counts())
+
+    def test_fusion_measure_sampling(self):
+        """Test gate fusion when measurements are sampled from the final state."""
+        circuit = QuantumCircuit(5)
+        for qubit in range(5):
+            circuit.ry(0.3 * (qubit + 1), qubit)
+        for qubit in range(4):
+            circuit.cx(qubit, qubit + 1)
+            circuit.rz(0.2 * qubit, qubit + 1)
+        circuit.measure_all()
+        target = self.backend.run(circuit, shots=1000, seed_simulator=5).result()
+        backend = BasicSimulator(fusion_max_qubits=3)
+        result = backend.run(circuit, shots=1000, seed_simulator=5).result()
+        self.assertEqual(result.get_counts(), target.get_counts())
+
+    def test_fusion_invalid_max_qubits(self):
+        """Test that fusion_max_qubits must be at least 1."""
+        circuit = QuantumCircuit(1)
+        circuit.h(0)
+        circuit.measure_all()
+        for fusion_max_qubits in (0, -1):
+            with self.subTest(fusion_max_qubits=fusion_max_qubits):
+                with self.assertRaisesRegex(BasicProviderError, "fusion_max_qubits"):
+                    self.backend.run(circuit, fusion_max_qubits=fusion_max_qubits)
+
+    def test_shared_prefix(self):
+        """Test that reusing a shared prefix gives the same results as full simulation."""
+        prep = QuantumCircuit(3)
+        prep.h(0)
+        prep.cx(0, 1)
+        prep.ry(0.3, 2)
+        prep.crz(0.5, 1, 2)
+        circuits = []
+        for basis in ["zzz", "xxx", "yzx", "xzy"]:
+            circuit = prep.copy()
+            for qubit, label in enumerate(basis):
+                if label == "y":
+                    circuit.sdg(qubit)
+                if label != "z":
+                    circuit.h(qubit)
+            circuit.measure_all()
+            circuits.append(circuit)
+        # A circuit with a mid-circuit measurement, simulated shot by shot.
+        circuit = prep.copy()
+        circuit.measure_all()
+        circuit.x(0)
+        circuit.measure_all()
+        circuits.append(circuit)
+        target = self.backend.run(circuits, shots=200, seed_simulator=42).result()
+        for options in [
+            {"max_shared_prefix_bytes": 1024},
+            {"max_shared_prefix_bytes": 1024, "fusion_max_qubits": 2},
+            {"max_shared_prefix_bytes": 64},
+        ]:
+            with self.subTest(**options):
+                backend = BasicSimulator()
+                with unittest.mock.patch.object(
+                    backend, "_initialize_statevector", wraps=backend._initialize_statevector
+                ) as initialize:
+                    result = backend.run(circuits, shots=200, seed_simulator=42, **options).result()
+                self.assertEqual(result.get_counts(), target.get_counts())
+                if options["max_shared_prefix_bytes"] >= 16 * 2**3:
+                    # The prefix is only simulated once.
+                    self.assertEqual(initialize.call_count, 1)
+                else:
+                    self.assertEqual(initialize.call_count, 4 + 200)
+
     def test_options(self):
         """Test setting custom backend options during init and run."""
         init_statevector = np.zeros(2**2, dtype=complex)
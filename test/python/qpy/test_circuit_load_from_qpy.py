@@ -13,17 +13,25 @@
 """Test cases for circuit qpy loading and saving."""
 
 import io
+import os
 import struct
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest import mock
 
 from ddt import ddt, data, idata
 
 from qiskit.circuit import QuantumCircuit, QuantumRegister, Qubit, Parameter, Gate, annotation
+from qiskit.circuit.library import CCXGate, CXGate, SXGate
 from qiskit.circuit.random import random_circuit
 from qiskit.providers.fake_provider import GenericBackendV2
 from qiskit.exceptions import QiskitError
-from qiskit.qpy import dump, load, formats, get_qpy_version, QPY_COMPATIBILITY_VERSION
+from qiskit.qpy import dump, load, formats, get_qpy_version, QPY_COMPATIBILITY_VERSION, binary_io
+from qiskit.qpy import Writer, QpyError
+from qiskit.qpy import open as qpy_open
 from qiskit.qpy.common import QPY_VERSION
 from qiskit.transpiler import TranspileLayout, CouplingMap
+from qiskit.utils import should_run_in_parallel
 from qiskit.compiler import transpile
 from qiskit.qpy.formats import FILE_HEADER_V10_PACK, FILE_HEADER_V10, FILE_HEADER_V10_SIZE
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
@@ -662,3 +670,253 @@ class TestOutputStreamProperties(QpyCircuitTestCase):
                 unseekable = TestOutputStreamProperties.UnseekableStream(internal_buffer)
                 dump(circuits, unseekable)
                 self.assertEqual(internal_buffer.getbuffer(), seekable.getbuffer())
+
+
+@ddt
+class TestStandardGateInstructions(QpyCircuitTestCase):
+    """Test the instructions of standard gates, which are read in bulk."""
+
+    @idata(range(QPY_COMPATIBILITY_VERSION, QPY_VERSION + 1))
+    def test_mixed_instructions(self, version):
+        """Test standard gates interleaved with instructions that are read one by one."""
+        theta = Parameter("θ")
+        custom = QuantumCircuit(2, name="custom")
+        custom.cx(0, 1)
+        qc = QuantumCircuit(3, 2)
+        qc.h(0)
+        qc.rz(theta, 1)
+        qc.rz(0.5, 2)
+        qc.append(custom.to_gate(), [0, 2])
+        qc.cx(0, 1)
+        qc.append(CXGate(ctrl_state=0), [1, 2])
+        qc.append(CCXGate(ctrl_state="10"), [0, 1, 2])
+        qc.append(SXGate(label="my_sx"), [2])
+        qc.measure([0, 1], [0, 1])
+        with qc.if_test((qc.clbits[0], True)):
+            qc.x(2)
+        qc.ecr(2, 0)
+        qc.global_phase = 0.25
+        self.assert_roundtrip_equal(qc, version=version)
+
+        with io.BytesIO() as qpy_file:
+            dump(qc, qpy_file, version=version)
+            qpy_file.seek(0)
+            new_circuit = load(qpy_file)[0]
+        self.assertEqual(new_circuit.data[7].label, "my_sx")
+        self.assertEqual(new_circuit.data[5].operation.ctrl_state, 0)
+        self.assertEqual(new_circuit.data[6].operation.ctrl_state, 2)
+        self.assertEqual(new_circuit.parameters, qc.parameters)
+
+    def test_invalid_argument_order(self):
+        """Test that a clbit argument of a standard gate is rejected."""
+        qc = QuantumCircuit(1, 1)
+        qc.x(0)
+        with io.BytesIO() as qpy_file:
+            dump(qc, qpy_file)
+            payload = bytearray(qpy_file.getvalue())
+        # Mark the qubit argument of the only instruction as a clbit.
+        index = payload.rindex(b"q\x00\x00\x00\x00")
+        payload[index : index + 1] = b"c"
+        with self.assertRaises(TypeError):
+            load(io.BytesIO(bytes(payload)))
+
+
+@ddt
+class TestOpen(QpyCircuitTestCase):
+    """Test the lazy reader returned by qpy.open."""
+
+    def setUp(self):
+        super().setUp()
+        self.circuits = [random_circuit(4, 4, measure=True, seed=i) for i in range(12)]
+
+    def dump_to_file(self, version=None):
+        """Dump the circuits to a temporary file and return its path."""
+        handle, path = tempfile.mkstemp(suffix=".qpy")
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        with io.open(path, "wb") as fptr:
+            dump(self.circuits, fptr, version=version)
+        return path
+
+    @idata(range(QPY_COMPATIBILITY_VERSION, QPY_VERSION + 1))
+    def test_random_access(self, version):
+        """Test indexing, slicing and iteration of a reader."""
+        path = self.dump_to_file(version)
+        with qpy_open(path) as reader:
+            self.assertEqual(reader.qpy_version, version)
+            self.assertEqual(len(reader), len(self.circuits))
+            self.assertEqual(reader[9], self.circuits[9])
+            self.assertEqual(reader[-1], self.circuits[-1])
+            self.assertEqual(reader[3], self.circuits[3])
+            self.assertEqual(reader[2:8:3], self.circuits[2:8:3])
+            self.assertEqual(reader[::-1], self.circuits[::-1])
+            self.assertEqual(list(reader), self.circuits)
+            with self.assertRaises(IndexError):
+                _ = reader[len(self.circuits)]
+
+    @data(True, False)
+    def test_file_object(self, use_mmap):
+        """Test reading from an open file, with and without a memory map."""
+        path = self.dump_to_file()
+        with io.open(path, "rb") as fptr:
+            with qpy_open(fptr, use_mmap=use_mmap) as reader:
+                self.assertEqual(reader[5], self.circuits[5])
+            self.assertFalse(fptr.closed)
+
+    def test_bytes_io(self):
+        """Test reading from an in-memory buffer."""
+        buffer = io.BytesIO()
+        dump(self.circuits, buffer)
+        buffer.seek(0)
+        reader = qpy_open(buffer)
+        self.assertEqual(reader[7], self.circuits[7])
+        self.assertEqual(reader[:], load(io.BytesIO(buffer.getvalue())))
+
+    def test_decodes_only_accessed(self):
+        """Test that accessing a program of a version 16 file only decodes that program."""
+        buffer = io.BytesIO()
+        dump(self.circuits, buffer, version=16)
+        buffer.seek(0)
+        reader = qpy_open(buffer)
+        with mock.patch(
+            "qiskit.qpy.binary_io.read_circuit", wraps=binary_io.read_circuit
+        ) as read_circuit:
+            self.assertEqual(reader[10], self.circuits[10])
+        self.assertEqual(read_circuit.call_count, 1)
+
+    def test_invalid_file(self):
+        """Test that opening a file that isn't QPY raises."""
+        with self.assertRaises(QiskitError):
+            qpy_open(io.BytesIO(b"NOTQPY" + bytes(32)))
+
+        # The file opened for a path is closed again.
+        handle, path = tempfile.mkstemp(suffix=".qpy")
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        with io.open(path, "wb") as fptr:
+            fptr.write(b"NOTQPY" + bytes(32))
+        opened = []
+        real_open = io.open
+
+        def open_(*args):
+            # The reader owns the file, which is what is tested.
+            opened.append(real_open(*args))  # pylint: disable=consider-using-with
+            return opened[-1]
+
+        with mock.patch("io.open", open_):
+            with self.assertRaises(QiskitError):
+                qpy_open(path)
+        self.assertEqual(len(opened), 1)
+        self.assertTrue(opened[0].closed)
+
+
+@ddt
+class TestWriter(QpyCircuitTestCase):
+    """Test the streaming QPY writer."""
+
+    def setUp(self):
+        super().setUp()
+        self.circuits = [random_circuit(4, 4, measure=True, seed=i) for i in range(5)]
+
+    @idata(
+        (version, seekable, num_programs)
+        for version in range(QPY_COMPATIBILITY_VERSION, QPY_VERSION + 1)
+        for seekable in (True, False)
+        for num_programs in (None, 5)
+    )
+    def test_matches_dump(self, args):
+        """Test that the writer produces the same data as dump."""
+        version, seekable, num_programs = args
+        expected = io.BytesIO()
+        dump(self.circuits, expected, version=version)
+        with io.BytesIO() as buffer:
+            stream = buffer if seekable else TestOutputStreamProperties.UnseekableStream(buffer)
+            with Writer(stream, version=version, num_programs=num_programs) as writer:
+                for circuit in self.circuits:
+                    writer.write(circuit)
+                self.assertEqual(writer.num_written, len(self.circuits))
+            self.assertEqual(buffer.getvalue(), expected.getvalue())
+            buffer.seek(0)
+            self.assertEqual(load(buffer), self.circuits)
+
+    def test_empty(self):
+        """Test writing no programs."""
+        buffer = io.BytesIO()
+        with Writer(buffer):
+            pass
+        buffer.seek(0)
+        self.assertEqual(load(buffer), [])
+
+    def test_num_programs_mismatch(self):
+        """Test that the number of programs must match the declared number."""
+        with self.assertRaises(QpyError):
+            with Writer(io.BytesIO(), num_programs=2) as writer:
+                writer.write(self.circuits[0])
+        writer = Writer(io.BytesIO(), num_programs=1)
+        writer.write(self.circuits[0])
+        with self.assertRaises(QpyError):
+            writer.write(self.circuits[1])
+
+    def test_write_after_close(self):
+        """Test that a closed writer can't be written to."""
+        writer = Writer(io.BytesIO())
+        writer.close()
+        with self.assertRaises(QpyError):
+            writer.write(self.circuits[0])
+
+    def test_invalid_type(self):
+        """Test that only circuits can be written."""
+        with Writer(io.BytesIO()) as writer:
+            with self.assertRaises(TypeError):
+                writer.write("not a circuit")
+
+
+@ddt
+class TestParallel(QpyCircuitTestCase):
+    """Test loading and dumping programs in parallel."""
+
+    def setUp(self):
+        super().setUp()
+        self.circuits = [random_circuit(4, 4, measure=True, seed=i) for i in range(6)]
+        self.data = io.BytesIO()
+        dump(self.circuits, self.data)
+
+    @data("thread", "process")
+    def test_executor(self, kind):
+        """Test that loading and dumping with an executor match the serial results."""
+        executor_class = ThreadPoolExecutor if kind == "thread" else ProcessPoolExecutor
+        with executor_class(max_workers=2) as executor:
+            out = io.BytesIO()
+            dump(self.circuits, out, executor=executor)
+            self.assertEqual(out.getvalue(), self.data.getvalue())
+            self.data.seek(0)
+            self.assertEqual(load(self.data, executor=executor), self.circuits)
+
+    def test_memory_mapped_file(self):
+        """Test that loading a file on disk in parallel gives the programs in order."""
+        handle, path = tempfile.mkstemp(suffix=".qpy")
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        with io.open(path, "wb") as fptr:
+            fptr.write(self.data.getvalue())
+        with ThreadPoolExecutor(max_workers=2) as executor, io.open(path, "rb") as fptr:
+            self.assertEqual(load(fptr, executor=executor), self.circuits)
+
+    def test_num_processes(self):
+        """Test loading and dumping with worker processes."""
+        with should_run_in_parallel.override(True):
+            out = io.BytesIO()
+            dump(self.circuits, out, num_processes=2)
+            self.assertEqual(out.getvalue(), self.data.getvalue())
+            out.seek(0)
+            self.assertEqual(load(out, num_processes=2), self.circuits)
+
+    def test_old_version(self):
+        """Test that versions without program offsets are loaded serially."""
+        old = io.BytesIO()
+        dump(self.circuits, old, version=15)
+        old.seek(0)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with mock.patch.object(executor, "map") as executor_map:
+                self.assertEqual(load(old, executor=executor), self.circuits)
+        executor_map.assert_not_called()
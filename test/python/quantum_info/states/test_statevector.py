@@ -13,6 +13,8 @@
 
 """Tests for Statevector quantum state class."""
 
+import os
+import tempfile
 import unittest
 import logging
 from itertools import permutations
@@ -671,6 +673,117 @@ class TestStatevector(QiskitTestCase):
                 probs = state.probabilities_dict(qargs)
                 self.assertDictAlmostEqual(probs, target)
 
+    @data(1, 4, 16, 1000)
+    def test_chunked_probabilities(self, chunk_size):
+        """Test probabilities computed block by block."""
+        state = random_statevector((2, 3, 2, 2), seed=1234)
+        for qargs in [None, [0], [2, 1], [3, 0, 1], [1, 3, 2, 0]]:
+            with self.subTest(qargs=qargs):
+                assert_allclose(
+                    state.probabilities(qargs, chunk_size=chunk_size), state.probabilities(qargs)
+                )
+        assert_allclose(
+            state.probabilities([1], decimals=3, chunk_size=chunk_size),
+            state.probabilities([1], decimals=3),
+        )
+
+    @data(1, 4, 16, 1000)
+    def test_chunked_evolve(self, chunk_size):
+        """Test evolution applied block by block."""
+        state = random_statevector(2**5, seed=1234)
+        circuit = QuantumCircuit(5, global_phase=0.2)
+        circuit.h(0)
+        circuit.cx(0, 3)
+        circuit.append(QFTGate(3), [4, 1, 2])
+        circuit.unitary(random_unitary(4, seed=12), [2, 0])
+        target = random_statevector(2**5, seed=1234).evolve(circuit)
+        self.assertEqual(state.evolve(circuit, chunk_size=chunk_size), target)
+        # The original state is not modified.
+        self.assertEqual(state, random_statevector(2**5, seed=1234))
+
+        qudit_state = random_statevector((3, 2, 4), seed=1234)
+        op = Operator(random_unitary(12, seed=34).data, input_dims=(3, 4), output_dims=(3, 4))
+        self.assertEqual(
+            qudit_state.evolve(op, [0, 2], chunk_size=chunk_size), qudit_state.evolve(op, [0, 2])
+        )
+
+    @data(None, 1, 4, 1000)
+    def test_evolve_inplace(self, chunk_size):
+        """Test evolution in place, with and without blocks."""
+        circuit = QuantumCircuit(4, global_phase=0.3)
+        circuit.h(0)
+        circuit.cx(0, 2)
+        circuit.reset(1)
+        circuit.append(QFTGate(3), [3, 1, 0])
+        target = random_statevector(2**4, seed=56)
+        # The reset of a statevector is random.
+        target.seed(7)
+        target = target.evolve(circuit)
+        state = random_statevector(2**4, seed=56)
+        state.seed(7)
+        buffer = state.data
+        state.evolve_inplace(circuit, chunk_size=chunk_size)
+        self.assertIs(state.data, buffer)
+        self.assertEqual(state, target)
+
+    def test_evolve_global_phase_does_not_modify_state(self):
+        """Test that evolving by a circuit with a global phase does not modify the state."""
+        circuit = QuantumCircuit(1, global_phase=0.5)
+        circuit.h(0)
+        state = Statevector.from_label("0")
+        evolved = state.evolve(circuit)
+        self.assertEqual(state, Statevector.from_label("0"))
+        self.assertEqual(evolved, Statevector(circuit))
+
+    def test_evolve_inplace_invalid(self):
+        """Test that evolution in place fails on read-only data or for a change of dimensions."""
+        state = Statevector.from_label("00")
+        op = Operator(np.ones((3, 4)), input_dims=(2, 2), output_dims=(3,))
+        with self.assertRaises(QiskitError):
+            state.evolve_inplace(op)
+        self.assertEqual(state, Statevector.from_label("00"))
+        state.data.flags.writeable = False
+        with self.assertRaises(QiskitError):
+            state.evolve_inplace(HGate(), [0], chunk_size=2)
+
+    def test_chunked_sample_counts(self):
+        """Test sample_counts sampled block by block."""
+        shots = 4000
+        threshold = 0.02 * shots
+        state = random_statevector(2**4, seed=1234)
+        state.seed(100)
+        for qargs in [None, [2, 0]]:
+            with self.subTest(qargs=qargs):
+                target = {
+                    key: shots * value for key, value in state.probabilities_dict(qargs).items()
+                }
+                counts = state.sample_counts(shots, qargs, chunk_size=4)
+                self.assertEqual(sum(counts.values()), shots)
+                self.assertDictAlmostEqual(counts, target, threshold)
+
+    def test_from_memmap(self):
+        """Test a statevector backed by a memory-mapped file."""
+        circuit = QuantumCircuit(4)
+        circuit.h(0)
+        circuit.cx(0, range(1, 4))
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            filename = os.path.join(tmpdirname, "state.bin")
+            state = Statevector.from_memmap(filename, 2**4, mode="w+")
+            self.assertEqual(state, Statevector.from_int(0, 2**4))
+            evolved = state.evolve(circuit, chunk_size=4)
+            self.assertEqual(evolved, Statevector(circuit))
+            # `evolve` does not modify the file.
+            self.assertEqual(state, Statevector.from_int(0, 2**4))
+            state.evolve_inplace(circuit, chunk_size=4)
+            self.assertIsInstance(state.data, np.memmap)
+            self.assertEqual(state, evolved)
+            state.data.flush()
+            del state, evolved
+            state = Statevector.from_memmap(filename, 2**4)
+            self.assertIsInstance(state.data, np.memmap)
+            self.assertEqual(state, Statevector(circuit))
+            del state
+
     def test_sample_counts_ghz(self):
         """Test sample_counts method for GHZ state"""
 
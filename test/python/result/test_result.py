@@ -237,6 +237,29 @@ class TestResultOperations(QiskitTestCase):
         )
         self.assertEqual(marginal_distribution(result.get_counts(), [1, 0]), expected_reverse)
 
+    def test_marginal_counts_wide_register(self):
+        """Test that counts of more clbits than fit in a 64-bit integer are marginalized."""
+        counts = {"1" + "0" * 69: 3, "0" * 69 + "1": 5, "1" + "0" * 68 + "1": 2, "0" * 70: 1}
+        self.assertEqual(marginal_counts(counts, [69, 0]), {"10": 3, "01": 5, "11": 2, "00": 1})
+        self.assertEqual(marginal_counts(counts, [69]), {"1": 5, "0": 6})
+
+    def test_marginal_counts_order_and_values(self):
+        """Test that marginal outcomes keep the order of their first occurrence and their types."""
+        counts = {"11 01": 1, "01 10": 2, "10 01": 3, "00 10": 4}
+        marginal = marginal_counts(counts, [3, 1])
+        self.assertEqual(list(marginal.items()), [("10", 4), ("01", 6)])
+        self.assertIsInstance(marginal["10"], int)
+        probabilities = {"101": 0.25, "001": 0.5, "110": 0.25}
+        self.assertEqual(marginal_counts(probabilities, [0]), {"1": 0.75, "0": 0.25})
+
+    def test_marginal_counts_format_marginal(self):
+        """Test that the marginal bitstrings are formatted like the input bitstrings."""
+        counts = {"101 01": 4, "011 10": 6, "110 11": 1}
+        self.assertEqual(
+            marginal_counts(counts, [0, 4], format_marginal=True),
+            {"1__ _1": 5, "0__ _0": 6},
+        )
+
     def test_marginal_counts_result(self):
         """Test that a Result object containing counts marginalizes correctly."""
         raw_counts_1 = {"0x0": 4, "0x1": 7, "0x2": 10, "0x6": 5, "0x9": 11, "0xD": 9, "0xE": 8}
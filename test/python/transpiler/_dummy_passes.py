@@ -245,3 +245,47 @@ class PassN_AP_NR_NP(DummyAP):
         logging.getLogger(logger).info("property %s deleted", self.to_delete)
         self.property_set[self.to_none] = None
         logging.getLogger(logger).info("property %s noned", self.to_none)
+
+
+class PassO_AP_depends_only_on_dag(DummyAP):
+    """A dummy analysis pass whose results only depend on the DAG.
+    AP: Analysis Pass
+    NR: No Requires
+    NP: No Preserves
+    """
+
+    depends_only_on_dag = True
+
+    def run(self, dag):
+        super().run(dag)
+        self.property_set["size"] = dag.size()
+        logging.getLogger(logger).info("set size as %i", self.property_set["size"])
+
+
+class PassP_remove_one_x(DummyTP):
+    """A dummy transformation pass that removes the first X gate of the DAG, if any.
+    TP: Transformation Pass
+    NR: No Requires
+    NP: No Preserves
+    """
+
+    def run(self, dag):
+        super().run(dag)
+        for node in dag.named_nodes("x"):
+            dag.remove_op_node(node)
+            break
+        return dag
+
+
+class PassQ_consume_size(DummyTP):
+    """A dummy transformation pass that reads and deletes the ``size`` property.
+    TP: Transformation Pass
+    NR: No Requires
+    NP: No Preserves
+    """
+
+    def run(self, dag):
+        super().run(dag)
+        logging.getLogger(logger).info("consumed size %s", self.property_set["size"])
+        del self.property_set["size"]
+        return dag
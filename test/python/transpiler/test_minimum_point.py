@@ -13,7 +13,9 @@
 """MinimumPoint pass testing"""
 
 import math
+import time
 
+from qiskit.circuit import Qubit
 from qiskit.transpiler.passes import MinimumPoint
 from qiskit.dagcircuit import DAGCircuit
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
@@ -287,3 +289,21 @@ class TestMinimumPointtPass(QiskitTestCase):
         self.assertEqual((0.775, 10, 10), state.score)
         self.assertTrue(min_pass.property_set["test_minimum_point"])
         self.assertIs(out_dag, state.dag)
+
+    def test_time_budget_exhausted_restores_minimum(self):
+        """Test the earlier minimum is restored when the time budget is exhausted."""
+        min_pass = MinimumPoint(["depth"], prefix="test")
+        min_dag = DAGCircuit()
+        min_dag.add_qubits([Qubit()])
+        min_pass.property_set["depth"] = 1
+        min_pass.run(min_dag)
+        min_pass.run(min_dag)
+        self.assertIsNone(min_pass.property_set["test_minimum_point"])
+
+        min_pass.property_set["depth"] = 5
+        min_pass.property_set["time_budget_deadline"] = time.perf_counter() - 1.0
+        min_pass.property_set["time_budget_metrics"] = {"time_budget": 1.0}
+        out_dag = min_pass.run(DAGCircuit())
+        self.assertTrue(min_pass.property_set["test_minimum_point"])
+        self.assertEqual(out_dag, min_dag)
+        self.assertTrue(min_pass.property_set["time_budget_metrics"]["deadline_reached"])
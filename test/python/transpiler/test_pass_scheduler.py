@@ -13,13 +13,14 @@
 """Transpiler testing"""
 
 import io
+import itertools
 from logging import StreamHandler, getLogger
 import unittest.mock
 import sys
 
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit.transpiler import PassManager, TranspilerError
-from qiskit.passmanager import DoWhileController, ConditionalController
+from qiskit.passmanager import DoWhileController, ConditionalController, PassManagerProfiler
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
 from ._dummy_passes import (
     PassA_TP_NR_NP,
@@ -31,6 +32,9 @@ from ._dummy_passes import (
     PassJ_Bad_NoReturn,
     PassK_check_fixed_point_property,
     PassM_AP_NR_NP,
+    PassO_AP_depends_only_on_dag,
+    PassP_remove_one_x,
+    PassQ_consume_size,
 )
 
 
@@ -615,6 +619,67 @@ class TestUseCases(SchedulerTestCase):
         self.assertScheduler(self.circuit, self.passmanager, expected)
 
 
+class TestAnalysisMemoization(SchedulerTestCase):
+    """Testing the memoization of analysis passes that only depend on the DAG."""
+
+    def test_skip_in_loop_when_dag_unchanged(self):
+        """Analysis is skipped when the loop did not change the DAG, and its results restored."""
+        circuit = QuantumCircuit(1)
+        circuit.x(0)
+        circuit.x(0)
+        circuit.h(0)
+        iterations = itertools.count()
+        passmanager = PassManager(
+            DoWhileController(
+                [PassO_AP_depends_only_on_dag(), PassQ_consume_size(), PassP_remove_one_x()],
+                do_while=lambda _: next(iterations) < 3,
+            )
+        )
+        profiler = PassManagerProfiler(ir_metrics=False)
+        with self.assertLogs("LocalLogger", level="INFO") as cm:
+            out = passmanager.run(circuit, profiler=profiler)
+        self.assertEqual(out.count_ops(), {"h": 1})
+        self.assertEqual(
+            [record.message for record in cm.records if not record.message.startswith("run")],
+            [
+                "set size as 3",
+                "consumed size 3",
+                "set size as 2",
+                "consumed size 2",
+                "set size as 1",
+                "consumed size 1",
+                "consumed size 1",
+            ],
+        )
+        self.assertEqual(
+            [profile.name for profile in profiler.profiles if profile.kind == "skipped"],
+            ["PassO_AP_depends_only_on_dag"],
+        )
+        self.assertRegex(profiler.summary(), r"PassO_AP_depends_only_on_dag .* 1\n")
+
+    def test_not_memoized_by_default(self):
+        """Analysis passes that do not opt in are run in every iteration."""
+        iterations = itertools.count()
+        passmanager = PassManager(
+            DoWhileController(
+                [PassE_AP_NR_NP(1), PassA_TP_NR_NP()],
+                do_while=lambda _: next(iterations) < 1,
+            )
+        )
+        self.assertScheduler(
+            QuantumCircuit(1),
+            passmanager,
+            [
+                "run analysis pass PassE_AP_NR_NP",
+                "set property as 1",
+                "run transformation pass PassA_TP_NR_NP",
+                "run analysis pass PassE_AP_NR_NP",
+                "set property as 1",
+                "run transformation pass PassA_TP_NR_NP",
+            ],
+        )
+
+
 class TestControlFlowPlugin(SchedulerTestCase):
     """Testing the control flow plugin system."""
 
@@ -14,9 +14,12 @@
 
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit.circuit.library import CXGate
+from qiskit.converters import circuit_to_dag
+from qiskit.passmanager import PassManagerProfiler, WorkerPool
 from qiskit.transpiler.preset_passmanagers import level_1_pass_manager
 from qiskit.providers.fake_provider import GenericBackendV2
-from qiskit.transpiler import Layout, PassManager
+from qiskit.transpiler import Layout, PassManager, generate_preset_pass_manager
+from qiskit.transpiler.passes import CountOps
 from qiskit.transpiler.passmanager_config import PassManagerConfig
 from ..legacy_cmaps import ALMADEN_CMAP
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
@@ -214,3 +217,95 @@ class TestPassManagerRun(QiskitTestCase):
             for instruction in new_circuit.data:
                 if isinstance(instruction.operation, CXGate):
                     self.assertIn([bit_indices[x] for x in instruction.qubits], coupling_map)
+
+    def test_profiler(self):
+        """Test that profiling a preset pass manager records the DAG size and depth."""
+        circuit = QuantumCircuit(3)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.cx(1, 2)
+        circuit.measure_all()
+        backend = GenericBackendV2(num_qubits=5, seed=42)
+        pass_manager = generate_preset_pass_manager(1, backend, seed_transpiler=42)
+        profiler = PassManagerProfiler()
+        out = pass_manager.run(circuit, profiler=profiler)
+
+        self.assertEqual(
+            out, generate_preset_pass_manager(1, backend, seed_transpiler=42).run(circuit)
+        )
+        first, last = profiler.profiles[0], profiler.profiles[-1]
+        dag, out_dag = circuit_to_dag(circuit), circuit_to_dag(out)
+        self.assertEqual(first.ir_before, {"size": dag.size(), "depth": dag.depth()})
+        self.assertEqual(last.nesting, 0)
+        self.assertEqual(last.ir_after, {"size": out_dag.size(), "depth": out_dag.depth()})
+        self.assertIn("BasisTranslator", profiler.summary())
+
+    def test_worker_pool(self):
+        """Test running a pass manager in a persistent worker pool."""
+        backend = GenericBackendV2(num_qubits=5, seed=42)
+        pass_manager = generate_preset_pass_manager(2, backend, seed_transpiler=42)
+        circuits = []
+        for num_qubits in (2, 3, 4):
+            circuit = QuantumCircuit(num_qubits)
+            circuit.h(0)
+            for qubit in range(1, num_qubits):
+                circuit.cx(0, qubit)
+            circuit.measure_all()
+            circuits.append(circuit)
+        expected = pass_manager.run(circuits, num_processes=1)
+
+        with WorkerPool(num_processes=2) as pool:
+            for _ in range(2):
+                out = pass_manager.run(circuits, pool=pool)
+                self.assertEqual(out, expected)
+                for circuit, out_circuit in zip(circuits, out):
+                    self.assertEqual(
+                        out_circuit.layout.initial_virtual_layout(filter_ancillas=True),
+                        Layout(
+                            {
+                                qubit: out_circuit.layout.initial_layout[qubit]
+                                for qubit in circuit.qubits
+                            }
+                        ),
+                    )
+            # The pass manager is only serialized once.
+            self.assertEqual(len(pool._written), 1)
+            pass_manager.post_optimization = PassManager([CountOps()])
+            pass_manager.run(circuits, pool=pool)
+            self.assertEqual(len(pool._written), 2)
+
+    def test_threads(self):
+        """Test that transpiling in threads gives the same circuits as serially."""
+        backend = GenericBackendV2(num_qubits=5, seed=42)
+        pass_manager = generate_preset_pass_manager(2, backend, seed_transpiler=42)
+        circuits = []
+        for num_qubits in (2, 3, 4):
+            circuit = QuantumCircuit(num_qubits)
+            circuit.h(0)
+            for qubit in range(1, num_qubits):
+                circuit.cx(0, qubit)
+            circuit.measure_all()
+            circuits.append(circuit)
+        expected = pass_manager.run(circuits, num_processes=1, output_name="isa")
+        out = pass_manager.run(circuits, num_threads=2, output_name="isa")
+        self.assertEqual(out, expected)
+        self.assertEqual([circuit.layout for circuit in out], [c.layout for c in expected])
+        self.assertEqual([circuit.name for circuit in out], ["isa"] * 3)
+
+    def test_imap(self):
+        """Test that streaming circuits gives the same circuits as running them."""
+        backend = GenericBackendV2(num_qubits=5, seed=42)
+        pass_manager = generate_preset_pass_manager(2, backend, seed_transpiler=42)
+        circuits = []
+        for num_qubits in (2, 3, 4):
+            circuit = QuantumCircuit(num_qubits)
+            circuit.h(0)
+            for qubit in range(1, num_qubits):
+                circuit.cx(0, qubit)
+            circuit.measure_all()
+            circuits.append(circuit)
+        expected = pass_manager.run(circuits, num_processes=1)
+        self.assertEqual(list(pass_manager.imap(iter(circuits))), expected)
+        out = dict(pass_manager.imap(circuits, ordered=False, num_threads=2, max_in_flight=2))
+        self.assertEqual([out[i] for i in range(3)], expected)
+        self.assertEqual([out[i].layout for i in range(3)], [c.layout for c in expected])
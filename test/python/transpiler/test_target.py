@@ -1888,3 +1888,81 @@ class TestAngleBounds(QiskitTestCase):
             target.instruction_supported("u", parameters=[-3, 0, 0], check_angle_bounds=True)
         )
         self.assertTrue(target.instruction_supported("x", check_angle_bounds=True))
+
+
+class TestTargetDerivedStructures(QiskitTestCase):
+    """Test the fingerprint and the cached derived structures of the Target."""
+
+    def setUp(self):
+        super().setUp()
+        self.target = Target(num_qubits=3)
+        self.target.add_instruction(
+            XGate(),
+            {(i,): InstructionProperties(duration=1e-8, error=1e-4 * (i + 1)) for i in range(3)},
+        )
+        self.target.add_instruction(
+            CXGate(),
+            {
+                (0, 1): InstructionProperties(error=1e-2),
+                (1, 2): InstructionProperties(error=2e-2),
+            },
+        )
+        self.target.add_instruction(
+            ECRGate(), {(0, 1): InstructionProperties(error=3e-2), (2, 1): None}
+        )
+
+    def test_fingerprint(self):
+        """Test that the fingerprint depends on the contents of the target."""
+        fingerprint = self.target.fingerprint()
+        self.assertEqual(fingerprint, loads(dumps(self.target)).fingerprint())
+        self.assertNotEqual(fingerprint, GenericBackendV2(3, seed=1).target.fingerprint())
+        self.target.update_instruction_properties("cx", (0, 1), InstructionProperties(error=0.5))
+        updated = self.target.fingerprint()
+        self.assertNotEqual(fingerprint, updated)
+        self.target.add_instruction(Measure(), {(i,): None for i in range(3)})
+        self.assertNotEqual(updated, self.target.fingerprint())
+        self.target.granularity = 2
+        self.assertNotEqual(updated, self.target.fingerprint())
+
+    def test_fingerprint_angle_bounds(self):
+        """Test that the fingerprint depends on the angle bounds of the instructions."""
+        fingerprints = []
+        for angle_bounds in (None, [(0, math.pi / 2)], [(0, math.pi)]):
+            target = Target(num_qubits=2)
+            target.add_instruction(RZXGate(Parameter("t")), angle_bounds=angle_bounds)
+            fingerprints.append(target.fingerprint())
+            self.assertEqual(target.fingerprint(), loads(dumps(target)).fingerprint())
+        self.assertEqual(len(set(fingerprints)), 3)
+
+    def test_fake_target_fingerprint(self):
+        """Test that the fingerprint of a _FakeTarget depends on its coupling map."""
+        line = _FakeTarget(coupling_map=CouplingMap.from_line(3))
+        ring = _FakeTarget(coupling_map=CouplingMap.from_ring(3))
+        self.assertNotEqual(line.fingerprint(), ring.fingerprint())
+
+    def test_derived_structures(self):
+        """Test the derived structures, and that they are shared until the target changes."""
+        distance = self.target._distance_matrix()
+        np.testing.assert_array_equal(distance, [[0, 1, 2], [1, 0, 1], [2, 1, 0]])
+        self.assertFalse(distance.flags.writeable)
+        self.assertIs(self.target._distance_matrix(), distance)
+        self.assertIs(self.target.build_coupling_map().distance_matrix, distance)
+        self.assertEqual(self.target._undirected_adjacency(), ((1,), (0, 2), (1,)))
+        self.assertEqual(self.target._two_qubit_operation_names(), {"cx", "ecr"})
+        self.assertAlmostEqual(self.target._average_errors()[(0, 1)], 2e-2)
+        self.assertEqual(self.target._max_errors()[(0, 1)], 3e-2)
+        self.assertEqual(self.target._max_errors()[(2, 1)], 0.0)
+        self.assertNotIn((2, 1), self.target._average_errors())
+
+        self.target.update_instruction_properties("cx", (0, 1), InstructionProperties(error=0.5))
+        self.assertAlmostEqual(self.target._average_errors()[(0, 1)], 0.265)
+        self.assertEqual(self.target._max_errors()[(0, 1)], 0.5)
+        self.assertEqual(
+            self.target.build_coupling_map().graph.get_edge_data(0, 1)["cx"].error, 0.5
+        )
+
+        self.target.add_instruction(CZGate(), {(0, 2): None})
+        self.assertIsNot(self.target._distance_matrix(), distance)
+        self.assertEqual(self.target._distance_matrix()[0, 2], 1)
+        self.assertEqual(self.target._undirected_adjacency(), ((1, 2), (0, 2), (0, 1)))
+        self.assertEqual(self.target._two_qubit_operation_names(), {"cx", "ecr", "cz"})
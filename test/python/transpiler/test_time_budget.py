@@ -0,0 +1,128 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for transpilation under a time budget."""
+
+import time
+
+from ddt import ddt, data
+
+from qiskit import transpile
+from qiskit.circuit.library import quantum_volume
+from qiskit.compiler import TranspileCache
+from qiskit.converters import circuit_to_dag
+from qiskit.providers.fake_provider import GenericBackendV2
+from qiskit.quantum_info import Operator
+from qiskit.transpiler import CouplingMap, PassManager, generate_preset_pass_manager
+from qiskit.transpiler.passes import (
+    CheckMap,
+    CheckTimeBudget,
+    GatesInBasis,
+    SabreLayout,
+    SetTimeBudget,
+    VF2Layout,
+)
+from test import QiskitTestCase  # pylint: disable=wrong-import-order
+
+
+@ddt
+class TestTimeBudget(QiskitTestCase):
+    """Tests for the time budget of pass manager runs."""
+
+    def setUp(self):
+        super().setUp()
+        self.backend = GenericBackendV2(5, coupling_map=CouplingMap.from_line(5), seed=42)
+        self.circuit = quantum_volume(5, seed=7)
+
+    def assertValid(self, pm, out):
+        """Assert that ``out`` is an ISA circuit equivalent to ``self.circuit``."""
+        check = PassManager(
+            [CheckMap(self.backend.target), GatesInBasis(target=self.backend.target)]
+        )
+        check.run(out)
+        self.assertTrue(check.property_set["is_swap_mapped"])
+        self.assertTrue(check.property_set["all_gates_in_basis"])
+        self.assertTrue(Operator.from_circuit(out).equiv(Operator(self.circuit)))
+        self.assertIsNotNone(pm.property_set["time_budget_metrics"])
+
+    def test_invalid_budget(self):
+        """Test that the budget must be positive."""
+        with self.assertRaises(ValueError):
+            SetTimeBudget(0)
+        with self.assertRaises(ValueError):
+            generate_preset_pass_manager(1, self.backend, time_budget=-1.0)
+
+    @data(0, 1, 2, 3)
+    def test_generous_budget(self, optimization_level):
+        """Test the metrics of a run that ends within its budget."""
+        pm = generate_preset_pass_manager(
+            optimization_level, self.backend, seed_transpiler=1, time_budget=600.0
+        )
+        out = pm.run(self.circuit)
+        self.assertValid(pm, out)
+        metrics = pm.property_set["time_budget_metrics"]
+        self.assertEqual(metrics["time_budget"], 600.0)
+        self.assertFalse(metrics["deadline_reached"])
+        self.assertLess(metrics["elapsed"], 600.0)
+        self.assertEqual(metrics["size"], out.size())
+        self.assertEqual(metrics["depth"], out.depth())
+        if optimization_level > 0:
+            self.assertGreater(metrics["sabre_layout_trials"], 0)
+
+    @data(1, 2, 3)
+    def test_exhausted_budget(self, optimization_level):
+        """Test that a run with a budget too small for any work still returns a valid circuit."""
+        pm = generate_preset_pass_manager(
+            optimization_level, self.backend, seed_transpiler=1, time_budget=1e-6
+        )
+        out = pm.run(self.circuit)
+        self.assertValid(pm, out)
+        metrics = pm.property_set["time_budget_metrics"]
+        self.assertTrue(metrics["deadline_reached"])
+        self.assertEqual(metrics["sabre_layout_trials"], 1)
+
+    def test_no_budget(self):
+        """Test that runs without a budget record no metrics."""
+        pm = generate_preset_pass_manager(1, self.backend, seed_transpiler=1)
+        pm.run(self.circuit)
+        self.assertIsNone(pm.property_set["time_budget_metrics"])
+
+    def test_sabre_layout_trials(self):
+        """Test that SabreLayout runs all its trials when the budget allows."""
+        pm = PassManager(
+            [
+                SetTimeBudget(600.0),
+                SabreLayout(self.backend.target, seed=3, layout_trials=6),
+                CheckTimeBudget(),
+            ]
+        )
+        pm.run(self.circuit)
+        metrics = pm.property_set["time_budget_metrics"]
+        self.assertEqual(metrics["sabre_layout_trials"], 6)
+        self.assertFalse(metrics["deadline_reached"])
+
+    def test_vf2_time_limit(self):
+        """Test that VF2Layout limits its search to a share of the remaining time."""
+        vf2 = VF2Layout(target=self.backend.target, seed=1, time_limit=1000.0)
+        vf2.property_set["time_budget_deadline"] = time.perf_counter() + 10.0
+        vf2.property_set["time_budget_metrics"] = {"time_budget": 10.0}
+        vf2.run(circuit_to_dag(self.circuit))
+        self.assertLess(vf2.property_set["time_budget_metrics"]["vf2_layout_time_limit"], 10.0)
+
+    def test_transpile_bypasses_cache(self):
+        """Test that transpile with a time budget does not use the cache."""
+        cache = TranspileCache()
+        out = transpile(
+            self.circuit, self.backend, seed_transpiler=1, time_budget=600.0, cache=cache
+        )
+        self.assertTrue(Operator.from_circuit(out).equiv(Operator(self.circuit)))
+        self.assertEqual(cache.statistics().bypassed, 1)
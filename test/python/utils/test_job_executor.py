@@ -0,0 +1,165 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the shared job executor."""
+
+import asyncio
+import threading
+
+from qiskit import QuantumCircuit
+from qiskit.exceptions import QiskitError
+from qiskit.primitives import StatevectorSampler
+from qiskit.providers import JobStatus
+from qiskit.providers.basic_provider import BasicSimulator
+from qiskit.utils import JobExecutor, get_job_executor, set_job_executor
+from test import QiskitTestCase  # pylint: disable=wrong-import-order
+
+
+class TestJobExecutor(QiskitTestCase):
+    """Tests for JobExecutor."""
+
+    def setUp(self):
+        super().setUp()
+        self.executor = JobExecutor(max_workers=2, max_queue_size=1, block=False)
+        self.addCleanup(self.executor.shutdown)
+
+    def test_concurrency_limit_and_queue(self):
+        """Test that at most max_workers tasks run, and at most max_queue_size tasks wait."""
+        release = threading.Event()
+        started = threading.Semaphore(0)
+
+        def task(value):
+            started.release()
+            release.wait()
+            return value
+
+        futures = [self.executor.submit(task, i) for i in range(2)]
+        for _ in range(2):
+            self.assertTrue(started.acquire(timeout=10))  # pylint: disable=consider-using-with
+        futures.append(self.executor.submit(task, 2))
+        stats = self.executor.statistics()
+        self.assertEqual(stats.running, 2)
+        self.assertEqual(stats.queue_depth, 1)
+        with self.assertRaisesRegex(QiskitError, "queue is full"):
+            self.executor.submit(task, 3)
+        release.set()
+        self.assertEqual([future.result() for future in futures], [0, 1, 2])
+
+        # Slots are freed once tasks are done.
+        self.assertEqual(self.executor.submit(task, 4).result(), 4)
+        stats = self.executor.statistics()
+        self.assertEqual(stats.submitted, 4)
+        self.assertEqual(stats.rejected, 1)
+        self.assertEqual(stats.completed, 4)
+        self.assertEqual(stats.running, 0)
+        self.assertEqual(stats.queue_depth, 0)
+        self.assertEqual(stats.max_queue_depth, 1)
+        self.assertGreater(stats.max_queue_latency, 0)
+        self.assertGreaterEqual(stats.max_queue_latency, stats.mean_queue_latency)
+
+    def test_cancel_queued(self):
+        """Test that cancelling a queued task frees its slot."""
+        release = threading.Event()
+        futures = [self.executor.submit(release.wait) for _ in range(3)]
+        self.assertTrue(futures[2].cancel())
+        self.assertEqual(self.executor.statistics().queue_depth, 0)
+        future = self.executor.submit(release.wait)
+        release.set()
+        self.assertTrue(future.result())
+
+    def test_exception(self):
+        """Test that exceptions propagate through the future."""
+
+        def task():
+            raise ValueError("boom")
+
+        with self.assertRaisesRegex(ValueError, "boom"):
+            self.executor.submit(task).result()
+        self.assertEqual(self.executor.statistics().completed, 1)
+
+    def test_invalid_arguments(self):
+        """Test invalid constructor arguments."""
+        with self.assertRaises(ValueError):
+            JobExecutor(max_workers=0)
+        with self.assertRaises(ValueError):
+            JobExecutor(max_queue_size=-1)
+
+
+class TestSharedJobExecutor(QiskitTestCase):
+    """Tests for jobs opting into the shared job executor."""
+
+    def setUp(self):
+        super().setUp()
+        self.executor = JobExecutor(max_workers=2)
+        self.addCleanup(self.executor.shutdown)
+        previous = set_job_executor(self.executor)
+        self.addCleanup(set_job_executor, previous)
+
+    def test_get_job_executor(self):
+        """Test that the shared executor is set."""
+        self.assertIs(get_job_executor(), self.executor)
+
+    def test_primitive_job(self):
+        """Test that primitive jobs run on the shared executor."""
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.measure_all()
+        jobs = [StatevectorSampler(seed=1).run([qc], shots=100) for _ in range(5)]
+        counts = [job.result()[0].data.meas.get_counts() for job in jobs]
+        self.assertTrue(all(count == counts[0] for count in counts))
+        self.assertEqual(self.executor.statistics().completed, 5)
+
+    def test_basic_provider_job(self):
+        """Test that BasicSimulator jobs run on the shared executor."""
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.measure_all()
+        backend = BasicSimulator()
+        target = backend.run(qc, shots=100, seed_simulator=7)
+        jobs = [backend.run(qc, shots=100, seed_simulator=7) for _ in range(4)]
+        for job in jobs:
+            self.assertEqual(job.result().get_counts(), target.result().get_counts())
+            self.assertEqual(job.status(), JobStatus.DONE)
+        self.assertEqual(self.executor.statistics().completed, 5)
+
+    def test_basic_provider_jobs_of_instances_overlap(self):
+        """Test that only the jobs of the same BasicSimulator instance are serialized."""
+        qc = QuantumCircuit(1)
+        qc.x(0)
+        qc.measure_all()
+        busy, free = BasicSimulator(), BasicSimulator()
+        with busy._run_lock:
+            blocked = busy.run(qc, shots=10)
+            result = free.run(qc, shots=10).result(timeout=60)
+            self.assertFalse(blocked.in_final_state())
+        self.assertEqual(result.get_counts(), {"1": 10})
+        self.assertEqual(blocked.result().get_counts(), {"1": 10})
+
+    def test_basic_provider_job_async(self):
+        """Test awaiting BasicSimulator jobs, with and without the shared executor."""
+        qc = QuantumCircuit(1)
+        qc.x(0)
+        qc.measure_all()
+        backend = BasicSimulator()
+
+        async def main():
+            queued = backend.run(qc, shots=10)
+            result = await queued
+            set_job_executor(None)
+            synchronous = backend.run(qc, shots=10)
+            return result, await synchronous.result_async()
+
+        results = asyncio.run(main())
+        for result in results:
+            self.assertEqual(result.get_counts(), {"1": 10})
@@ -19,6 +19,7 @@ import time
 from unittest import mock
 
 from qiskit.utils import local_hardware_info, should_run_in_parallel, parallel_map
+from qiskit.utils.parallel import _forbid_nested_parallelism
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
 
@@ -103,6 +104,26 @@ class TestUtilities(QiskitTestCase):
             self.assertFalse(should_run_in_parallel(8))
         self.assertEqual(should_run_in_parallel(8), natural)
 
+    def test_forbid_nested_parallelism_overlapping(self):
+        """Test that overlapping contexts, as entered by several threads, restore the environment
+        only when the last one exits, whatever the order they exit in."""
+        with mock.patch.dict(os.environ, {"QISKIT_IN_PARALLEL": "FALSE"}):
+            first = _forbid_nested_parallelism()
+            second = _forbid_nested_parallelism()
+            first.__enter__()  # pylint: disable=unnecessary-dunder-call
+            second.__enter__()  # pylint: disable=unnecessary-dunder-call
+            self.assertFalse(should_run_in_parallel(8))
+            first.__exit__(None, None, None)
+            self.assertEqual(os.environ["QISKIT_IN_PARALLEL"], "TRUE")
+            self.assertFalse(should_run_in_parallel(8))
+            second.__exit__(None, None, None)
+            self.assertEqual(os.environ["QISKIT_IN_PARALLEL"], "FALSE")
+        with mock.patch.dict(os.environ):
+            os.environ.pop("QISKIT_IN_PARALLEL", None)
+            with _forbid_nested_parallelism():
+                self.assertEqual(os.environ["QISKIT_IN_PARALLEL"], "TRUE")
+            self.assertNotIn("QISKIT_IN_PARALLEL", os.environ)
+
     def test_should_run_in_parallel_ignore_user_settings(self):
         """Test that the context managers allow overriding the user settings."""
         # This is a nasty one, because much of the user settings are read statically at `import